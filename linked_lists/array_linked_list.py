@@ -0,0 +1,620 @@
+from __future__ import annotations
+import sys
+from array import array
+from typing import Callable, Iterable, Iterator, Self
+
+from linked_list import DNode, LinkedList, Node
+
+NIL = -1
+
+
+class ArrayNode:
+    __slots__ = ("linked_list", "slot")
+
+    def __init__(self: Self, linked_list: ArrayLinkedList, slot: int) -> None:
+        self.linked_list: ArrayLinkedList = linked_list
+        self.slot: int = slot
+
+    @property
+    def data(self: Self) -> object:
+        return self.linked_list.payloads[self.slot]
+
+    @data.setter
+    def data(self: Self, value: object) -> None:
+        self.linked_list.payloads[self.slot] = value
+
+    @property
+    def next(self: Self) -> ArrayNode | None:
+        return self.linked_list.handle(self.linked_list.next_slots[self.slot])
+
+    def __str__(self: Self):
+        return str(f"{type(self).__name__}({self.data})")
+
+    def __lt__(self: Self, other: ArrayNode | Node) -> bool:
+        return self.data < other.data
+
+    def __gt__(self: Self, other: ArrayNode | Node) -> bool:
+        return self.data > other.data
+
+    def __eq__(self: Self, other: ArrayNode | Node) -> bool:
+        return self.data == other.data
+
+    def __le__(self: Self, other: ArrayNode | Node) -> bool:
+        return self.data <= other.data
+
+    def __ge__(self: Self, other: ArrayNode | Node) -> bool:
+        return self.data >= other.data
+
+    def __ne__(self: Self, other: ArrayNode | Node) -> bool:
+        return self.data != other.data
+
+
+class ArrayDNode(ArrayNode):
+    __slots__ = ()
+
+    @property
+    def prev(self: Self) -> ArrayDNode | None:
+        return self.linked_list.handle(self.linked_list.prev_slots[self.slot])
+
+
+class ArrayLinkedList:
+    node_type = ArrayNode
+    links = ("next_slots",)
+
+    def __init__(self: Self, elements: Iterable = None, capacity: int = 16) -> None:
+        self.size: int = 0
+        self.head_slot: int = NIL
+        self.tail_slot: int = NIL
+        self.free_slot: int = NIL
+        self.used: int = 0
+        self.payloads: list = []
+        self.next_slots: array = array("q")
+        self.reserve(capacity)
+        if elements:
+            for data in self.source_values(elements):
+                self.append(data)
+
+    @property
+    def head(self: Self) -> ArrayNode | None:
+        return self.handle(self.head_slot)
+
+    @property
+    def tail(self: Self) -> ArrayNode | None:
+        return self.handle(self.tail_slot)
+
+    @property
+    def capacity(self: Self) -> int:
+        return len(self.payloads)
+
+    def __len__(self: Self) -> int:
+        return self.size
+
+    def __getitem__(self: Self, key: int | slice) -> Self | ArrayNode:
+        if isinstance(key, slice):
+            indices = range(*key.indices(len(self)))
+            ordered = indices if indices.step > 0 else indices[::-1]
+            values = [self.payloads[slot] for slot in self.walk_slots(ordered)]
+            if indices.step < 0:
+                values.reverse()
+            return type(self)(values, len(values))
+
+        elif isinstance(key, int):
+            return self.get(key)
+
+        else:
+            raise TypeError("invalid argument type")
+
+    def __setitem__(self: Self, key: int | slice, value: object | Iterable) -> None:
+        if isinstance(key, slice):
+            if not isinstance(value, Iterable):
+                raise TypeError(
+                    "invalid argument type, slice assignment only accepts iterables"
+                )
+            indices = range(*key.indices(len(self)))
+            if indices.step == 1:
+                if len(indices) > 0:
+                    self.decouple(indices.start, indices.stop)
+                self.couple(value, indices.start)
+                return
+            values = list(self.source_values(value))
+            if len(values) != len(indices):
+                raise ValueError(
+                    f"attempt to assign sequence of size {len(values)} to extended slice of size {len(indices)}"
+                )
+            if indices.step < 0:
+                indices, values = indices[::-1], values[::-1]
+            for slot, data in zip(self.walk_slots(indices), values):
+                self.payloads[slot] = data
+
+        elif isinstance(key, int):
+            self.get(key).data = (
+                value.data if isinstance(value, (Node, ArrayNode)) else value
+            )
+
+        else:
+            raise TypeError("invalid argument type")
+
+    def __delitem__(self: Self, key: int | slice) -> None:
+        if isinstance(key, slice):
+            indices = range(*key.indices(len(self)))
+            if len(indices) <= 0:
+                return
+            if indices.step == 1:
+                self.decouple(indices.start, indices.stop)
+                return
+            if indices.step < 0:
+                indices = indices[::-1]
+            prev, slot, i = NIL, self.head_slot, 0
+            for position in indices:
+                for _ in range(position - i):
+                    prev, slot = slot, self.next_slots[slot]
+                next = self.next_slots[slot]
+                self.release(slot)
+                self.link(prev, next)
+                slot, i = next, position + 1
+            self.size -= len(indices)
+
+        elif isinstance(key, int):
+            self.pop(key)
+
+        else:
+            raise TypeError("invalid argument type")
+
+    def __iter__(self: Self) -> Iterator[ArrayNode]:
+        slot = self.head_slot
+        while slot != NIL:
+            yield self.node_type(self, slot)
+            slot = self.next_slots[slot]
+
+    def __str__(self: Self) -> str:
+        return f"{type(self).__name__}{tuple(self.to_list())}"
+
+    def __contains__(self: Self, data: object) -> bool:
+        for value in self.values():
+            if value is data or value == data:
+                return True
+        return False
+
+    def __add__(self: Self, item: Iterable) -> Self:
+        return self.copy().join(item)
+
+    def __mul__(self: Self, value: int) -> Self:
+        return type(self)(self.to_list() * value)
+
+    def __lt__(self: Self, other: Iterable) -> bool:
+        return self.to_list() < list(self.source_values(other))
+
+    def __gt__(self: Self, other: Iterable) -> bool:
+        return self.to_list() > list(self.source_values(other))
+
+    def __eq__(self: Self, other: Iterable) -> bool:
+        return self.to_list() == list(self.source_values(other))
+
+    def __le__(self: Self, other: Iterable) -> bool:
+        return not self.__gt__(other)
+
+    def __ge__(self: Self, other: Iterable) -> bool:
+        return not self.__lt__(other)
+
+    def __ne__(self: Self, other: Iterable) -> bool:
+        return not self.__eq__(other)
+
+    def handle(self: Self, slot: int) -> ArrayNode | None:
+        return None if slot == NIL else self.node_type(self, slot)
+
+    def source_values(self: Self, iterable: Iterable) -> Iterable:
+        if iterable is self:
+            return self.to_list()
+        if isinstance(iterable, LinkedList):
+            return iterable.values()
+        if isinstance(iterable, ArrayLinkedList):
+            return (node.data for node in iterable)
+        return iterable
+
+    def link_arrays(self: Self) -> tuple[array, ...]:
+        return tuple(getattr(self, name) for name in self.links)
+
+    def allocate(self: Self, data: object) -> int:
+        if self.free_slot != NIL:
+            slot = self.free_slot
+            self.free_slot = self.next_slots[slot]
+        else:
+            if self.used == len(self.payloads):
+                self.reserve(max(16, 2 * len(self.payloads)))
+            slot = self.used
+            self.used += 1
+        self.payloads[slot] = data
+        for links in self.link_arrays():
+            links[slot] = NIL
+        return slot
+
+    def release(self: Self, slot: int) -> object:
+        data = self.payloads[slot]
+        self.payloads[slot] = None
+        self.next_slots[slot] = self.free_slot
+        self.free_slot = slot
+        return data
+
+    def link(self: Self, prev: int, next: int) -> None:
+        if prev == NIL:
+            self.head_slot = next
+        else:
+            self.next_slots[prev] = next
+        if next == NIL:
+            self.tail_slot = prev
+
+    def slot_at(self: Self, index: int) -> int:
+        slot = self.head_slot
+        for _ in range(index):
+            slot = self.next_slots[slot]
+        return slot
+
+    def walk_slots(self: Self, positions: Iterable[int]) -> Iterator[int]:
+        slot, i = self.head_slot, 0
+        for position in positions:
+            for _ in range(position - i):
+                slot = self.next_slots[slot]
+            i = position
+            yield slot
+
+    def reserve(self: Self, capacity: int) -> None:
+        extra = capacity - len(self.payloads)
+        if extra <= 0:
+            return
+        self.payloads.extend([None] * extra)
+        for links in self.link_arrays():
+            links.extend(array("q", [NIL]) * extra)
+
+    def get(self: Self, index: int) -> ArrayNode:
+        index += len(self) if index < 0 else 0
+        if 0 <= index < len(self):
+            return self.node_type(self, self.slot_at(index))
+        raise IndexError("linked list index out of range")
+
+    def insert(self: Self, data: object, position: int = None) -> None:
+        if position is None:
+            return self.append(data)
+        position += self.size if position < 0 else 0
+        if position == len(self):
+            return self.append(data)
+        if position < 0 or position > len(self):
+            raise IndexError("linked list index out of range")
+        slot = self.allocate(data)
+        if position == 0:
+            self.next_slots[slot] = self.head_slot
+            self.head_slot = slot
+        else:
+            prev = self.slot_at(position - 1)
+            self.next_slots[slot] = self.next_slots[prev]
+            self.next_slots[prev] = slot
+        self.size += 1
+
+    def append(self: Self, data: object) -> None:
+        slot = self.allocate(data)
+        if self.tail_slot == NIL:
+            self.head_slot = slot
+        else:
+            self.next_slots[self.tail_slot] = slot
+        self.tail_slot = slot
+        self.size += 1
+
+    def extend(self: Self, iterable: Iterable) -> None:
+        self.join(iterable)
+
+    def join(self: Self, linked_list: Iterable) -> Self:
+        for data in self.source_values(linked_list):
+            self.append(data)
+        return self
+
+    def couple(self: Self, linked_list: Iterable, position: int) -> Self:
+        position += len(self) if position < 0 else 0
+        if position < 0 or position > len(self):
+            raise IndexError("linked list index out of range")
+        if position == len(self):
+            return self.join(linked_list)
+        prev = NIL if position == 0 else self.slot_at(position - 1)
+        for data in self.source_values(linked_list):
+            slot = self.allocate(data)
+            if prev == NIL:
+                self.next_slots[slot] = self.head_slot
+                self.head_slot = slot
+            else:
+                self.next_slots[slot] = self.next_slots[prev]
+                self.next_slots[prev] = slot
+            prev = slot
+            self.size += 1
+        return self
+
+    def pop(self: Self, position: int = None) -> Node:
+        if position is None:
+            if len(self) <= 0:
+                raise TypeError("linked list is empty")
+            position = len(self) - 1
+        position += len(self) if position < 0 else 0
+        if position < 0 or position >= len(self):
+            raise IndexError("linked list index out of range")
+        if position == 0:
+            slot = self.head_slot
+            self.head_slot = self.next_slots[slot]
+            if self.head_slot == NIL:
+                self.tail_slot = NIL
+        else:
+            prev = self.slot_at(position - 1)
+            slot = self.next_slots[prev]
+            self.next_slots[prev] = self.next_slots[slot]
+            if slot == self.tail_slot:
+                self.tail_slot = prev
+        self.size -= 1
+        return Node(self.release(slot))
+
+    def decouple(self: Self, start: int = 0, stop: int = None) -> Self:
+        if stop is None:
+            stop = len(self)
+        start += len(self) if start < 0 else 0
+        stop += len(self) if stop < 0 else 0
+        if start < 0 or stop < 0 or start >= len(self) or stop > len(self):
+            raise IndexError("index out of range")
+        if start > stop:
+            start, stop = stop, start
+        prev = NIL if start == 0 else self.slot_at(start - 1)
+        slot = self.head_slot if prev == NIL else self.next_slots[prev]
+        for _ in range(stop - start):
+            next = self.next_slots[slot]
+            self.release(slot)
+            slot = next
+        self.link(prev, slot)
+        self.size -= stop - start
+        return self
+
+    def index(
+        self: Self,
+        data: object | tuple,
+        start=0,
+        stop=None,
+        step=1,
+        skip=0,
+        nindices=None,
+        return_all=False,
+    ):
+        if step <= 0:
+            raise ValueError("negative steps are currently not supported")
+        start += len(self) if start < 0 else 0
+        start = 0 if start < 0 else start
+        if nindices is None:
+            nindices = len(self) if return_all else 1
+        if stop is None:
+            stop = len(self)
+        if len(self) <= 0 or nindices <= 0:
+            return None
+        if not isinstance(data, tuple):
+            data = [data]
+        indices = []
+        step_count = 0
+        for i, value in enumerate(self.to_list()):
+            if stop <= 0 or nindices <= 0:
+                break
+            if start <= 0 and value in data:
+                if skip <= 0:
+                    if step_count % step == 0:
+                        indices.append(i)
+                        nindices -= 1
+                    step_count += 1
+                else:
+                    skip -= 1
+            start -= 1
+            stop -= 1
+        if len(indices) <= 0:
+            return None
+        return indices if nindices > 0 or len(indices) > 1 else indices[0]
+
+    def count(self: Self, data: object) -> int:
+        return sum(value is data or value == data for value in self.values())
+
+    def copy(self: Self) -> Self:
+        return type(self)(self.to_list(), len(self))
+
+    def values(self: Self) -> Iterator:
+        slot = self.head_slot
+        while slot != NIL:
+            yield self.payloads[slot]
+            slot = self.next_slots[slot]
+
+    def to_list(self: Self) -> list:
+        data, next = self.payloads, self.next_slots
+        values = []
+        slot = self.head_slot
+        while slot != NIL:
+            values.append(data[slot])
+            slot = next[slot]
+        return values
+
+    def to_tuple(self: Self) -> tuple:
+        return tuple(self.to_list())
+
+    def to_set(self: Self) -> set:
+        return set(self.to_list())
+
+    def sizeof(self: Self, deep: bool = False) -> int:
+        size = sys.getsizeof(self) + sys.getsizeof(vars(self))
+        size += sys.getsizeof(self.payloads)
+        size += sum(sys.getsizeof(links) for links in self.link_arrays())
+        if deep:
+            seen = set()
+            for data in self.to_list():
+                if id(data) not in seen:
+                    seen.add(id(data))
+                    size += sys.getsizeof(data)
+        return size
+
+    def node_sizeof(self: Self, deep: bool = False) -> float:
+        if len(self) <= 0:
+            return 0.0
+        overhead = sys.getsizeof(self) + sys.getsizeof(vars(self))
+        return (self.sizeof(deep) - overhead) / len(self)
+
+    def reverse(self: Self, start: int = 0, stop: int = None) -> None:
+        if stop is None:
+            stop = len(self)
+        start += len(self) if start < 0 else 0
+        stop += len(self) if stop < 0 else 0
+        if start < 0 or start > len(self) or stop < 0 or stop > len(self):
+            raise IndexError("linked list index out of range")
+        if stop - start < 2:
+            return
+        prev_starter = NIL if start == 0 else self.slot_at(start - 1)
+        starter = (
+            self.head_slot if prev_starter == NIL else self.next_slots[prev_starter]
+        )
+        prev, slot = NIL, starter
+        for _ in range(stop - start):
+            next = self.next_slots[slot]
+            self.next_slots[slot] = prev
+            prev, slot = slot, next
+        self.next_slots[starter] = slot
+        if prev_starter == NIL:
+            self.head_slot = prev
+        else:
+            self.next_slots[prev_starter] = prev
+        if slot == NIL:
+            self.tail_slot = starter
+
+    def sort(self: Self, key: Callable = None, reverse: bool = False) -> None:
+        slots = list(self.walk_slots(range(len(self))))
+        values = [self.payloads[slot] for slot in slots]
+        values.sort(key=key, reverse=reverse)
+        for slot, data in zip(slots, values):
+            self.payloads[slot] = data
+
+
+class ArrayDoublyLinkedList(ArrayLinkedList):
+    node_type = ArrayDNode
+    links = ("next_slots", "prev_slots")
+
+    def __init__(self: Self, elements: Iterable = None, capacity: int = 16) -> None:
+        self.prev_slots: array = array("q")
+        super().__init__(elements, capacity)
+
+    def __reversed__(self: Self) -> Iterator[ArrayDNode]:
+        slot = self.tail_slot
+        while slot != NIL:
+            yield self.node_type(self, slot)
+            slot = self.prev_slots[slot]
+
+    def values(self: Self, reverse: bool = False) -> Iterator:
+        if not reverse:
+            yield from super().values()
+            return
+        slot = self.tail_slot
+        while slot != NIL:
+            yield self.payloads[slot]
+            slot = self.prev_slots[slot]
+
+    def link(self: Self, prev: int, next: int) -> None:
+        super().link(prev, next)
+        if next != NIL:
+            self.prev_slots[next] = prev
+
+    def slot_at(self: Self, index: int) -> int:
+        if index <= len(self) // 2:
+            return super().slot_at(index)
+        slot = self.tail_slot
+        for _ in range(len(self) - 1 - index):
+            slot = self.prev_slots[slot]
+        return slot
+
+    def insert(self: Self, data: object, position: int = None) -> None:
+        if position is None:
+            return self.append(data)
+        position += self.size if position < 0 else 0
+        if position == len(self):
+            return self.append(data)
+        if position < 0 or position > len(self):
+            raise IndexError("linked list index out of range")
+        next = self.slot_at(position)
+        prev = self.prev_slots[next]
+        slot = self.allocate(data)
+        self.prev_slots[slot], self.next_slots[slot] = prev, next
+        self.prev_slots[next] = slot
+        if prev == NIL:
+            self.head_slot = slot
+        else:
+            self.next_slots[prev] = slot
+        self.size += 1
+
+    def append(self: Self, data: object) -> None:
+        slot = self.allocate(data)
+        self.prev_slots[slot] = self.tail_slot
+        if self.tail_slot == NIL:
+            self.head_slot = slot
+        else:
+            self.next_slots[self.tail_slot] = slot
+        self.tail_slot = slot
+        self.size += 1
+
+    def couple(self: Self, linked_list: Iterable, position: int) -> Self:
+        position += len(self) if position < 0 else 0
+        if position < 0 or position > len(self):
+            raise IndexError("linked list index out of range")
+        if position == len(self):
+            return self.join(linked_list)
+        next = self.slot_at(position)
+        prev = self.prev_slots[next]
+        for data in self.source_values(linked_list):
+            slot = self.allocate(data)
+            self.prev_slots[slot], self.next_slots[slot] = prev, next
+            if prev == NIL:
+                self.head_slot = slot
+            else:
+                self.next_slots[prev] = slot
+            prev = slot
+            self.size += 1
+        self.prev_slots[next] = prev
+        return self
+
+    def pop(self: Self, position: int = None) -> DNode:
+        if position is None:
+            if len(self) <= 0:
+                raise TypeError("linked list is empty")
+            position = len(self) - 1
+        position += len(self) if position < 0 else 0
+        if position < 0 or position >= len(self):
+            raise IndexError("linked list index out of range")
+        slot = self.slot_at(position)
+        prev, next = self.prev_slots[slot], self.next_slots[slot]
+        if prev == NIL:
+            self.head_slot = next
+        else:
+            self.next_slots[prev] = next
+        if next == NIL:
+            self.tail_slot = prev
+        else:
+            self.prev_slots[next] = prev
+        self.size -= 1
+        return DNode(self.release(slot))
+
+    def reverse(self: Self, start: int = 0, stop: int = None) -> None:
+        if stop is None:
+            stop = len(self)
+        start += len(self) if start < 0 else 0
+        stop += len(self) if stop < 0 else 0
+        if start < 0 or start > len(self) or stop < 0 or stop > len(self):
+            raise IndexError("linked list index out of range")
+        if stop - start < 2:
+            return
+        starter = self.slot_at(start)
+        prev_starter = self.prev_slots[starter]
+        prev, slot = NIL, starter
+        for _ in range(stop - start):
+            next = self.next_slots[slot]
+            self.next_slots[slot], self.prev_slots[slot] = prev, next
+            prev, slot = slot, next
+        self.next_slots[starter] = slot
+        self.prev_slots[prev] = prev_starter
+        if prev_starter == NIL:
+            self.head_slot = prev
+        else:
+            self.next_slots[prev_starter] = prev
+        if slot == NIL:
+            self.tail_slot = starter
+        else:
+            self.prev_slots[slot] = starter
@@ -0,0 +1,94 @@
+from __future__ import annotations
+import asyncio
+from collections import deque
+from typing import Callable, Iterable, Iterator, Self
+
+from linked_list import DoublyLinkedList
+
+
+class AsyncDeque:
+    def __init__(self: Self, elements: Iterable = None, maxsize: int = 0) -> None:
+        self.items: DoublyLinkedList = DoublyLinkedList(elements)
+        self.maxsize: int = maxsize
+        self.getters: deque[asyncio.Future] = deque()
+        self.putters: deque[asyncio.Future] = deque()
+
+    def __len__(self: Self) -> int:
+        return len(self.items)
+
+    def __iter__(self: Self) -> Iterator:
+        return self.items.values()
+
+    def __str__(self: Self) -> str:
+        return f"AsyncDeque{self.items.to_tuple()}"
+
+    def empty(self: Self) -> bool:
+        return self.items.size == 0
+
+    def full(self: Self) -> bool:
+        return 0 < self.maxsize <= self.items.size
+
+    @staticmethod
+    def wake(waiters: deque[asyncio.Future]) -> None:
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def wait(
+        self: Self, waiters: deque[asyncio.Future], blocked: Callable[[], bool]
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        while blocked():
+            waiter = loop.create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+                if not blocked() and not waiter.cancelled():
+                    self.wake(waiters)
+                raise
+
+    async def put(self: Self, data: object, left: bool = False) -> None:
+        if self.full():
+            await self.wait(self.putters, self.full)
+        self.put_nowait(data, left)
+
+    def put_nowait(self: Self, data: object, left: bool = False) -> None:
+        if self.full():
+            raise asyncio.QueueFull
+        if left:
+            self.items.insert(data, 0)
+        else:
+            self.items.append(data)
+        self.wake(self.getters)
+
+    async def get(self: Self, right: bool = False) -> object:
+        if self.empty():
+            await self.wait(self.getters, self.empty)
+        return self.get_nowait(right)
+
+    def get_nowait(self: Self, right: bool = False) -> object:
+        if self.empty():
+            raise asyncio.QueueEmpty
+        node = self.items.pop() if right else self.items.pop(0)
+        self.wake(self.putters)
+        return node.data
+
+    async def get_many(self: Self, count: int, right: bool = False) -> list:
+        if self.empty():
+            await self.wait(self.getters, self.empty)
+        values = []
+        for _ in range(min(count, len(self.items))):
+            node = self.items.pop() if right else self.items.pop(0)
+            values.append(node.data)
+            self.wake(self.putters)
+        if not self.empty():
+            self.wake(self.getters)
+        return values
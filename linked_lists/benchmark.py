@@ -0,0 +1,738 @@
+from __future__ import annotations
+import argparse
+import asyncio
+import io
+import json
+import math
+import pickle
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import deque
+from functools import lru_cache
+from itertools import cycle, islice
+from typing import Callable, Iterator
+
+from async_deque import AsyncDeque
+from cache import LFUCache, LRUCache, TTLCache, memoize
+from concurrent_linked_list import ConcurrentDoublyLinkedList, ConcurrentLinkedList
+from instrumented_linked_list import instrument
+from linked_list import (
+    CircularDoublyLinkedList,
+    CircularLinkedList,
+    DoublyLinkedList,
+    LinkedList,
+)
+from mapped_linked_list import MappedDoublyLinkedList
+from persistent_linked_list import CopyOnWriteLinkedList
+from skip_linked_list import SkipLinkedList
+
+
+def measure(function: Callable, repeat: int = 1) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(title: str, rows: list[tuple], header: tuple) -> None:
+    print(title)
+    print("  " + "".join(f"{column:>16}" for column in header))
+    for row in rows:
+        print(
+            "  "
+            + "".join(
+                f"{value:>16.3e}" if isinstance(value, float) else f"{value:>16}"
+                for value in row
+            )
+        )
+
+
+def bench_skip_list(sizes: tuple[int, ...], operations: int = 1000) -> None:
+    rows = []
+    for size in sizes:
+        rng = random.Random(size)
+        positions = [rng.randrange(size) for _ in range(operations)]
+        row = [size]
+        for type in (LinkedList, SkipLinkedList):
+            linked_list = type(range(size))
+
+            def operate() -> None:
+                for position in positions:
+                    linked_list.get(position)
+                    linked_list.insert(position, position)
+                    linked_list.pop(position)
+
+            row.append(measure(operate) / operations)
+        row.append(row[1] / row[2])
+        rows.append(tuple(row))
+    report(
+        "random get+insert+pop, seconds per round",
+        rows,
+        ("size", "LinkedList", "SkipLinkedList", "speedup"),
+    )
+
+
+def peak_memory(function: Callable) -> int:
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_sort(sizes: tuple[int, ...]) -> None:
+    rows = []
+    for size in sizes:
+        rng = random.Random(size)
+        values = [rng.random() for _ in range(size)]
+        for type in (
+            LinkedList,
+            CircularLinkedList,
+            DoublyLinkedList,
+            CircularDoublyLinkedList,
+        ):
+            linked_list = type(values)
+            in_place = measure(linked_list.sort)
+            linked_list = type(values)
+            rebuilt = measure(lambda: type(sorted(linked_list.to_list())))
+            linked_list = type(values)
+            in_place_peak = peak_memory(linked_list.sort)
+            linked_list = type(values)
+            rebuilt_peak = peak_memory(lambda: type(sorted(linked_list.to_list())))
+            rows.append(
+                (
+                    size,
+                    "".join(filter(str.isupper, type.__name__)),
+                    in_place,
+                    rebuilt,
+                    in_place_peak // 1024,
+                    rebuilt_peak // 1024,
+                )
+            )
+    report(
+        "random floats, ll.sort() vs type(sorted(ll.to_list()))",
+        rows,
+        ("size", "type", "sort s", "rebuild s", "sort KiB", "rebuild KiB"),
+    )
+
+
+THREADS = (1, 2, 4, 8)
+
+
+def run_threads(count: int, target: Callable[[int], None]) -> None:
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def gil_status() -> str:
+    enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    return "GIL enabled" if enabled else "free-threaded"
+
+
+def bench_concurrent(sizes: tuple[int, ...]) -> None:
+    rows = []
+    for size in sizes:
+        for threads in THREADS:
+            row = [size, threads]
+            for base, type in (
+                (LinkedList, ConcurrentLinkedList),
+                (DoublyLinkedList, ConcurrentDoublyLinkedList),
+            ):
+                global_lock = threading.Lock()
+                locked = base(range(1000))
+
+                def locked_operate(thread: int) -> None:
+                    for i in range(size):
+                        with global_lock:
+                            locked.append(i)
+                        with global_lock:
+                            if len(locked) > 0:
+                                locked.pop(0)
+
+                row.append(
+                    threads
+                    * size
+                    / measure(lambda: run_threads(threads, locked_operate))
+                )
+                linked_list = type(range(1000))
+
+                def operate(thread: int) -> None:
+                    for i in range(size):
+                        linked_list.append(i)
+                        try:
+                            linked_list.pop(0)
+                        except IndexError:
+                            pass
+
+                row.append(
+                    threads * size / measure(lambda: run_threads(threads, operate))
+                )
+            rows.append(tuple(row))
+    report(
+        f"append+pop(0) rounds per second ({gil_status()})",
+        rows,
+        (
+            "per thread",
+            "threads",
+            "LL+global lock",
+            "ConcurrentLL",
+            "DLL+global lock",
+            "ConcurrentDLL",
+        ),
+    )
+
+
+async def queue_latency(
+    queue: AsyncDeque | asyncio.Queue, size: int, batch: int = 1
+) -> list[float]:
+    latencies = []
+
+    async def produce() -> None:
+        for _ in range(size):
+            await queue.put(time.perf_counter())
+
+    async def consume() -> None:
+        while len(latencies) < size:
+            if batch > 1:
+                stamps = await queue.get_many(batch)
+            else:
+                stamps = [await queue.get()]
+            now = time.perf_counter()
+            latencies.extend(now - stamp for stamp in stamps)
+
+    await asyncio.gather(produce(), consume())
+    return sorted(latencies)
+
+
+def bench_async_deque(sizes: tuple[int, ...], maxsize: int = 64) -> None:
+    rows = []
+    for size in sizes:
+        for name, queue, batch in (
+            ("asyncio.Queue", lambda: asyncio.Queue(maxsize), 1),
+            ("AsyncDeque", lambda: AsyncDeque(maxsize=maxsize), 1),
+            ("get_many(16)", lambda: AsyncDeque(maxsize=maxsize), 16),
+        ):
+            start = time.perf_counter()
+            latencies = asyncio.run(queue_latency(queue(), size, batch))
+            elapsed = time.perf_counter() - start
+            rows.append(
+                (
+                    size,
+                    name,
+                    size / elapsed,
+                    sum(latencies) / size,
+                    latencies[int(size * 0.99) - 1],
+                )
+            )
+    report(
+        f"single producer/consumer, maxsize={maxsize}",
+        rows,
+        ("items", "queue", "items/s", "mean latency", "p99 latency"),
+    )
+
+
+def bench_cache(sizes: tuple[int, ...], calls: int = 100_000) -> None:
+    rows = []
+    for size in sizes:
+        rng = random.Random(size)
+        keys = [rng.randrange(size) for _ in range(calls)]
+        row = [size]
+        for decorate in (
+            lru_cache(maxsize=size),
+            memoize(maxsize=size),
+            memoize(maxsize=size, policy=LFUCache),
+            memoize(maxsize=size, policy=TTLCache, ttl=3600),
+        ):
+            function = decorate(lambda key: key)
+            for key in range(size):
+                function(key)
+
+            def call() -> None:
+                for key in keys:
+                    function(key)
+
+            row.append(measure(call, 3) / calls)
+        rows.append(tuple(row))
+    report(
+        "memoized hit path, seconds per call",
+        rows,
+        ("size", "lru_cache", "LRUCache", "LFUCache", "TTLCache"),
+    )
+
+
+def bench_persistent(sizes: tuple[int, ...], rounds: int = 100) -> None:
+    rows = []
+    for size in sizes:
+        values = list(range(size))
+
+        def snapshots(type: type, take: Callable) -> Callable:
+            def run() -> None:
+                linked_list, kept = type(values), []
+                for index in range(rounds):
+                    kept.append(take(linked_list))
+                    linked_list[0] = index
+
+            return run
+
+        copying = snapshots(LinkedList, LinkedList.copy)
+        sharing = snapshots(CopyOnWriteLinkedList, CopyOnWriteLinkedList.snapshot)
+        rows.append(
+            (
+                size,
+                measure(copying) / rounds,
+                measure(sharing) / rounds,
+                peak_memory(copying) // 1024,
+                peak_memory(sharing) // 1024,
+            )
+        )
+    report(
+        f"{rounds} rounds of snapshot + head write, all snapshots kept alive",
+        rows,
+        ("size", "copy() s", "snapshot() s", "copy() KiB", "snapshot() KiB"),
+    )
+
+
+def bench_serialize(sizes: tuple[int, ...]) -> None:
+    rows = []
+    for size in sizes:
+        rng = random.Random(size)
+        linked_list = DoublyLinkedList(rng.random() for _ in range(size))
+        for name, dump, load in (
+            (
+                "pickle",
+                lambda file: pickle.dump(linked_list, file, pickle.HIGHEST_PROTOCOL),
+                pickle.load,
+            ),
+            ("dump", linked_list.dump, DoublyLinkedList.load),
+            (
+                "dump 'd'",
+                lambda file: linked_list.dump(file, "d"),
+                DoublyLinkedList.load,
+            ),
+        ):
+            file = io.BytesIO()
+            written = measure(lambda: dump(io.BytesIO()), 3)
+            dump(file)
+
+            def read() -> None:
+                file.seek(0)
+                load(file)
+
+            rows.append(
+                (size, name, written, measure(read, 3), len(file.getvalue()) // 1024)
+            )
+    report(
+        "DoublyLinkedList of random floats, in-memory round trip",
+        rows,
+        ("size", "format", "dump s", "load s", "KiB"),
+    )
+
+
+def bench_mapped(
+    sizes: tuple[int, ...], cache_size: int = 1024, lookups: int = 100
+) -> None:
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            rng = random.Random(size)
+            path = f"{directory}/{size}.llmap"
+            values = [f"payload-{index:012d}" for index in range(size)]
+            build = measure(
+                lambda: MappedDoublyLinkedList(values, size, path, cache_size).close()
+            )
+            opened = measure(lambda: MappedDoublyLinkedList(path=path).close(), 3)
+            with MappedDoublyLinkedList(path=path, cache_size=cache_size) as mapped:
+                sequential = measure(mapped.to_list)
+                positions = [rng.randrange(size) for _ in range(lookups)]
+
+                def lookup() -> None:
+                    for position in positions:
+                        mapped.get(position).data
+
+                def churn() -> None:
+                    for index in range(lookups):
+                        mapped.append(index)
+                        mapped.pop()
+
+                random_access = measure(lookup)
+                ends = measure(churn)
+            rows.append(
+                (
+                    size,
+                    build / size,
+                    opened,
+                    sequential / size,
+                    random_access / lookups,
+                    ends / lookups,
+                )
+            )
+    report(
+        f"MappedDoublyLinkedList with a {cache_size}-entry hot cache, seconds",
+        rows,
+        ("size", "build/node", "reopen", "scan/node", "get(i)", "append+pop"),
+    )
+
+
+def bench_instrumentation(sizes: tuple[int, ...], operations: int = 10_000) -> None:
+    rows = []
+    for size in sizes:
+        row = [size]
+        for enabled in (False, True):
+            linked_list = DoublyLinkedList(range(size))
+            if enabled:
+                instrument(linked_list)
+
+            def operate() -> None:
+                for index in range(operations):
+                    linked_list.append(index)
+                    linked_list.pop(0)
+                    linked_list.get(index % size)
+
+            row.append(measure(operate, 3) / operations)
+        row.append(row[2] / row[1])
+        rows.append(tuple(row))
+    report(
+        "DoublyLinkedList append+pop(0)+get, seconds per round",
+        rows,
+        ("size", "plain", "instrumented", "overhead"),
+    )
+
+
+def bench_batch(sizes: tuple[int, ...], batch: int = 100) -> None:
+    rows = []
+    for size in sizes:
+        rng = random.Random(size)
+        values = list(range(size))
+        positions = rng.sample(range(size), min(batch, size))
+        descending = sorted(positions, reverse=True)
+        removed = set(positions)
+
+        def timed(operation: Callable) -> float:
+            linked_list = LinkedList(values)
+            start = time.perf_counter()
+            operation(linked_list)
+            return time.perf_counter() - start
+
+        def insert_loop(linked_list: LinkedList) -> None:
+            for position in descending:
+                linked_list.insert(-1, position)
+
+        def pop_loop(linked_list: LinkedList) -> None:
+            for position in descending:
+                linked_list.pop(position)
+
+        for name, looped, batched in (
+            (
+                "insert",
+                insert_loop,
+                lambda linked_list: linked_list.insert_many(
+                    (-1, position) for position in positions
+                ),
+            ),
+            ("pop", pop_loop, lambda linked_list: linked_list.pop_many(positions)),
+            (
+                "remove",
+                pop_loop,
+                lambda linked_list: linked_list.remove_if(removed.__contains__),
+            ),
+        ):
+            loop, single = timed(looped), timed(batched)
+            rows.append((size, name, loop, single, loop / single))
+    report(
+        f"LinkedList, {batch} random positions: per-call loop vs one batch pass",
+        rows,
+        ("size", "operation", "loop s", "batch s", "speedup"),
+    )
+
+
+def bench_pipeline(sizes: tuple[int, ...]) -> None:
+    rows = []
+    for size in sizes:
+        linked_list = LinkedList(range(size))
+        count = size // 4
+
+        def eager() -> LinkedList:
+            tripled = LinkedList(node.data * 3 for node in linked_list)
+            odd = LinkedList(node.data for node in tripled if node.data % 2)
+            shifted = LinkedList(node.data + 1 for node in odd)
+            return shifted[10 : 10 + count]
+
+        def lazy() -> LinkedList:
+            return (
+                linked_list.lazy()
+                .map(lambda data: data * 3)
+                .filter(lambda data: data % 2)
+                .map(lambda data: data + 1)
+                .skip(10)
+                .take(count)
+                .collect()
+            )
+
+        assert eager() == lazy()
+        rows.append(
+            (
+                size,
+                measure(eager, 3),
+                measure(lazy, 3),
+                peak_memory(eager) // 1024,
+                peak_memory(lazy) // 1024,
+            )
+        )
+    report(
+        "map -> filter -> map -> skip -> take into a LinkedList",
+        rows,
+        ("size", "eager s", "lazy s", "eager KiB", "lazy KiB"),
+    )
+
+
+SUITE_CHUNK = 16
+SUITE_SLACK = 0.5
+SUITE_REGRESSION = 1.5
+SUITE_SEED = 0
+SUITE_POSITIONS = 1_024
+
+
+@lru_cache(maxsize=None)
+def suite_positions(size: int) -> Iterator[int]:
+    rng = random.Random(SUITE_SEED)
+    return cycle([rng.randrange(size) for _ in range(SUITE_POSITIONS)])
+
+
+@lru_cache(maxsize=None)
+def suite_shuffled(size: int) -> tuple[int, ...]:
+    values = list(range(size))
+    random.Random(SUITE_SEED).shuffle(values)
+    return tuple(values)
+
+
+COMPLEXITY = {
+    "get": 1,
+    "setitem": 1,
+    "slice": 1,
+    "insert+pop head": 0,
+    "insert+pop middle": 1,
+    "append+pop tail": 1,
+    "join+decouple tail": 1,
+    "couple+decouple middle": 1,
+    "index": 1,
+    "contains": 1,
+    "count": 1,
+    "reverse": 1,
+    "sort": 1,
+    "copy": 1,
+    "to_list": 1,
+    "to_tuple": 1,
+    "to_set": 1,
+}
+DOUBLY_COMPLEXITY = {**COMPLEXITY, "append+pop tail": 0, "join+decouple tail": 0}
+
+LINKED_LIST_CASES = {
+    "get": lambda ll, size: ll.get(next(suite_positions(size))),
+    "setitem": lambda ll, size: ll.__setitem__(next(suite_positions(size)), 0),
+    "slice": lambda ll, size: ll[size // 4 : 3 * size // 4],
+    "insert+pop head": lambda ll, size: (ll.insert(-1, 0), ll.pop(0)),
+    "insert+pop middle": lambda ll, size: (
+        ll.insert(-1, position := next(suite_positions(size))),
+        ll.pop(position),
+    ),
+    "append+pop tail": lambda ll, size: (ll.append(-1), ll.pop()),
+    "join+decouple tail": lambda ll, size: (
+        ll.join(type(ll)(range(SUITE_CHUNK))),
+        ll.decouple(size),
+    ),
+    "couple+decouple middle": lambda ll, size: (
+        ll.couple(type(ll)(range(SUITE_CHUNK)), size // 2),
+        ll.decouple(size // 2, size // 2 + SUITE_CHUNK),
+    ),
+    "index": lambda ll, size: ll.index(size - 1),
+    "contains": lambda ll, size: size - 1 in ll,
+    "count": lambda ll, size: ll.count(size - 1),
+    "reverse": lambda ll, size: ll.reverse(),
+    "sort": lambda ll, size: (
+        ll.__setitem__(slice(None), suite_shuffled(size)),
+        ll.sort(),
+    ),
+    "copy": lambda ll, size: ll.copy(),
+    "to_list": lambda ll, size: ll.to_list(),
+    "to_tuple": lambda ll, size: ll.to_tuple(),
+    "to_set": lambda ll, size: ll.to_set(),
+}
+
+LIST_CASES = {
+    "get": lambda values, size: values[next(suite_positions(size))],
+    "setitem": lambda values, size: values.__setitem__(next(suite_positions(size)), 0),
+    "slice": lambda values, size: values[size // 4 : 3 * size // 4],
+    "insert+pop head": lambda values, size: (values.insert(0, -1), values.pop(0)),
+    "insert+pop middle": lambda values, size: (
+        values.insert(position := next(suite_positions(size)), -1),
+        values.pop(position),
+    ),
+    "append+pop tail": lambda values, size: (values.append(-1), values.pop()),
+    "join+decouple tail": lambda values, size: (
+        values.extend(list(range(SUITE_CHUNK))),
+        values.__delitem__(slice(size, None)),
+    ),
+    "couple+decouple middle": lambda values, size: (
+        values.__setitem__(slice(size // 2, size // 2), list(range(SUITE_CHUNK))),
+        values.__delitem__(slice(size // 2, size // 2 + SUITE_CHUNK)),
+    ),
+    "index": lambda values, size: values.index(size - 1),
+    "contains": lambda values, size: size - 1 in values,
+    "count": lambda values, size: values.count(size - 1),
+    "reverse": lambda values, size: values.reverse(),
+    "sort": lambda values, size: (
+        values.__setitem__(slice(None), suite_shuffled(size)),
+        values.sort(),
+    ),
+    "copy": lambda values, size: values.copy(),
+    "to_list": lambda values, size: list(values),
+    "to_tuple": lambda values, size: tuple(values),
+    "to_set": lambda values, size: set(values),
+}
+
+DEQUE_CASES = {
+    **LIST_CASES,
+    "slice": lambda values, size: deque(islice(values, size // 4, 3 * size // 4)),
+    "insert+pop head": lambda values, size: (
+        values.appendleft(-1),
+        values.popleft(),
+    ),
+    "insert+pop middle": lambda values, size: (
+        values.insert(position := next(suite_positions(size)), -1),
+        values.__delitem__(position),
+    ),
+    "join+decouple tail": lambda values, size: (
+        values.extend(range(SUITE_CHUNK)),
+        [values.pop() for _ in range(SUITE_CHUNK)],
+    ),
+    "couple+decouple middle": None,
+    "sort": None,
+}
+
+
+def scaling_exponent(sizes: tuple[int, ...], times: list[float]) -> float:
+    if len(sizes) < 2:
+        return math.nan
+    xs, ys = [math.log(size) for size in sizes], [math.log(time) for time in times]
+    x_mean, y_mean = sum(xs) / len(xs), sum(ys) / len(ys)
+    covariance = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
+    return covariance / sum((x - x_mean) ** 2 for x in xs)
+
+
+def time_case(type: type, case: Callable, size: int, exponent: int | None) -> float:
+    container = type(range(size))
+    loops = 1_000 if exponent == 0 else max(3, 100_000 // size)
+
+    def run() -> None:
+        for _ in range(loops):
+            case(container, size)
+
+    return statistics.median(measure(run) for _ in range(5)) / loops
+
+
+def bench_suite(
+    sizes: tuple[int, ...], baseline: str = None, save: str = None
+) -> list[str]:
+    results, failures = {}, []
+    previous = {}
+    if baseline is not None:
+        with open(baseline) as file:
+            previous = json.load(file)
+    for type, cases, documented in (
+        (LinkedList, LINKED_LIST_CASES, COMPLEXITY),
+        (CircularLinkedList, LINKED_LIST_CASES, COMPLEXITY),
+        (DoublyLinkedList, LINKED_LIST_CASES, DOUBLY_COMPLEXITY),
+        (CircularDoublyLinkedList, LINKED_LIST_CASES, DOUBLY_COMPLEXITY),
+        (list, LIST_CASES, None),
+        (deque, DEQUE_CASES, None),
+    ):
+        name, rows = type.__name__, []
+        results[name] = {}
+        for operation, case in cases.items():
+            if case is None:
+                continue
+            expected = None if documented is None else documented[operation]
+            times = [time_case(type, case, size, expected) for size in sizes]
+            results[name][operation] = dict(zip(map(str, sizes), times))
+            exponent = scaling_exponent(sizes, times)
+            if expected is not None and exponent > expected + SUITE_SLACK:
+                failures.append(
+                    f"{name}.{operation}: scales as n^{exponent:.2f}, documented O(n^{expected})"
+                )
+            for size, time in zip(sizes, times):
+                before = previous.get(name, {}).get(operation, {}).get(str(size))
+                if before is not None and time > before * SUITE_REGRESSION:
+                    failures.append(
+                        f"{name}.{operation} at {size}: {time:.3e}s, baseline {before:.3e}s"
+                    )
+            rows.append(
+                (
+                    operation,
+                    *times,
+                    f"{exponent:.2f}",
+                    "-" if expected is None else f"n^{expected}",
+                )
+            )
+        report(
+            f"{name}, seconds per operation",
+            rows,
+            ("operation", *sizes, "exponent", "documented"),
+        )
+    if save is not None:
+        with open(save, "w") as file:
+            json.dump(results, file, indent=2)
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return failures
+
+
+BENCHMARKS = {
+    "skiplist": bench_skip_list,
+    "sort": bench_sort,
+    "concurrent": bench_concurrent,
+    "async": bench_async_deque,
+    "cache": bench_cache,
+    "persistent": bench_persistent,
+    "serialize": bench_serialize,
+    "mapped": bench_mapped,
+    "suite": bench_suite,
+    "instrumentation": bench_instrumentation,
+    "batch": bench_batch,
+    "pipeline": bench_pipeline,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("benchmarks", nargs="*", default=list(BENCHMARKS))
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--baseline")
+    parser.add_argument("--save")
+    arguments = parser.parse_args()
+    failures = []
+    for name in arguments.benchmarks:
+        if name == "suite":
+            failures += bench_suite(
+                tuple(arguments.sizes), arguments.baseline, arguments.save
+            )
+        else:
+            BENCHMARKS[name](tuple(arguments.sizes))
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+from __future__ import annotations
+import time
+from abc import ABC, abstractmethod
+from functools import wraps
+from typing import Callable, Hashable, Self
+
+from linked_list import DNode, DoublyLinkedList
+
+MISSING = object()
+KWARGS_MARK = object()
+
+
+class CacheNode(DNode):
+    __slots__ = ("key", "weight", "frequency", "expires")
+
+    def __init__(
+        self: Self, key: Hashable, data: object, weight: int = 1, expires: float = None
+    ) -> None:
+        super().__init__(data)
+        self.key: Hashable = key
+        self.weight: int = weight
+        self.frequency: int = 1
+        self.expires: float = expires
+
+    def __str__(self: Self):
+        return str(f"CacheNode({self.key}: {self.data})")
+
+
+class Cache(ABC):
+    def __init__(
+        self: Self,
+        maxsize: int = 128,
+        maxweight: int = None,
+        ttl: float = None,
+        weigh: Callable[[object], int] = None,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize: int = maxsize
+        self.maxweight: int = maxweight
+        self.ttl: float = ttl
+        self.weigh: Callable[[object], int] = weigh
+        self.timer: Callable[[], float] = timer
+        self.nodes: dict[Hashable, CacheNode] = {}
+        self.weight: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+    def __len__(self: Self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self: Self, key: Hashable) -> bool:
+        node = self.nodes.get(key)
+        return node is not None and not self.expired(node)
+
+    def __getitem__(self: Self, key: Hashable) -> object:
+        data = self.get(key, MISSING)
+        if data is MISSING:
+            raise KeyError(key)
+        return data
+
+    def __setitem__(self: Self, key: Hashable, data: object) -> None:
+        self.put(key, data)
+
+    def __delitem__(self: Self, key: Hashable) -> None:
+        if self.pop(key, MISSING) is MISSING:
+            raise KeyError(key)
+
+    def __str__(self: Self) -> str:
+        return f"{type(self).__name__}({self.stats()})"
+
+    def expired(self: Self, node: CacheNode) -> bool:
+        return node.expires is not None and node.expires <= self.timer()
+
+    def get(self: Self, key: Hashable, default: object = None) -> object:
+        node = self.nodes.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        if node.expires is not None and node.expires <= self.timer():
+            self.remove(node)
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self.hits += 1
+        self.touch(node)
+        return node.data
+
+    def put(self: Self, key: Hashable, data: object, weight: int = None) -> None:
+        if weight is None:
+            weight = 1 if self.weigh is None else self.weigh(data)
+        node = self.nodes.get(key)
+        if node is not None:
+            self.remove(node)
+        if (self.maxsize is not None and self.maxsize <= 0) or (
+            self.maxweight is not None and weight > self.maxweight
+        ):
+            return
+        self.shrink(1, weight)
+        expires = None if self.ttl is None else self.timer() + self.ttl
+        node = CacheNode(key, data, weight, expires)
+        self.nodes[key] = node
+        self.weight += weight
+        self.link(node)
+
+    def pop(self: Self, key: Hashable, default: object = MISSING) -> object:
+        node = self.nodes.get(key)
+        if node is None or self.expired(node):
+            if node is not None:
+                self.remove(node)
+                self.expirations += 1
+            if default is MISSING:
+                raise KeyError(key)
+            return default
+        self.remove(node)
+        return node.data
+
+    def remove(self: Self, node: CacheNode) -> None:
+        del self.nodes[node.key]
+        self.weight -= node.weight
+        self.unlink(node)
+
+    def shrink(self: Self, size: int = 0, weight: int = 0) -> None:
+        while self.nodes and (
+            (self.maxsize is not None and len(self.nodes) + size > self.maxsize)
+            or (self.maxweight is not None and self.weight + weight > self.maxweight)
+        ):
+            self.remove(self.victim())
+            self.evictions += 1
+
+    def clear(self: Self) -> None:
+        for node in list(self.nodes.values()):
+            self.remove(node)
+
+    def stats(self: Self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self.nodes),
+            "weight": self.weight,
+        }
+
+    def memoize(self: Self, function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs) -> object:
+            key = args + (KWARGS_MARK,) + tuple(kwargs.items()) if kwargs else args
+            data = self.get(key, MISSING)
+            if data is MISSING:
+                data = function(*args, **kwargs)
+                self.put(key, data)
+            return data
+
+        wrapper.cache = self
+        return wrapper
+
+    @abstractmethod
+    def link(self: Self, node: CacheNode) -> None: ...
+
+    @abstractmethod
+    def unlink(self: Self, node: CacheNode) -> None: ...
+
+    @abstractmethod
+    def touch(self: Self, node: CacheNode) -> None: ...
+
+    @abstractmethod
+    def victim(self: Self) -> CacheNode: ...
+
+
+class LRUCache(Cache):
+    def __init__(self: Self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.order: DoublyLinkedList = DoublyLinkedList()
+
+    def link(self: Self, node: CacheNode) -> None:
+        self.order.link_node(node, None, self.order.head)
+
+    def unlink(self: Self, node: CacheNode) -> None:
+        self.order.remove_node(node)
+
+    def touch(self: Self, node: CacheNode) -> None:
+        self.order.move_to_front(node)
+
+    def victim(self: Self) -> CacheNode:
+        return self.order.tail
+
+
+class TTLCache(LRUCache):
+    def __init__(self: Self, ttl: float, maxsize: int = None, **kwargs) -> None:
+        super().__init__(maxsize, ttl=ttl, **kwargs)
+
+    def get(self: Self, key: Hashable, default: object = None) -> object:
+        self.expire()
+        return super().get(key, default)
+
+    def put(self: Self, key: Hashable, data: object, weight: int = None) -> None:
+        self.expire()
+        super().put(key, data, weight)
+
+    def touch(self: Self, node: CacheNode) -> None:
+        pass
+
+    def expire(self: Self) -> int:
+        now, expired = self.timer(), 0
+        while self.order.tail is not None and self.order.tail.expires <= now:
+            self.remove(self.order.tail)
+            expired += 1
+        self.expirations += expired
+        return expired
+
+
+class LFUCache(Cache):
+    def __init__(self: Self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.frequencies: dict[int, DoublyLinkedList] = {}
+        self.minimum: int = 0
+
+    def link(self: Self, node: CacheNode) -> None:
+        node.frequency = self.minimum = 1
+        self.bucket(1, node)
+
+    def bucket(self: Self, frequency: int, node: CacheNode) -> None:
+        linked_list = self.frequencies.get(frequency)
+        if linked_list is None:
+            linked_list = self.frequencies[frequency] = DoublyLinkedList()
+        linked_list.link_node(node, None, linked_list.head)
+
+    def unlink(self: Self, node: CacheNode) -> None:
+        linked_list = self.frequencies[node.frequency]
+        linked_list.remove_node(node)
+        if len(linked_list) == 0:
+            del self.frequencies[node.frequency]
+            if self.minimum == node.frequency:
+                self.minimum = min(self.frequencies, default=0)
+
+    def touch(self: Self, node: CacheNode) -> None:
+        linked_list = self.frequencies[node.frequency]
+        linked_list.remove_node(node)
+        if len(linked_list) == 0:
+            del self.frequencies[node.frequency]
+            if self.minimum == node.frequency:
+                self.minimum += 1
+        node.frequency += 1
+        self.bucket(node.frequency, node)
+
+    def victim(self: Self) -> CacheNode:
+        return self.frequencies[self.minimum].tail
+
+
+def memoize(
+    maxsize: int = 128, policy: type[Cache] = LRUCache, **options
+) -> Callable[[Callable], Callable]:
+    def decorator(function: Callable) -> Callable:
+        return policy(maxsize=maxsize, **options).memoize(function)
+
+    return decorator
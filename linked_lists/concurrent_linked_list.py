@@ -0,0 +1,278 @@
+from __future__ import annotations
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, Self
+
+from linked_list import DNode, DoublyLinkedList, LinkedList, Node
+
+
+class Concurrent:
+    node_type: type = Node
+
+    def __init__(self: Self, elements: Iterable = None) -> None:
+        self.head_lock: threading.RLock = threading.RLock()
+        self.tail_lock: threading.RLock = threading.RLock()
+        self.pushed: int = 0
+        self.pulled: int = 0
+        super().__init__(elements)
+
+    @property
+    def size(self: Self) -> int:
+        return self.pushed - self.pulled
+
+    @size.setter
+    def size(self: Self, value: int) -> None:
+        self.pushed = self.pulled + value
+
+    def __contains__(self: Self, data: object) -> bool:
+        return any(value is data or value == data for value in self.values())
+
+    def __getitem__(self: Self, key: int | slice) -> Self | object:
+        with self.exclusive():
+            if isinstance(key, slice) and not self.slice_views:
+                indices = range(*key.indices(len(self)))
+                return type(self)(node.data for node in self.walk(indices))
+            return super().__getitem__(key)
+
+    def __setitem__(
+        self: Self, key: int | slice, value: object | Node | Iterable | LinkedList
+    ) -> None:
+        with self.exclusive():
+            super().__setitem__(key, value)
+
+    def __delitem__(self: Self, key: int | slice) -> None:
+        with self.exclusive():
+            super().__delitem__(key)
+
+    def __iter__(self: Self) -> Iterator[Node]:
+        return self.nodes()
+
+    def __imul__(self: Self, value: int) -> Self:
+        with self.exclusive():
+            return super().__imul__(value)
+
+    @contextmanager
+    def exclusive(self: Self) -> Iterator[None]:
+        with self.head_lock, self.tail_lock:
+            yield
+
+    def acquire_end(self: Self, lock: threading.RLock) -> bool:
+        lock.acquire()
+        if self.size > 2:
+            return False
+        if lock is self.tail_lock:
+            lock.release()
+            self.head_lock.acquire()
+            lock.acquire()
+        else:
+            self.tail_lock.acquire()
+        return True
+
+    def release_end(self: Self, lock: threading.RLock, both: bool) -> None:
+        if both:
+            self.tail_lock.release()
+            self.head_lock.release()
+        else:
+            lock.release()
+
+    def link(self: Self, prev: Node | None, node: Node | None) -> None:
+        if prev is not None:
+            prev.next = node
+
+    def nodes(self: Self, reverse: bool = False) -> Iterator[Node]:
+        node = self.tail if reverse else self.head
+        for _ in range(self.size):
+            if node is None:
+                return
+            yield node
+            node = node.prev if reverse else node.next
+
+    def values(self: Self) -> Iterator:
+        return (node.data for node in self.nodes())
+
+    def difference(self: Self, other: Iterable) -> tuple[object, object] | None:
+        with self.exclusive():
+            return super().difference(other)
+
+    def get(self: Self, index: int) -> Node:
+        with self.exclusive():
+            return super().get(index)
+
+    def attach(self: Self, head: Node, tail: Node, size: int) -> None:
+        if self.tail is None:
+            self.head = head
+            self.link(None, head)
+        else:
+            self.link(self.tail, head)
+        self.link(tail, None)
+        self.tail = tail
+        self.pushed += size
+
+    def append(self: Self, data: object) -> None:
+        node = self.node_type(data)
+        both = self.acquire_end(self.tail_lock)
+        try:
+            if self.tail is None:
+                self.head = node
+            else:
+                self.link(self.tail, node)
+            self.tail = node
+            self.pushed += 1
+        finally:
+            self.release_end(self.tail_lock, both)
+
+    def join(self: Self, linked_list: LinkedList | Iterable) -> Self:
+        if not isinstance(linked_list, LinkedList):
+            linked_list = self.build(linked_list)
+        elif not isinstance(linked_list.head, self.node_type):
+            linked_list = self.build(linked_list.values(), len(linked_list))
+        if len(linked_list) <= 0:
+            return self
+        both = self.acquire_end(self.tail_lock)
+        try:
+            self.attach(linked_list.head, linked_list.tail, linked_list.size)
+        finally:
+            self.release_end(self.tail_lock, both)
+        return self
+
+    def insert(self: Self, data: object, position: int = None) -> None:
+        if position is None:
+            return self.append(data)
+        if position != 0:
+            with self.exclusive():
+                return super().insert(data, position)
+        node = self.node_type(data)
+        both = self.acquire_end(self.head_lock)
+        try:
+            self.link(node, self.head)
+            if self.head is None:
+                self.tail = node
+            self.head = node
+            self.link(None, node)
+            self.pulled -= 1
+        finally:
+            self.release_end(self.head_lock, both)
+
+    def pop(self: Self, position: int = None) -> Node:
+        if position != 0:
+            with self.exclusive():
+                return super().pop(position)
+        both = self.acquire_end(self.head_lock)
+        try:
+            node = self.head
+            if node is None:
+                raise IndexError("linked list index out of range")
+            self.head = node.next
+            if self.head is None:
+                self.tail = None
+            self.link(None, self.head)
+            self.pulled += 1
+            return node
+        finally:
+            self.release_end(self.head_lock, both)
+
+    def couple(self: Self, linked_list: LinkedList, position: int) -> Self:
+        with self.exclusive():
+            return super().couple(linked_list, position)
+
+    def decouple(self: Self, start: int = 0, stop: int = None) -> Self:
+        with self.exclusive():
+            return super().decouple(start, stop)
+
+    def insert_many(self: Self, pairs: Iterable[tuple[object, int]]) -> None:
+        with self.exclusive():
+            super().insert_many(pairs)
+
+    def pop_many(self: Self, positions: Iterable[int]) -> list[Node]:
+        with self.exclusive():
+            return super().pop_many(positions)
+
+    def remove_if(self: Self, predicate: Callable[[object], bool]) -> int:
+        with self.exclusive():
+            return super().remove_if(predicate)
+
+    def index(self: Self, data: object | tuple, *args, **kwargs):
+        with self.exclusive():
+            return super().index(data, *args, **kwargs)
+
+    def count(self: Self, data: object) -> int:
+        return sum(value is data or value == data for value in self.values())
+
+    def copy(self: Self) -> Self:
+        return type(self)(self.values())
+
+    def to_list(self: Self) -> list:
+        return list(self.values())
+
+    def to_set(self: Self) -> set:
+        return set(self.values())
+
+    def reverse(self: Self, start: int = 0, stop: int = None) -> None:
+        with self.exclusive():
+            super().reverse(start, stop)
+
+    def sort(self: Self, key: Callable = None, reverse: bool = False) -> None:
+        with self.exclusive():
+            super().sort(key, reverse)
+
+
+class ConcurrentLinkedList(Concurrent, LinkedList):
+    pass
+
+
+class ConcurrentDoublyLinkedList(Concurrent, DoublyLinkedList):
+    node_type: type = DNode
+
+    def __reversed__(self: Self) -> Iterator[DNode]:
+        return self.nodes(reverse=True)
+
+    def link(self: Self, prev: DNode | None, node: DNode | None) -> None:
+        if prev is not None:
+            prev.next = node
+        if node is not None:
+            node.prev = prev
+        self.finger = None
+
+    def values(self: Self, reverse: bool = False) -> Iterator:
+        return (node.data for node in self.nodes(reverse))
+
+    def insert_after(
+        self: Self, node: DNode, data: object, validate: bool = False
+    ) -> DNode:
+        with self.exclusive():
+            return super().insert_after(node, data, validate)
+
+    def insert_before(
+        self: Self, node: DNode, data: object, validate: bool = False
+    ) -> DNode:
+        with self.exclusive():
+            return super().insert_before(node, data, validate)
+
+    def remove_node(self: Self, node: DNode, validate: bool = False) -> DNode:
+        with self.exclusive():
+            return super().remove_node(node, validate)
+
+    def move_to_front(self: Self, node: DNode, validate: bool = False) -> DNode:
+        with self.exclusive():
+            return super().move_to_front(node, validate)
+
+    def move_to_back(self: Self, node: DNode, validate: bool = False) -> DNode:
+        with self.exclusive():
+            return super().move_to_back(node, validate)
+
+    def pop(self: Self, position: int = None) -> DNode:
+        if position is not None:
+            return super().pop(position)
+        both = self.acquire_end(self.tail_lock)
+        try:
+            node = self.tail
+            if node is None:
+                raise TypeError("linked list is empty")
+            self.tail = node.prev
+            if self.tail is None:
+                self.head = None
+            self.link(self.tail, None)
+            self.pushed -= 1
+            return node
+        finally:
+            self.release_end(self.tail_lock, both)
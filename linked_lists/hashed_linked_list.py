@@ -0,0 +1,253 @@
+from __future__ import annotations
+from itertools import chain
+from typing import Iterable, NoReturn, Self
+
+from linked_list import (
+    GC_PAUSE,
+    CircularDoublyLinkedList,
+    CircularLinkedList,
+    DNode,
+    DoublyLinkedList,
+    LinkedList,
+    Node,
+)
+
+
+def immutable(self: object, *args, **kwargs) -> NoReturn:
+    raise TypeError(f"'{type(self).__name__}' object is immutable")
+
+
+class FrozenNode(Node):
+    __slots__ = ()
+
+    def __init__(self: Self, data: object, next: Node = None) -> None:
+        object.__setattr__(self, "data", data)
+        object.__setattr__(self, "next", next)
+
+    __setattr__ = __delattr__ = immutable
+
+
+class FrozenDNode(DNode):
+    __slots__ = ()
+
+    def __init__(
+        self: Self, data: object, prev: DNode = None, next: DNode = None
+    ) -> None:
+        object.__setattr__(self, "data", data)
+        object.__setattr__(self, "prev", prev)
+        object.__setattr__(self, "next", next)
+
+    __setattr__ = __delattr__ = immutable
+
+
+class Fingerprint:
+    def __init__(self: Self, elements: Iterable = None) -> None:
+        self.fingerprint: int = 0
+        super().__init__(elements)
+
+    def __eq__(self: Self, other: Iterable) -> bool:
+        if isinstance(other, Fingerprint) and self.fingerprint != other.fingerprint:
+            return False
+        return super().__eq__(other)
+
+    def __getitem__(self: Self, key: int | slice) -> Self | object:
+        if isinstance(key, slice):
+            if self.slice_views:
+                return self.view(key.start, key.stop, key.step)
+            indices = range(*key.indices(len(self)))
+            return type(self)(node.data for node in self.walk(indices))
+        return super().__getitem__(key)
+
+    def __setitem__(
+        self: Self, key: int | slice, value: object | Node | Iterable | LinkedList
+    ) -> None:
+        if isinstance(key, slice):
+            indices = range(*key.indices(len(self)))
+            if indices.step == 1:
+                return super().__setitem__(key, value)
+            before = self.digest(node.data for node in self.walk(indices))
+            super().__setitem__(key, value)
+            after = self.digest(node.data for node in self.walk(indices))
+            self.fingerprint += after - before
+            return
+        if not isinstance(key, int):
+            raise TypeError("invalid argument type")
+        node = self.get(key)
+        before = self.digest((node.data,))
+        super().__setitem__(key, value)
+        self.fingerprint += self.digest((node.data,)) - before
+
+    def __add__(self: Self, item: Iterable | LinkedList) -> Self:
+        return type(self)(
+            chain(
+                self.values(), item.values() if isinstance(item, LinkedList) else item
+            )
+        )
+
+    def __mul__(self: Self, value: int) -> Self:
+        return type(self)(chain.from_iterable(self.values() for _ in range(value)))
+
+    @staticmethod
+    def digest(values: Iterable) -> int:
+        total = 0
+        for data in values:
+            try:
+                total += hash(data)
+            except TypeError:
+                pass
+        return total
+
+    def recompute_fingerprint(self: Self) -> int:
+        self.fingerprint = self.digest(self.values())
+        return self.fingerprint
+
+    def insert(self: Self, data: object, position: int = None) -> None:
+        if position is None:
+            return self.append(data)
+        position += len(self) if position < 0 else 0
+        if position == len(self):
+            return self.append(data)
+        super().insert(data, position)
+        self.fingerprint += self.digest((data,))
+
+    def append(self: Self, data: object) -> None:
+        super().append(data)
+        self.fingerprint += self.digest((data,))
+
+    def join(self: Self, linked_list: LinkedList) -> Self:
+        added = self.digest(linked_list.values())
+        super().join(linked_list)
+        self.fingerprint += added
+        return self
+
+    def couple(self: Self, linked_list: LinkedList, position: int) -> Self:
+        position += len(self) if position < 0 else 0
+        if position == len(self):
+            return self.join(linked_list)
+        added = self.digest(linked_list.values())
+        super().couple(linked_list, position)
+        self.fingerprint += added
+        return self
+
+    def pop(self: Self, position: int = None) -> Node:
+        node = super().pop(position)
+        self.fingerprint -= self.digest((node.data,))
+        return node
+
+    def unlink(self: Self, prev: Node, node: Node) -> None:
+        super().unlink(prev, node)
+        self.fingerprint -= self.digest((node.data,))
+
+    def insert_many(self: Self, pairs: Iterable[tuple[object, int]]) -> None:
+        pairs = list(pairs)
+        super().insert_many(pairs)
+        self.fingerprint += self.digest(data for data, _ in pairs)
+
+    def link_node(self: Self, node: DNode, prev: DNode, next: DNode) -> DNode:
+        super().link_node(node, prev, next)
+        self.fingerprint += self.digest((node.data,))
+        return node
+
+    def remove_node(self: Self, node: DNode, validate: bool = False) -> DNode:
+        super().remove_node(node, validate)
+        self.fingerprint -= self.digest((node.data,))
+        return node
+
+    def decouple(self: Self, start: int = 0, stop: int = None) -> Self:
+        indices = range(*slice(start, stop).indices(len(self)))
+        removed = self.digest(node.data for node in self.walk(indices))
+        super().decouple(start, stop)
+        self.fingerprint -= removed
+        return self
+
+    def copy(self: Self) -> Self:
+        return type(self)(self.values())
+
+
+class Frozen:
+    def __init__(self: Self, elements: Iterable = None) -> None:
+        super().__init__()
+        if isinstance(elements, LinkedList):
+            elements = elements.values()
+        if elements is not None:
+            self.seal(list(elements))
+        self.hash: int = None
+
+    def __hash__(self: Self) -> int:
+        if self.hash is None:
+            self.hash = hash(self.to_tuple())
+        return self.hash
+
+    def __eq__(self: Self, other: Iterable) -> bool:
+        if isinstance(other, Frozen) and hash(self) != hash(other):
+            return False
+        return super().__eq__(other)
+
+    def __getitem__(self: Self, key: int | slice) -> Self | object:
+        if isinstance(key, slice):
+            if self.slice_views:
+                return self.view(key.start, key.stop, key.step)
+            indices = range(*key.indices(len(self)))
+            return type(self)(node.data for node in self.walk(indices))
+        return super().__getitem__(key)
+
+    def __str__(self: Self) -> str:
+        return f"{type(self).__name__}{self.to_tuple()}"
+
+    def __reduce__(self: Self) -> tuple:
+        return type(self), (self.to_tuple(),)
+
+    def seal(self: Self, values: list) -> None:
+        if not values:
+            return
+        doubly = isinstance(self, DoublyLinkedList)
+        with GC_PAUSE:
+            nodes = list(map(FrozenDNode if doubly else FrozenNode, values))
+            for prev, node in zip(nodes, nodes[1:]):
+                object.__setattr__(prev, "next", node)
+                if doubly:
+                    object.__setattr__(node, "prev", prev)
+        self.head, self.tail, self.size = nodes[0], nodes[-1], len(nodes)
+        if isinstance(self, CircularLinkedList):
+            object.__setattr__(self.tail, "next", self.head)
+            if doubly:
+                object.__setattr__(self.head, "prev", self.tail)
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = immutable
+    insert = append = extend = join = couple = pop = decouple = immutable
+    unlink = reverse = sort = immutable
+    insert_many = pop_many = remove_if = keep_if = immutable
+    link_node = remove_node = move_to_front = move_to_back = immutable
+    insert_after = insert_before = immutable
+
+
+class FingerprintedLinkedList(Fingerprint, LinkedList):
+    pass
+
+
+class FingerprintedCircularLinkedList(Fingerprint, CircularLinkedList):
+    pass
+
+
+class FingerprintedDoublyLinkedList(Fingerprint, DoublyLinkedList):
+    pass
+
+
+class FingerprintedCircularDoublyLinkedList(Fingerprint, CircularDoublyLinkedList):
+    pass
+
+
+class FrozenLinkedList(Frozen, LinkedList):
+    pass
+
+
+class FrozenCircularLinkedList(Frozen, CircularLinkedList):
+    pass
+
+
+class FrozenDoublyLinkedList(Frozen, DoublyLinkedList):
+    pass
+
+
+class FrozenCircularDoublyLinkedList(Frozen, CircularDoublyLinkedList):
+    pass
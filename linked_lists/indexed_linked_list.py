@@ -0,0 +1,332 @@
+from __future__ import annotations
+import sys
+from itertools import chain
+from typing import Callable, Iterable, Self
+
+from linked_list import (
+    CircularDoublyLinkedList,
+    CircularLinkedList,
+    DNode,
+    DoublyLinkedList,
+    LinkedList,
+    Node,
+)
+
+
+class ValueIndex:
+    def __init__(self: Self, elements: Iterable = None) -> None:
+        self.value_index: dict[object, dict[int, Node]] = {}
+        self.unhashable: dict[int, Node] = {}
+        self.ranks: dict[int, int] | None = {}
+        self.rank_base: int = 0
+        super().__init__(elements)
+
+    def __contains__(self: Self, data: object) -> bool:
+        try:
+            if data in self.value_index:
+                return True
+        except TypeError:
+            pass
+        for node in self.unhashable.values():
+            if node.data is data or node.data == data:
+                return True
+        return False
+
+    def __getitem__(self: Self, key: int | slice) -> Self | object:
+        if isinstance(key, slice):
+            if self.slice_views:
+                return self.view(key.start, key.stop, key.step)
+            indices = range(*key.indices(len(self)))
+            return type(self)(node.data for node in self.walk(indices))
+        return super().__getitem__(key)
+
+    def __setitem__(
+        self: Self, key: int | slice, value: object | Node | Iterable | LinkedList
+    ) -> None:
+        if isinstance(key, slice):
+            indices = range(*key.indices(len(self)))
+            if indices.step == 1:
+                return super().__setitem__(key, value)
+            nodes = list(self.walk(indices))
+            for node in nodes:
+                self.untrack(node)
+            try:
+                super().__setitem__(key, value)
+            finally:
+                for node in nodes:
+                    self.track(node)
+            return
+        if not isinstance(key, int):
+            raise TypeError("invalid argument type")
+        node = self.get(key)
+        self.untrack(node)
+        node.data = value.data if isinstance(value, Node) else value
+        self.track(node)
+
+    def __add__(self: Self, item: Iterable | LinkedList) -> Self:
+        return type(self)(
+            chain(
+                self.values(), item.values() if isinstance(item, LinkedList) else item
+            )
+        )
+
+    def __mul__(self: Self, value: int) -> Self:
+        return type(self)(chain.from_iterable(self.values() for _ in range(value)))
+
+    def track(self: Self, node: Node) -> None:
+        try:
+            self.value_index.setdefault(node.data, {})[id(node)] = node
+        except TypeError:
+            self.unhashable[id(node)] = node
+
+    def untrack(self: Self, node: Node) -> None:
+        try:
+            nodes = self.value_index.get(node.data)
+        except TypeError:
+            self.unhashable.pop(id(node), None)
+            return
+        if nodes is not None:
+            nodes.pop(id(node), None)
+            if not nodes:
+                del self.value_index[node.data]
+
+    def rank(self: Self, node: Node, position: int | None, count: int) -> None:
+        if self.ranks is None:
+            return
+        if position == 0:
+            self.rank_base -= count
+        elif position is None or position + count != len(self):
+            self.ranks = None
+            return
+        for i in range(position, position + count):
+            self.ranks[id(node)] = self.rank_base + i
+            node = node.next
+
+    def unrank(self: Self, node: Node, position: int | None, count: int) -> None:
+        if self.ranks is None:
+            return
+        if position == 0:
+            self.rank_base += count
+        elif position is None or position != len(self):
+            self.ranks = None
+            return
+        for _ in range(count):
+            del self.ranks[id(node)]
+            node = node.next
+
+    def position_of(self: Self, node: Node) -> int:
+        if self.ranks is None:
+            self.ranks = {id(node): i for i, node in enumerate(self)}
+            self.rank_base = 0
+        return self.ranks[id(node)] - self.rank_base
+
+    def reindex(self: Self) -> None:
+        self.value_index.clear()
+        self.unhashable.clear()
+        self.ranks = None
+        for node in self:
+            self.track(node)
+
+    def matches(self: Self, data: object) -> list[Node]:
+        try:
+            nodes = list(self.value_index.get(data, {}).values())
+        except TypeError:
+            nodes = []
+        for node in self.unhashable.values():
+            if node.data is data or node.data == data:
+                nodes.append(node)
+        return nodes
+
+    def count(self: Self, data: object) -> int:
+        count = sum(
+            node.data is data or node.data == data for node in self.unhashable.values()
+        )
+        try:
+            return count + len(self.value_index.get(data, ()))
+        except TypeError:
+            return count
+
+    def find(self: Self, data: object) -> Node | None:
+        nodes = self.matches(data)
+        if len(nodes) <= 1:
+            return nodes[0] if nodes else None
+        return min(nodes, key=self.position_of)
+
+    def find_all(self: Self, data: object, limit: int = None) -> list[Node]:
+        nodes = self.matches(data)
+        if len(nodes) > 1:
+            nodes.sort(key=self.position_of)
+        return nodes if limit is None else nodes[:limit]
+
+    def index(
+        self: Self,
+        data: object | tuple,
+        start=0,
+        stop=None,
+        step=1,
+        skip=0,
+        nindices=None,
+        return_all=False,
+    ):
+        values = data if isinstance(data, tuple) else (data,)
+        try:
+            hash(values)
+        except TypeError:
+            return super().index(data, start, stop, step, skip, nindices, return_all)
+        if step <= 0:
+            raise ValueError("negative steps are currently not supported")
+        start += len(self) if start < 0 else 0
+        start = 0 if start < 0 else start
+        if nindices is None:
+            nindices = len(self) if return_all else 1
+        if stop is None:
+            stop = len(self)
+        if len(self) <= 0 or nindices <= 0:
+            return None
+        nodes = {id(node): node for value in values for node in self.matches(value)}
+        positions = sorted(
+            position
+            for position in map(self.position_of, nodes.values())
+            if start <= position < stop
+        )
+        indices = []
+        for step_count, position in enumerate(positions[max(skip, 0) :]):
+            if nindices <= 0:
+                break
+            if step_count % step == 0:
+                indices.append(position)
+                nindices -= 1
+        if len(indices) <= 0:
+            return None
+        return indices if nindices > 0 or len(indices) > 1 else indices[0]
+
+    def insert(self: Self, data: object, position: int = None) -> None:
+        if position is None:
+            return self.append(data)
+        position += len(self) if position < 0 else 0
+        if position == len(self):
+            return self.append(data)
+        if position < 0 or position > len(self):
+            raise IndexError("linked list index out of range")
+        prev = None if position == 0 else self.get(position - 1)
+        next = self.head if prev is None else prev.next
+        self.splice(prev, next, self.build((data,), 1))
+        self.close()
+
+    def append(self: Self, data: object) -> None:
+        super().append(data)
+        self.track(self.tail)
+        self.rank(self.tail, len(self) - 1, 1)
+
+    def join(self: Self, linked_list: LinkedList) -> Self:
+        size, tail = len(self), self.tail
+        super().join(linked_list)
+        first = node = self.head if tail is None else tail.next
+        for _ in range(len(self) - size):
+            self.track(node)
+            node = node.next
+        self.rank(first, size, len(self) - size)
+        return self
+
+    def couple(self: Self, linked_list: LinkedList, position: int) -> Self:
+        position += len(self) if position < 0 else 0
+        if position == len(self):
+            return self.join(linked_list)
+        size = len(self)
+        super().couple(linked_list, position)
+        nodes = list(self.walk(range(position, position + len(self) - size)))
+        for node in nodes:
+            self.track(node)
+        if nodes:
+            self.rank(nodes[0], position, len(nodes))
+        return self
+
+    def pop(self: Self, position: int = None) -> Node:
+        head, tail = self.head, self.tail
+        node = super().pop(position)
+        self.untrack(node)
+        self.unrank(node, self.end_position(node, head, tail), 1)
+        return node
+
+    def end_position(self: Self, node: Node, head: Node, tail: Node) -> int | None:
+        if node is head:
+            return 0
+        return len(self) if node is tail else None
+
+    def unlink(self: Self, prev: Node, node: Node) -> None:
+        self.untrack(node)
+        self.ranks = None
+        super().unlink(prev, node)
+
+    def splice(self: Self, prev: Node, next: Node, linked_list: LinkedList) -> None:
+        super().splice(prev, next, linked_list)
+        node = linked_list.head
+        for _ in range(len(linked_list)):
+            self.track(node)
+            node = node.next
+        position = len(self) - len(linked_list) if next is None else None
+        self.rank(linked_list.head, 0 if prev is None else position, len(linked_list))
+
+    def link_node(self: Self, node: DNode, prev: DNode, next: DNode) -> DNode:
+        super().link_node(node, prev, next)
+        self.track(node)
+        position = len(self) - 1 if next is None else None
+        self.rank(node, 0 if prev is None else position, 1)
+        return node
+
+    def remove_node(self: Self, node: DNode, validate: bool = False) -> DNode:
+        head, tail = self.head, self.tail
+        super().remove_node(node, validate)
+        self.untrack(node)
+        self.unrank(node, self.end_position(node, head, tail), 1)
+        return node
+
+    def decouple(self: Self, start: int = 0, stop: int = None) -> Self:
+        indices = range(*slice(start, stop).indices(len(self)))
+        if indices.start > indices.stop:
+            indices = range(indices.stop, indices.start)
+        first = node = self.get(indices.start) if len(indices) > 0 else None
+        super().decouple(start, stop)
+        for _ in range(len(indices)):
+            self.untrack(node)
+            node = node.next
+        if first is not None:
+            self.unrank(first, indices.start, len(indices))
+        return self
+
+    def reverse(self: Self, start: int = 0, stop: int = None) -> None:
+        super().reverse(start, stop)
+        self.ranks = None
+
+    def sort(self: Self, key: Callable = None, reverse: bool = False) -> None:
+        super().sort(key, reverse)
+        self.ranks = None
+
+    def copy(self: Self) -> Self:
+        return type(self)(self.values())
+
+    def index_sizeof(self: Self) -> int:
+        size = sys.getsizeof(self.value_index) + sys.getsizeof(self.unhashable)
+        size += sys.getsizeof(self.ranks)
+        for nodes in self.value_index.values():
+            size += sys.getsizeof(nodes)
+        return size
+
+    def sizeof(self: Self, deep: bool = False) -> int:
+        return super().sizeof(deep) + self.index_sizeof()
+
+
+class IndexedLinkedList(ValueIndex, LinkedList):
+    pass
+
+
+class IndexedCircularLinkedList(ValueIndex, CircularLinkedList):
+    pass
+
+
+class IndexedDoublyLinkedList(ValueIndex, DoublyLinkedList):
+    pass
+
+
+class IndexedCircularDoublyLinkedList(ValueIndex, CircularDoublyLinkedList):
+    pass
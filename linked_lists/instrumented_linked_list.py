@@ -0,0 +1,434 @@
+from __future__ import annotations
+import time
+import weakref
+from functools import wraps
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Self
+
+from linked_list import (
+    CircularDoublyLinkedList,
+    CircularLinkedList,
+    DNode,
+    DoublyLinkedList,
+    LinkedList,
+    LinkedListView,
+    Node,
+)
+
+HOOKS: list[Callable] = []
+INSTANCES: weakref.WeakValueDictionary[int, Instrumented] = (
+    weakref.WeakValueDictionary()
+)
+TWINS: dict[type, type] = {}
+
+
+def traced(method: Callable) -> Callable:
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self: Instrumented, *args, **kwargs) -> object:
+        if self.depth:
+            return method(self, *args, **kwargs)
+        self.depth = 1
+        hops, allocations = self.hops, self.allocations
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start
+            self.depth = 0
+            self.record(name, self.hops - hops, self.allocations - allocations, seconds)
+
+    return wrapper
+
+
+class Instrumented:
+    def __init__(self: Self, elements: Iterable = None) -> None:
+        self.reset()
+        super().__init__(elements)
+
+    def reset(self: Self) -> None:
+        self.hops: int = 0
+        self.allocations: int = 0
+        self.depth: int = 0
+        self.calls: dict[str, list] = {}
+        self.callback: Callable = None
+        INSTANCES[id(self)] = self
+
+    def record(
+        self: Self, method: str, hops: int, allocations: int, seconds: float
+    ) -> None:
+        calls = self.calls.get(method)
+        if calls is None:
+            calls = self.calls[method] = [0, 0, 0, 0.0]
+        calls[0] += 1
+        calls[1] += hops
+        calls[2] += allocations
+        calls[3] += seconds
+        if self.callback is not None:
+            self.callback(self, method, hops, allocations, seconds)
+        for hook in HOOKS:
+            hook(self, method, hops, allocations, seconds)
+
+    def snapshot(self: Self) -> dict:
+        return {
+            "type": type(self).__name__,
+            "size": self.size,
+            "hops": self.hops,
+            "allocations": self.allocations,
+            "methods": {
+                method: {
+                    "calls": calls,
+                    "hops": hops,
+                    "allocations": allocations,
+                    "seconds": seconds,
+                }
+                for method, (calls, hops, allocations, seconds) in self.calls.items()
+            },
+        }
+
+    def distance(self: Self, index: int) -> int:
+        return index % self.size if self.size > 0 else 0
+
+    def build(self: Self, values: Iterable, size_hint: int = None) -> LinkedList:
+        linked_list = super().build(values, size_hint)
+        self.allocations += len(linked_list)
+        return linked_list
+
+    def counted(self: Self, nodes: Iterator, step: int = 1, free: int = 0) -> Iterator:
+        for node in nodes:
+            if free:
+                free -= 1
+            else:
+                self.hops += step
+            yield node
+
+    def walk(self: Self, indices: range) -> Iterator[Node]:
+        if indices.step < 0:
+            return super().walk(indices)
+        return self.counted(super().walk(indices), indices.step, 1)
+
+    def values(self: Self, *args, **kwargs) -> Iterator:
+        return self.counted(super().values(*args, **kwargs))
+
+    def __iter__(self: Self) -> Iterator[Node]:
+        return self.counted(super().__iter__())
+
+    def difference(self: Self, other: Iterable) -> tuple[object, object] | None:
+        if isinstance(other, (LinkedList, LinkedListView)):
+            values = other.values()
+        else:
+            values = other
+        for data, other_data in zip(islice(self.values(), len(other)), values):
+            if data is not other_data and data != other_data:
+                return data, other_data
+        return None
+
+    def run(
+        self: Self, node: Node, remaining: int, before: Callable
+    ) -> tuple[Node, Node, int, Node]:
+        result = super().run(node, remaining, before)
+        self.hops += result[2]
+        return result
+
+    def merge(
+        self: Self,
+        left: tuple[Node, Node, int],
+        right: tuple[Node, Node, int],
+        before: Callable,
+    ) -> tuple[Node, Node, int]:
+        def advance(node: Node, other: Node) -> bool:
+            self.hops += 1
+            return before(node, other)
+
+        return super().merge(left, right, advance)
+
+    @traced
+    def __getitem__(self: Self, key: int | slice) -> Self | object:
+        if isinstance(key, slice) and not self.slice_views:
+            indices = range(*key.indices(len(self)))
+            result = type(self)(node.data for node in self.walk(indices))
+            self.allocations += len(result)
+            return result
+        return super().__getitem__(key)
+
+    @traced
+    def __setitem__(
+        self: Self, key: int | slice, value: object | Node | Iterable | LinkedList
+    ) -> None:
+        super().__setitem__(key, value)
+
+    @traced
+    def __delitem__(self: Self, key: int | slice) -> None:
+        indices = range(*key.indices(len(self))) if isinstance(key, slice) else None
+        super().__delitem__(key)
+        if indices and abs(indices.step) != 1:
+            step = abs(indices.step)
+            self.hops += (len(indices) - 1) * (step - 1) + len(indices)
+
+    @traced
+    def __contains__(self: Self, data: object) -> bool:
+        for value in self.values():
+            if value is data or value == data:
+                return True
+        return False
+
+    @traced
+    def __eq__(self: Self, other: Iterable) -> bool:
+        return super().__eq__(other)
+
+    @traced
+    def __ne__(self: Self, other: Iterable) -> bool:
+        return super().__ne__(other)
+
+    @traced
+    def __lt__(self: Self, other: Iterable) -> bool:
+        return super().__lt__(other)
+
+    @traced
+    def __gt__(self: Self, other: Iterable) -> bool:
+        return super().__gt__(other)
+
+    @traced
+    def __le__(self: Self, other: Iterable) -> bool:
+        return super().__le__(other)
+
+    @traced
+    def __ge__(self: Self, other: Iterable) -> bool:
+        return super().__ge__(other)
+
+    @traced
+    def __add__(self: Self, item: Iterable | LinkedList) -> Self:
+        result = super().__add__(item)
+        self.allocations += len(result)
+        return result
+
+    @traced
+    def __mul__(self: Self, value: int) -> Self:
+        result = super().__mul__(value)
+        self.allocations += len(result)
+        return result
+
+    @traced
+    def __iadd__(self: Self, item: Iterable | LinkedList) -> Self:
+        return super().__iadd__(item)
+
+    @traced
+    def __imul__(self: Self, value: int) -> Self:
+        return super().__imul__(value)
+
+    @traced
+    def get(self: Self, index: int) -> Node:
+        self.hops += self.distance(index)
+        return super().get(index)
+
+    @traced
+    def insert(self: Self, data: object, position: int = None) -> None:
+        allocations = self.allocations
+        super().insert(data, position)
+        if self.allocations == allocations:
+            self.allocations += 1
+
+    @traced
+    def append(self: Self, data: object) -> None:
+        super().append(data)
+        self.allocations += 1
+
+    @traced
+    def extend(self: Self, iterable: Iterable, size_hint: int = None) -> None:
+        super().extend(iterable, size_hint)
+
+    @traced
+    def join(self: Self, linked_list: LinkedList) -> Self:
+        return super().join(linked_list)
+
+    @traced
+    def couple(self: Self, linked_list: LinkedList, position: int) -> Self:
+        return super().couple(linked_list, position)
+
+    @traced
+    def pop(self: Self, position: int = None) -> Node:
+        return super().pop(position)
+
+    @traced
+    def decouple(self: Self, start: int = 0, stop: int = None) -> Self:
+        return super().decouple(start, stop)
+
+    @traced
+    def insert_many(self: Self, pairs: Iterable[tuple[object, int]]) -> None:
+        size, pairs = self.size, list(pairs)
+        super().insert_many(pairs)
+        self.hops += max(
+            (position + size if position < 0 else position for _, position in pairs),
+            default=0,
+        )
+
+    @traced
+    def pop_many(self: Self, positions: Iterable[int]) -> list[Node]:
+        size, positions = self.size, list(positions)
+        nodes = super().pop_many(positions)
+        if positions:
+            self.hops += max(p + size if p < 0 else p for p in positions) + 1
+        return nodes
+
+    @traced
+    def remove_if(self: Self, predicate: Callable[[object], bool]) -> int:
+        size = self.size
+        removed = super().remove_if(predicate)
+        self.hops += size
+        return removed
+
+    @traced
+    def keep_if(self: Self, predicate: Callable[[object], bool]) -> int:
+        return super().keep_if(predicate)
+
+    @traced
+    def index(self: Self, data: object | tuple, *args, **kwargs):
+        return super().index(data, *args, **kwargs)
+
+    @traced
+    def count(self: Self, data: object) -> int:
+        return sum(value is data or value == data for value in self.values())
+
+    @traced
+    def copy(self: Self) -> LinkedList:
+        result = super().copy()
+        self.allocations += len(result)
+        return result
+
+    @traced
+    def reverse(self: Self, start: int = 0, stop: int = None) -> None:
+        size = self.size
+        super().reverse(start, stop)
+        stop = size if stop is None else stop + (size if stop < 0 else 0)
+        start += size if start < 0 else 0
+        if stop - start >= 2:
+            self.hops += stop
+
+    @traced
+    def sort(self: Self, key: Callable = None, reverse: bool = False) -> None:
+        super().sort(key, reverse)
+
+    @traced
+    def to_list(self: Self) -> list:
+        return list(self.values())
+
+    @traced
+    def to_tuple(self: Self) -> tuple:
+        return super().to_tuple()
+
+    @traced
+    def to_set(self: Self) -> set:
+        return set(self.values())
+
+
+class DoublyInstrumented(Instrumented):
+    def distance(self: Self, index: int) -> int:
+        if self.size <= 0:
+            return 0
+        index %= self.size
+        distance = min(index, self.size - 1 - index)
+        if self.finger is not None:
+            distance = min(distance, abs(index - self.finger_index))
+        return distance
+
+    def __reversed__(self: Self) -> Iterator[DNode]:
+        return self.counted(super().__reversed__())
+
+    def walk(self: Self, indices: range) -> Iterator[DNode]:
+        nodes = super(Instrumented, self).walk(indices)
+        return self.counted(nodes, abs(indices.step), 1)
+
+    @traced
+    def sort(self: Self, key: Callable = None, reverse: bool = False) -> None:
+        super().sort(key, reverse)
+        self.hops += self.size
+
+    @traced
+    def insert_after(
+        self: Self, node: DNode, data: object, validate: bool = False
+    ) -> DNode:
+        node = super().insert_after(node, data, validate)
+        self.allocations += 1
+        return node
+
+    @traced
+    def insert_before(
+        self: Self, node: DNode, data: object, validate: bool = False
+    ) -> DNode:
+        node = super().insert_before(node, data, validate)
+        self.allocations += 1
+        return node
+
+    @traced
+    def remove_node(self: Self, node: DNode, validate: bool = False) -> DNode:
+        return super().remove_node(node, validate)
+
+    @traced
+    def move_to_front(self: Self, node: DNode, validate: bool = False) -> DNode:
+        return super().move_to_front(node, validate)
+
+    @traced
+    def move_to_back(self: Self, node: DNode, validate: bool = False) -> DNode:
+        return super().move_to_back(node, validate)
+
+
+class InstrumentedLinkedList(Instrumented, LinkedList):
+    pass
+
+
+class InstrumentedCircularLinkedList(Instrumented, CircularLinkedList):
+    pass
+
+
+class InstrumentedDoublyLinkedList(DoublyInstrumented, DoublyLinkedList):
+    pass
+
+
+class InstrumentedCircularDoublyLinkedList(
+    DoublyInstrumented, CircularDoublyLinkedList
+):
+    pass
+
+
+def instrument(linked_list: LinkedList, callback: Callable = None) -> Instrumented:
+    if not isinstance(linked_list, Instrumented):
+        cls = type(linked_list)
+        twin = TWINS.get(cls)
+        if twin is None:
+            mixin = (
+                DoublyInstrumented
+                if issubclass(cls, DoublyLinkedList)
+                else Instrumented
+            )
+            twin = TWINS[cls] = type(f"Instrumented{cls.__name__}", (mixin, cls), {})
+        linked_list.__class__ = twin
+        linked_list.reset()
+    linked_list.callback = callback
+    return linked_list
+
+
+def uninstrument(linked_list: Instrumented) -> LinkedList:
+    if isinstance(linked_list, Instrumented):
+        INSTANCES.pop(id(linked_list), None)
+        linked_list.__class__ = type(linked_list).__bases__[-1]
+        for name in ("hops", "allocations", "depth", "calls", "callback"):
+            delattr(linked_list, name)
+    return linked_list
+
+
+def snapshot() -> dict[int, dict]:
+    return {
+        identity: linked_list.snapshot()
+        for identity, linked_list in list(INSTANCES.items())
+    }
+
+
+TWINS.update(
+    {
+        LinkedList: InstrumentedLinkedList,
+        CircularLinkedList: InstrumentedCircularLinkedList,
+        DoublyLinkedList: InstrumentedDoublyLinkedList,
+        CircularDoublyLinkedList: InstrumentedCircularDoublyLinkedList,
+    }
+)
@@ -1,8 +1,59 @@
 from __future__ import annotations
-from typing import Iterable, Self
+import gc
+import operator
+import pickle
+import struct
+import sys
+import threading
+from array import array
+from collections import deque
+from itertools import chain, islice
+from typing import BinaryIO, Callable, Iterable, Iterator, Self, Sequence, Sized
+
+BUILD_CHUNK = 4096
+DUMP_HEADER = struct.Struct("<4sBccQ")
+DUMP_MAGIC = b"LLST"
+DUMP_VERSION = 1
+DUMP_PICKLED = b"\x00"
+DATA = operator.attrgetter("data")
+
+
+class CollectorPause:
+    def __init__(self: Self) -> None:
+        self.lock: threading.Lock = threading.Lock()
+        self.depth: int = 0
+        self.resume: bool = False
+
+    def __enter__(self: Self) -> None:
+        with self.lock:
+            if self.depth == 0:
+                self.resume = gc.isenabled()
+                gc.disable()
+            self.depth += 1
+
+    def __exit__(self: Self, *exc_info) -> None:
+        with self.lock:
+            self.depth -= 1
+            if self.depth == 0 and self.resume:
+                gc.enable()
+
+
+GC_PAUSE = CollectorPause()
+
+
+def ordered(values: Iterable, key: Callable = None, reverse: bool = False) -> Iterator:
+    first, last = True, None
+    for data in values:
+        current = data if key is None else key(data)
+        if not first and (last < current if reverse else current < last):
+            raise ValueError("input is not sorted")
+        first, last = False, current
+        yield data
 
 
 class Node:
+    __slots__ = ("data", "next")
+
     def __init__(self: Self, data: object, next: Node = None) -> None:
         self.data: object = data
         self.next: Node = next
@@ -29,34 +80,284 @@ class Node:
         return self.data != other.data
 
 
+class NodeIterator:
+    __slots__ = ("node", "remaining")
+
+    def __init__(self: Self, node: Node, remaining: int) -> None:
+        self.node: Node = node
+        self.remaining: int = remaining
+
+    def __iter__(self: Self) -> Self:
+        return self
+
+    def __next__(self: Self) -> Node:
+        if self.remaining <= 0:
+            raise StopIteration
+        self.remaining -= 1
+        node = self.node
+        self.node = node.next
+        return node
+
+
+class ValueIterator(NodeIterator):
+    __slots__ = ()
+
+    def __next__(self: Self) -> object:
+        if self.remaining <= 0:
+            raise StopIteration
+        self.remaining -= 1
+        node = self.node
+        self.node = node.next
+        return node.data
+
+
+class ReverseNodeIterator(NodeIterator):
+    __slots__ = ()
+
+    def __next__(self: Self) -> DNode:
+        if self.remaining <= 0:
+            raise StopIteration
+        self.remaining -= 1
+        node = self.node
+        self.node = node.prev
+        return node
+
+
+class ReverseValueIterator(ReverseNodeIterator):
+    __slots__ = ()
+
+    def __next__(self: Self) -> object:
+        if self.remaining <= 0:
+            raise StopIteration
+        self.remaining -= 1
+        node = self.node
+        self.node = node.prev
+        return node.data
+
+
+class LinkedListView:
+    __slots__ = ("source", "key")
+
+    def __init__(self: Self, source: LinkedList | LinkedListView, key: slice) -> None:
+        self.source: LinkedList | LinkedListView = source
+        self.key: slice = key
+
+    def __len__(self: Self) -> int:
+        return len(self.indices())
+
+    def __getitem__(self: Self, key: int | slice) -> LinkedListView | Node:
+        if isinstance(key, slice):
+            return LinkedListView(self, key)
+
+        elif isinstance(key, int):
+            try:
+                return self.linked_list.get(self.indices()[key])
+            except IndexError:
+                raise IndexError("linked list view index out of range") from None
+
+        else:
+            raise TypeError("invalid argument type")
+
+    def __iter__(self: Self) -> Iterator[Node]:
+        return self.linked_list.walk(self.indices())
+
+    def __reversed__(self: Self) -> Iterator[Node]:
+        return self.linked_list.walk(self.indices()[::-1])
+
+    def __str__(self: Self) -> str:
+        return f"LinkedListView{self.to_tuple()}"
+
+    @property
+    def linked_list(self: Self) -> LinkedList:
+        source = self.source
+        while isinstance(source, LinkedListView):
+            source = source.source
+        return source
+
+    def indices(self: Self) -> range:
+        if isinstance(self.source, LinkedListView):
+            return self.source.indices()[self.key]
+        return range(*self.key.indices(len(self.source)))
+
+    def view(
+        self: Self, start: int = None, stop: int = None, step: int = None
+    ) -> LinkedListView:
+        return LinkedListView(self, slice(start, stop, step))
+
+    def values(self: Self, reverse: bool = False) -> Iterator:
+        nodes = reversed(self) if reverse else iter(self)
+        return (node.data for node in nodes)
+
+    def copy(self: Self, type: type = None) -> LinkedList:
+        type = self.linked_list.__class__ if type is None else type
+        return type(self.values())
+
+    def to_list(self: Self) -> list:
+        return list(self.values())
+
+    def to_tuple(self: Self) -> tuple:
+        return tuple(self.values())
+
+    def lazy(self: Self) -> Pipeline:
+        return Pipeline(self)
+
+
+def comparable(other: object) -> bool:
+    if isinstance(other, (str, bytes, bytearray)):
+        return False
+    return isinstance(other, (LinkedList, LinkedListView, Sequence))
+
+
+def chunked(values: Iterable, size: int) -> Iterator[tuple]:
+    values = iter(values)
+    return iter(lambda: tuple(islice(values, size)), ())
+
+
+def windowed(values: Iterable, size: int, step: int) -> Iterator[tuple]:
+    window, countdown = deque(maxlen=size), size
+    for data in values:
+        window.append(data)
+        countdown -= 1
+        if countdown == 0:
+            yield tuple(window)
+            countdown = step
+
+
+class Pipeline:
+    __slots__ = ("source", "stages")
+
+    def __init__(
+        self: Self, source: LinkedList | LinkedListView | Iterable, stages: tuple = ()
+    ) -> None:
+        self.source: LinkedList | LinkedListView | Iterable = source
+        self.stages: tuple = stages
+
+    def __iter__(self: Self) -> Iterator:
+        stages = self.stages
+        if isinstance(self.source, LinkedList) and stages and stages[0][0] == "slice":
+            values = self.span(*stages[0][1:])
+            stages = stages[1:]
+        elif hasattr(self.source, "values"):
+            values = self.source.values()
+        else:
+            values = iter(self.source)
+        for stage, *arguments in stages:
+            if stage == "map":
+                values = map(arguments[0], values)
+            elif stage == "filter":
+                values = filter(arguments[0], values)
+            elif stage == "slice":
+                values = islice(values, *arguments)
+            elif stage == "chunk":
+                values = chunked(values, *arguments)
+            else:
+                values = windowed(values, *arguments)
+        return values
+
+    def __str__(self: Self) -> str:
+        stages = ", ".join(stage for stage, *_ in self.stages)
+        return f"Pipeline({type(self.source).__name__}: {stages})"
+
+    def span(self: Self, start: int, stop: int | None) -> Iterator:
+        size = len(self.source)
+        stop = size if stop is None else min(stop, size)
+        if start >= stop:
+            return iter(())
+        if start == 0:
+            return islice(self.source.values(), stop)
+        return map(DATA, self.source.walk(range(start, stop)))
+
+    def then(self: Self, stage: str, *arguments) -> Pipeline:
+        return Pipeline(self.source, self.stages + ((stage, *arguments),))
+
+    def limit(self: Self, start: int, stop: int | None) -> Pipeline:
+        if self.stages and self.stages[-1][0] == "slice":
+            _, first, last = self.stages[-1]
+            start += first
+            stop = None if stop is None else stop + first
+            if last is not None:
+                start, stop = min(start, last), (
+                    last if stop is None else min(stop, last)
+                )
+            return Pipeline(self.source, self.stages[:-1]).then("slice", start, stop)
+        return self.then("slice", start, stop)
+
+    def map(self: Self, function: Callable[[object], object]) -> Pipeline:
+        return self.then("map", function)
+
+    def filter(self: Self, predicate: Callable[[object], bool]) -> Pipeline:
+        return self.then("filter", predicate)
+
+    def take(self: Self, count: int) -> Pipeline:
+        if count < 0:
+            raise ValueError("count must be non-negative")
+        return self.limit(0, count)
+
+    def skip(self: Self, count: int) -> Pipeline:
+        if count < 0:
+            raise ValueError("count must be non-negative")
+        return self.limit(count, None)
+
+    def chunk(self: Self, size: int) -> Pipeline:
+        if size <= 0:
+            raise ValueError("size must be positive")
+        return self.then("chunk", size)
+
+    def window(self: Self, size: int, step: int = 1) -> Pipeline:
+        if size <= 0 or step <= 0:
+            raise ValueError("size and step must be positive")
+        return self.then("window", size, step)
+
+    def collect(self: Self, type: type = None) -> LinkedList:
+        if type is None:
+            source = self.source
+            if isinstance(source, LinkedListView):
+                source = source.linked_list
+            type = source.__class__ if isinstance(source, LinkedList) else LinkedList
+        return type(iter(self))
+
+    def into(self: Self, sink: LinkedList | Callable[[object], object]) -> object:
+        if isinstance(sink, LinkedList):
+            sink.extend(iter(self))
+        else:
+            deque(map(sink, self), maxlen=0)
+        return sink
+
+    def to_list(self: Self) -> list:
+        return list(self)
+
+    def to_tuple(self: Self) -> tuple:
+        return tuple(self)
+
+
 class LinkedList:
+    slice_views: bool = False
+
     def __init__(self: Self, elements: Iterable = None) -> None:
         self.size: int = 0
         self.head: Node = None
         self.tail: Node = None
-        if elements:
-            for e in elements:
-                self.append(e if not isinstance(elements, LinkedList) else e.data)
+        if elements is not None:
+            self.extend(elements)
 
     def __len__(self: Self) -> int:
         return self.size
 
+    def __contains__(self: Self, data: object) -> bool:
+        node = self.head
+        for _ in range(self.size):
+            if node.data is data or node.data == data:
+                return True
+            node = node.next
+        return False
+
     def __getitem__(self: Self, key: int | slice, type: type = None) -> Self | object:
         type = LinkedList if type is None else type
         if isinstance(key, slice):
-            start = 0 if key.start is None else key.start
-            stop = len(self) if key.stop is None else key.stop
-            step = 1 if key.step is None else key.step
-            linked_list = type()
-            step_count = 0
-            for i, node in enumerate(self):
-                if start <= i < stop:
-                    if step_count % step == 0:
-                        linked_list.insert(node.data)
-                    step_count += 1
-                elif i >= stop:
-                    break
-            return linked_list
+            if self.slice_views:
+                return self.view(key.start, key.stop, key.step)
+            indices = range(*key.indices(len(self)))
+            return type(node.data for node in self.walk(indices))
 
         elif isinstance(key, int):
             return self.get(key)
@@ -65,39 +366,42 @@ class LinkedList:
             raise TypeError("invalid argument type")
 
     def __setitem__(
-        self: Self, key: int | slice, value: object | Node | Iterable | LinkedList
+        self: Self,
+        key: int | slice,
+        value: object | Node | Iterable | LinkedList,
+        type: type = None,
     ) -> None:
+        type = LinkedList if type is None else type
         if isinstance(key, slice):
             if not isinstance(value, Iterable):
                 raise TypeError(
                     "invalid argument type, slice assignment only accepts iterables"
                 )
-            start = 0 if key.start is None else key.start
-            stop = len(self) if key.stop is None else key.stop
-            step = 1 if key.step is None else key.step
-            if step == 1:
-                del self[start:stop]
+            indices = range(*key.indices(len(self)))
+            if indices.step == 1:
+                if len(indices) > 0:
+                    del self[indices.start : indices.stop]
                 self.couple(
-                    value if isinstance(value, LinkedList) else LinkedList(value), start
+                    value if isinstance(value, LinkedList) else type(value),
+                    indices.start,
+                )
+                return
+            values = iter(value)
+            assigned = []
+            for node in self.walk(indices):
+                for data in values:
+                    assigned.append((node, node.data))
+                    node.data = data
+                    break
+                else:
+                    break
+            size = len(assigned) + sum(1 for _ in values)
+            if size != len(indices):
+                for node, data in assigned:
+                    node.data = data
+                raise ValueError(
+                    f"attempt to assign sequence of size {size} to extended slice of size {len(indices)}"
                 )
-            elif step > 1:
-                slice_size = (stop - start) // step + 1 * ((stop - start) % step != 0)
-                if slice_size != len(value):
-                    raise ValueError(
-                        f"attempt to assign sequence of size {len(value)} to extended slice of size {slice_size}"
-                    )
-                step_count = 0
-                value_count = 0
-                for i in range(len(self)):
-                    if start <= i < stop:
-                        if step_count % step == 0:
-                            self[i] = value[value_count]
-                            value_count += 1
-                        step_count += 1
-                    elif i >= stop:
-                        break
-            else:
-                raise ValueError("negative steps are currently not supported")
 
         elif isinstance(key, int):
             self.get(key).data = value.data if isinstance(value, Node) else value
@@ -107,33 +411,24 @@ class LinkedList:
 
     def __delitem__(self: Self, key: int | slice) -> None:
         if isinstance(key, slice):
-            start = 0 if key.start is None else key.start
-            stop = len(self) if key.stop is None else key.stop
-            step = 1 if key.step is None else key.step
-            if step == 1:
-                self.decouple(start, stop)
-            elif step > 1:
-                step_count = 0
-                node, prev = None, None
-                for i in range(len(self)):
-                    node = self.head if node is None else node.next
-                    if start <= i < stop:
-                        if step_count % step == 0:
-                            if node == self.head:
-                                self.head = node.next
-                                if node == self.tail:
-                                    self.tail = None
-                            else:
-                                prev.next = node.next
-                                if node == self.tail:
-                                    self.tail = prev
-                            self.size -= 1
-                        step_count += 1
-                    elif i >= stop:
-                        break
-                    prev = node
-            elif step < 0:
-                raise ValueError("negative steps are currently not supported")
+            indices = range(*key.indices(len(self)))
+            if len(indices) <= 0:
+                return
+            if indices.step == 1:
+                self.decouple(indices.start, indices.stop)
+                return
+            indices = indices if indices.step > 0 else indices[::-1]
+            prev = None if indices[0] == 0 else self.get(indices[0] - 1)
+            node = self.head if prev is None else prev.next
+            for i in range(len(indices)):
+                if i > 0:
+                    for _ in range(indices.step - 1):
+                        prev, node = node, node.next
+                next = node.next
+                self.unlink(prev, node)
+                node = next
+            if self.size == 0:
+                self.head = self.tail = None
 
         elif isinstance(key, int):
             self.pop(key)
@@ -141,56 +436,84 @@ class LinkedList:
         else:
             raise TypeError("invalid argument type")
 
-    def __iter__(self: Self) -> Self:
-        self.iter_node = self.head
-        return self
-
-    def __next__(self: Self) -> Node:
-        if self.iter_node is None:
-            raise StopIteration
-        node = self.iter_node
-        self.iter_node = self.iter_node.next
-        return node
+    def __iter__(self: Self) -> NodeIterator:
+        return NodeIterator(self.head, self.size)
 
     def __str__(self: Self) -> str:
-        return f"LinkedList{tuple([node.data for node in self])}"
+        return f"LinkedList{self.to_tuple()}"
 
-    def __add__(self: Self, item: LinkedList) -> Self:
-        return self.copy().join(item)
+    def __add__(self: Self, item: Iterable | LinkedList, type: type = None) -> Self:
+        type = LinkedList if type is None else type
+        return type(
+            chain(
+                self.values(), item.values() if isinstance(item, LinkedList) else item
+            )
+        )
 
     def __mul__(self: Self, value: int, type: type = None) -> Self:
         type = LinkedList if type is None else type
-        linked_list = type()
-        for _ in range(value):
-            linked_list += self
-        return linked_list
+        return type(chain.from_iterable(self.values() for _ in range(value)))
 
-    def __lt__(self, other) -> bool:
-        for node_self, node_other in zip(self, other):
-            if node_self >= node_other:
-                return False
-        return True
-
-    def __gt__(self, other) -> bool:
-        for node_self, node_other in zip(self, other):
-            if node_self <= node_other:
-                return False
-        return True
-
-    def __eq__(self, other) -> bool:
-        for node_self, node_other in zip(self, other):
-            if node_self != node_other:
-                return False
-        return True
-
-    def __le__(self, other) -> bool:
-        return not self.__gt__(other)
+    def __iadd__(self: Self, item: Iterable | LinkedList) -> Self:
+        self.extend(item)
+        return self
 
-    def __ge__(self, other) -> bool:
-        return not self.__lt__(other)
+    def __imul__(self: Self, value: int) -> Self:
+        if value <= 0:
+            return self.decouple() if len(self) > 0 else self
+        self.extend(chain.from_iterable(self.values() for _ in range(value - 1)))
+        return self
 
-    def __ne__(self, other) -> bool:
-        return not self.__eq__(other)
+    def __lt__(self: Self, other: Iterable) -> bool:
+        return self.compare(other, operator.lt)
+
+    def __gt__(self: Self, other: Iterable) -> bool:
+        return self.compare(other, operator.gt)
+
+    def __eq__(self: Self, other: Iterable) -> bool:
+        if not comparable(other):
+            return NotImplemented
+        return len(self) == len(other) and self.difference(other) is None
+
+    def __le__(self: Self, other: Iterable) -> bool:
+        return self.compare(other, operator.le)
+
+    def __ge__(self: Self, other: Iterable) -> bool:
+        return self.compare(other, operator.ge)
+
+    def __ne__(self: Self, other: Iterable) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __reduce__(self: Self) -> tuple:
+        return type(self), (), None, self.values()
+
+    def compare(self: Self, other: Iterable, operation: Callable) -> bool:
+        if not comparable(other):
+            return NotImplemented
+        difference = self.difference(other)
+        if difference is None:
+            return operation(len(self), len(other))
+        return operation(*difference)
+
+    def difference(self: Self, other: Iterable) -> tuple[object, object] | None:
+        node = self.head
+        if isinstance(other, LinkedList):
+            other_node = other.head
+            for _ in range(min(self.size, other.size)):
+                data, other_data = node.data, other_node.data
+                if data is not other_data and data != other_data:
+                    return data, other_data
+                node, other_node = node.next, other_node.next
+            return None
+        if isinstance(other, LinkedListView):
+            other = other.values()
+        for other_data, _ in zip(other, range(self.size)):
+            data = node.data
+            if data is not other_data and data != other_data:
+                return data, other_data
+            node = node.next
+        return None
 
     def get(self: Self, index: int) -> Node:
         index += len(self) if index < 0 else 0
@@ -201,6 +524,116 @@ class LinkedList:
             return node
         raise IndexError("linked list index out of range")
 
+    def walk(self: Self, indices: range) -> Iterator[Node]:
+        if len(indices) <= 0:
+            return
+        if indices.step < 0:
+            yield from reversed(list(self.walk(indices[::-1])))
+            return
+        node = self.get(indices[0])
+        yield node
+        for _ in range(len(indices) - 1):
+            for _ in range(indices.step):
+                node = node.next
+            yield node
+
+    def view(
+        self: Self, start: int = None, stop: int = None, step: int = None
+    ) -> LinkedListView:
+        return LinkedListView(self, slice(start, stop, step))
+
+    def lazy(self: Self) -> Pipeline:
+        return Pipeline(self)
+
+    def unlink(self: Self, prev: Node, node: Node) -> None:
+        if prev is None:
+            self.head = node.next
+        else:
+            prev.next = node.next
+        if node is self.tail:
+            self.tail = prev
+        self.size -= 1
+
+    def splice(self: Self, prev: Node, next: Node, linked_list: LinkedList) -> None:
+        if prev is None:
+            self.head = linked_list.head
+        else:
+            prev.next = linked_list.head
+        linked_list.tail.next = next
+        if next is None:
+            self.tail = linked_list.tail
+        self.size += linked_list.size
+
+    def close(self: Self) -> None:
+        if self.head is not None:
+            self.tail.next = None
+
+    def insert_many(self: Self, pairs: Iterable[tuple[object, int]]) -> None:
+        size, batches = len(self), {}
+        for data, position in pairs:
+            position += size if position < 0 else 0
+            if position < 0 or position > size:
+                raise IndexError("linked list index out of range")
+            batches.setdefault(position, []).append(data)
+        prev, i = None, 0
+        for position in sorted(batches):
+            for _ in range(position - i):
+                prev = self.head if prev is None else prev.next
+            i = position
+            next = None
+            if position < size:
+                next = self.head if prev is None else prev.next
+            linked_list = self.build(batches[position], len(batches[position]))
+            self.splice(prev, next, linked_list)
+            prev = linked_list.tail
+        self.close()
+
+    def pop_many(self: Self, positions: Iterable[int]) -> list[Node]:
+        size, order = len(self), []
+        for position in positions:
+            position += size if position < 0 else 0
+            if position < 0 or position >= size:
+                raise IndexError("linked list index out of range")
+            order.append(position)
+        targets = sorted(set(order))
+        if len(targets) != len(order):
+            raise ValueError("duplicate positions")
+        removed = {}
+        prev, node, i = None, self.head, 0
+        try:
+            for position in targets:
+                for _ in range(position - i):
+                    prev, node = node, node.next
+                next = node.next
+                self.unlink(prev, node)
+                removed[position] = node
+                node, i = next, position + 1
+        finally:
+            if self.size == 0:
+                self.head = self.tail = None
+            self.close()
+        return [removed[position] for position in order]
+
+    def remove_if(self: Self, predicate: Callable[[object], bool]) -> int:
+        prev, node, removed = None, self.head, 0
+        try:
+            for _ in range(self.size):
+                next = node.next
+                if predicate(node.data):
+                    self.unlink(prev, node)
+                    removed += 1
+                else:
+                    prev = node
+                node = next
+        finally:
+            if self.size == 0:
+                self.head = self.tail = None
+            self.close()
+        return removed
+
+    def keep_if(self: Self, predicate: Callable[[object], bool]) -> int:
+        return self.remove_if(lambda data: not predicate(data))
+
     def insert(self: Self, data: object, position: int) -> None:
         position += self.size if position < 0 else 0
         if position == len(self):
@@ -228,10 +661,94 @@ class LinkedList:
         self.tail.next = node
         self.tail = node
 
-    def extend(self: Self, iterable: Iterable) -> None:
-        self.join(LinkedList(iterable))
+    def extend(self: Self, iterable: Iterable, size_hint: int = None) -> None:
+        if isinstance(iterable, LinkedList):
+            iterable, size_hint = iterable.values(), len(iterable)
+        elif size_hint is None and hasattr(iterable, "__len__"):
+            size_hint = len(iterable)
+        self.join(self.build(iterable, size_hint))
+
+    @staticmethod
+    def build(values: Iterable, size_hint: int = None) -> LinkedList:
+        linked_list = LinkedList()
+        chunk = size_hint if size_hint is not None and size_hint > 0 else BUILD_CHUNK
+        values = iter(values)
+        while batch := list(islice(values, chunk)):
+            with GC_PAUSE:
+                nodes = list(map(Node, batch))
+                for prev, node in zip(nodes, islice(nodes, 1, None)):
+                    prev.next = node
+                if linked_list.tail is None:
+                    linked_list.head = nodes[0]
+                else:
+                    linked_list.tail.next = nodes[0]
+                linked_list.tail = nodes[-1]
+                linked_list.size += len(nodes)
+                chunk = BUILD_CHUNK
+        return linked_list
+
+    @classmethod
+    def from_iterable(cls: type, iterable: Iterable, size_hint: int = None) -> Self:
+        linked_list = cls()
+        linked_list.extend(iterable, size_hint)
+        return linked_list
+
+    @classmethod
+    def from_buffer(cls: type, buffer: object) -> Self:
+        view = memoryview(buffer)
+        if view.ndim != 1:
+            view = view.cast("B").cast(view.format)
+        values = view.tolist()
+        return cls.from_iterable(values, len(values))
+
+    @classmethod
+    def from_sorted(
+        cls: type, iterable: Iterable, key: Callable = None, reverse: bool = False
+    ) -> Self:
+        size_hint = len(iterable) if isinstance(iterable, Sized) else None
+        return cls.from_iterable(ordered(iterable, key, reverse), size_hint)
+
+    def dump(
+        self: Self, file: BinaryIO, typecode: str = None, chunk: int = BUILD_CHUNK
+    ) -> None:
+        kind = DUMP_PICKLED if typecode is None else typecode.encode("ascii")
+        order = b"<" if sys.byteorder == "little" else b">"
+        file.write(DUMP_HEADER.pack(DUMP_MAGIC, DUMP_VERSION, kind, order, self.size))
+        values = self.values()
+        for start in range(0, self.size, chunk):
+            batch = islice(values, min(chunk, self.size - start))
+            if typecode is None:
+                pickle.dump(list(batch), file, pickle.HIGHEST_PROTOCOL)
+            else:
+                array(typecode, list(batch)).tofile(file)
+
+    @classmethod
+    def load(cls: type, file: BinaryIO) -> Self:
+        return cls(cls.read_values(file))
+
+    @staticmethod
+    def read_values(file: BinaryIO) -> Iterator:
+        header = file.read(DUMP_HEADER.size)
+        if len(header) < DUMP_HEADER.size:
+            raise EOFError("truncated linked list header")
+        magic, version, kind, order, size = DUMP_HEADER.unpack(header)
+        if magic != DUMP_MAGIC or version != DUMP_VERSION:
+            raise ValueError("not a linked list dump")
+        swap = order != (b"<" if sys.byteorder == "little" else b">")
+        while size > 0:
+            if kind == DUMP_PICKLED:
+                batch = pickle.load(file)
+            else:
+                batch = array(kind.decode("ascii"))
+                batch.fromfile(file, min(size, BUILD_CHUNK))
+                if swap:
+                    batch.byteswap()
+            size -= len(batch)
+            yield from batch
 
     def join(self: Self, linked_list: LinkedList) -> Self:
+        if len(linked_list) <= 0:
+            return self
         if self.head is None:
             self.head = linked_list.head
         else:
@@ -241,6 +758,8 @@ class LinkedList:
         return self
 
     def couple(self: Self, linked_list: LinkedList, position: int) -> Self:
+        if len(linked_list) <= 0:
+            return self
         if position == len(self):
             return self.join(linked_list)
         if position == 0:
@@ -266,7 +785,7 @@ class LinkedList:
             node = self.head
             self.head = self.head.next
             if len(self) == 0:
-                self.tail = None
+                self.head = self.tail = None
         else:
             prev = self.get(position - 1)
             node = prev.next
@@ -326,12 +845,16 @@ class LinkedList:
             return None
         if not isinstance(data, tuple):
             data = [data]
+        try:
+            data = set(data)
+        except TypeError:
+            pass
         indices = []
         step_count = 0
-        for i, node in enumerate(self):
+        for i, value in enumerate(self.values()):
             if stop <= 0 or nindices <= 0:
                 break
-            if start <= 0 and node.data in data:
+            if start <= 0 and value in data:
                 if skip <= 0:
                     if step_count % step == 0:
                         indices.append(i)
@@ -345,17 +868,59 @@ class LinkedList:
             return None
         return indices if nindices > 0 or len(indices) > 1 else indices[0]
 
+    def count(self: Self, data: object) -> int:
+        count = 0
+        node = self.head
+        for _ in range(self.size):
+            if node.data is data or node.data == data:
+                count += 1
+            node = node.next
+        return count
+
     def copy(self: Self) -> LinkedList:
-        return LinkedList((data for data in self))
+        return LinkedList(self.values())
+
+    def values(self: Self) -> ValueIterator:
+        return ValueIterator(self.head, self.size)
 
     def to_list(self: Self) -> list:
-        return [node.data for node in self]
+        values = []
+        append = values.append
+        node = self.head
+        for _ in range(self.size):
+            append(node.data)
+            node = node.next
+        return values
 
     def to_tuple(self: Self) -> tuple:
-        return tuple(node.data for node in self)
+        return tuple(self.to_list())
 
     def to_set(self: Self) -> set:
-        return set(node.data for node in self)
+        values = set()
+        add = values.add
+        node = self.head
+        for _ in range(self.size):
+            add(node.data)
+            node = node.next
+        return values
+
+    def sizeof(self: Self, deep: bool = False) -> int:
+        size = sys.getsizeof(self) + sys.getsizeof(vars(self))
+        seen = set()
+        node = self.head
+        for _ in range(self.size):
+            size += sys.getsizeof(node)
+            if deep and id(node.data) not in seen:
+                seen.add(id(node.data))
+                size += sys.getsizeof(node.data)
+            node = node.next
+        return size
+
+    def node_sizeof(self: Self, deep: bool = False) -> float:
+        if len(self) <= 0:
+            return 0.0
+        overhead = sys.getsizeof(self) + sys.getsizeof(vars(self))
+        return (self.sizeof(deep) - overhead) / len(self)
 
     def reverse(self: Self, start: int = 0, stop: int = None) -> None:
         if stop is None:
@@ -392,6 +957,72 @@ class LinkedList:
         if starter is not None:
             starter.next = node
 
+    def sort(self: Self, key: Callable = None, reverse: bool = False) -> None:
+        if self.size < 2:
+            return
+        if key is not None:
+            keys = {id(node): key(node.data) for node in self}
+            if reverse:
+                before = lambda node, other: keys[id(other)] > keys[id(node)]
+            else:
+                before = lambda node, other: keys[id(other)] < keys[id(node)]
+        elif reverse:
+            before = lambda node, other: other.data > node.data
+        else:
+            before = lambda node, other: other.data < node.data
+        runs, node, remaining = [], self.head, self.size
+        while remaining > 0:
+            head, tail, length, node = self.run(node, remaining, before)
+            remaining -= length
+            runs.append((head, tail, length))
+            while len(runs) > 1 and runs[-2][2] <= 2 * runs[-1][2]:
+                right = runs.pop()
+                runs.append(self.merge(runs.pop(), right, before))
+        while len(runs) > 1:
+            right = runs.pop()
+            runs.append(self.merge(runs.pop(), right, before))
+        self.head, self.tail, _ = runs[0]
+
+    @staticmethod
+    def run(
+        node: Node, remaining: int, before: Callable
+    ) -> tuple[Node, Node, int, Node]:
+        head = tail = node
+        length, node = 1, node.next
+        if length < remaining and before(head, node):
+            while length < remaining and before(head, node):
+                next = node.next
+                node.next, head = head, node
+                node = next
+                length += 1
+        else:
+            while length < remaining and not before(tail, node):
+                tail, node = node, node.next
+                length += 1
+        tail.next = None
+        return head, tail, length, node
+
+    @staticmethod
+    def merge(
+        left: tuple[Node, Node, int], right: tuple[Node, Node, int], before: Callable
+    ) -> tuple[Node, Node, int]:
+        (node, left_tail, left_length), (other, right_tail, right_length) = left, right
+        if before(node, other):
+            head, other = other, other.next
+        else:
+            head, node = node, node.next
+        tail = head
+        while node is not None and other is not None:
+            if before(node, other):
+                tail.next, tail, other = other, other, other.next
+            else:
+                tail.next, tail, node = node, node, node.next
+        if node is not None:
+            tail.next, tail = node, left_tail
+        else:
+            tail.next, tail = other, right_tail
+        return head, tail, left_length + right_length
+
 
 class CircularLinkedList(LinkedList):
     def __init__(self: Self, elements: Iterable = None):
@@ -407,7 +1038,7 @@ class CircularLinkedList(LinkedList):
     ) -> None:
         if isinstance(key, int):
             return super().__setitem__(key % len(self), value)
-        return super().__setitem__(key, value)
+        return super().__setitem__(key, value, CircularLinkedList)
 
     def __delitem__(self: Self, key: int | slice) -> None:
         if isinstance(key, int):
@@ -417,21 +1048,11 @@ class CircularLinkedList(LinkedList):
         if self.head is not None:
             self.tail.next = self.head
 
-    def __iter__(self: Self) -> Self:
-        self.iter_node = self.head
-        self.i = 0
-        return self
-
-    def __next__(self: Self) -> Node:
-        if self.i >= len(self):
-            raise StopIteration
-        self.i += 1
-        node = self.iter_node
-        self.iter_node = self.iter_node.next
-        return node
-
     def __str__(self: Self) -> str:
-        return f"CircularLinkedList{tuple([node.data for node in self])}"
+        return f"CircularLinkedList{self.to_tuple()}"
+
+    def __add__(self: Self, item: Iterable | LinkedList) -> Self:
+        return super().__add__(item, CircularLinkedList)
 
     def __mul__(self: Self, value: int) -> Self:
         return super().__mul__(value, CircularLinkedList)
@@ -456,6 +1077,10 @@ class CircularLinkedList(LinkedList):
         super().append(data)
         self.tail.next = self.head
 
+    def close(self: Self) -> None:
+        if self.head is not None:
+            self.tail.next = self.head
+
     def join(self: Self, linked_list: LinkedList) -> CircularLinkedList:
         super().join(linked_list)
         if self.head is not None:
@@ -494,14 +1119,21 @@ class CircularLinkedList(LinkedList):
         return self
 
     def copy(self: Self) -> CircularLinkedList:
-        return CircularLinkedList((data for data in self))
+        return CircularLinkedList(self.values())
 
     def reverse(self: Self, start: int = 0, stop: int = None) -> None:
         super().reverse(start, stop)
         self.tail.next = self.head
 
+    def sort(self: Self, key: Callable = None, reverse: bool = False) -> None:
+        super().sort(key, reverse)
+        if self.head is not None:
+            self.tail.next = self.head
+
 
 class DNode(Node):
+    __slots__ = ("prev",)
+
     def __init__(
         self: Self, data: object, prev: DNode = None, next: DNode = None
     ) -> None:
@@ -517,9 +1149,10 @@ class DoublyLinkedList(LinkedList):
         self.size: int = 0
         self.head: DNode = None
         self.tail: DNode = None
-        if elements:
-            for e in elements:
-                self.append(e if not isinstance(elements, LinkedList) else e.data)
+        self.finger: DNode = None
+        self.finger_index: int = 0
+        if elements is not None:
+            self.extend(elements)
 
     def __getitem__(self: Self, key: int | slice) -> Self | object:
         return super().__getitem__(key, DoublyLinkedList)
@@ -527,122 +1160,16 @@ class DoublyLinkedList(LinkedList):
     def __setitem__(
         self: Self, key: int | slice, value: object | Node | Iterable | LinkedList
     ) -> None:
-        if isinstance(key, slice):
-            if not isinstance(value, Iterable):
-                raise TypeError(
-                    "invalid argument type, slice assignment only accepts iterables"
-                )
-            start = 0 if key.start is None else key.start
-            stop = len(self) if key.stop is None else key.stop
-            step = 1 if key.step is None else key.step
-            if step == 1:
-                del self[start:stop]
-                self.couple(
-                    value if isinstance(value, LinkedList) else DoublyLinkedList(value),
-                    start,
-                )
-            else:
-                slice_size = (stop - start) // abs(step) + 1 * (
-                    (stop - start) % abs(step) != 0
-                )
-                if slice_size != len(value):
-                    raise ValueError(
-                        f"attempt to assign sequence of size {len(value)} to extended slice of size {slice_size}"
-                    )
-                step_count = 0
-                value_count = 0
-                if step > 1:
-                    for i in range(len(self)):
-                        if start <= i < stop:
-                            if step_count % step == 0:
-                                self[i] = value[value_count]
-                                value_count += 1
-                            step_count += 1
-                        elif i >= stop:
-                            break
-                elif step < 0:
-                    node = self[stop - 1]
-                    for _ in range(start, stop):
-                        if step_count % abs(step) == 0:
-                            node.data = value[value_count]
-                            value_count += 1
-                        step_count += 1
-                        node = node.prev
-                        if node is None:
-                            break
-
-        elif isinstance(key, int):
-            self.get(key).data = value.data if isinstance(value, Node) else value
-
-        else:
-            raise TypeError("invalid argument type")
-
-    def __delitem__(self: Self, key: int | slice) -> None:
-        if isinstance(key, slice):
-            start = 0 if key.start is None else key.start
-            stop = len(self) if key.stop is None else key.stop
-            step = 1 if key.step is None else key.step
-            if step == 1:
-                self.decouple(start, stop)
-            elif step > 1:
-                step_count = 0
-                node = self[start]
-                for _ in range(start, stop):
-                    if step_count % step == 0:
-                        if node == self.head:
-                            self.head = node.next
-                            if self.head is not None:
-                                self.head.prev = None
-                            if node == self.tail:
-                                self.tail = None
-                        elif node == self.tail:
-                            self.tail = node.prev
-                            if self.tail is not None:
-                                self.tail.next = None
-                        else:
-                            node.prev.next = node.next
-                            node.next.prev = node.prev
-                            if node == self.tail:
-                                self.tail = node.prev
-                        self.size -= 1
-                    node = node.next
-                    step_count += 1
-                    if node is None:
-                        break
-            elif step < 0:
-                step_count = 0
-                node = self[stop - 1]
-                for i in range(start, stop):
-                    if step_count % abs(step) == 0:
-                        if node == self.tail:
-                            self.tail = node.prev
-                            if self.tail is not None:
-                                self.tail.next = None
-                            if node == self.head:
-                                self.head = None
-                        elif node == self.head:
-                            self.head = node.next
-                            if self.head is not None:
-                                self.head.prev = None
-                        else:
-                            node.prev.next = node.next
-                            node.next.prev = node.prev
-                            if node == self.head:
-                                self.head = node.next
-                        self.size -= 1
-                    node = node.prev
-                    step_count += 1
-                    if node is None:
-                        break
-
-        elif isinstance(key, int):
-            self.pop(key)
+        return super().__setitem__(key, value, DoublyLinkedList)
 
-        else:
-            raise TypeError("invalid argument type")
+    def __reversed__(self: Self) -> ReverseNodeIterator:
+        return ReverseNodeIterator(self.tail, self.size)
 
     def __str__(self: Self) -> str:
-        return f"DoublyLinkedList{tuple([node.data for node in self])}"
+        return f"DoublyLinkedList{self.to_tuple()}"
+
+    def __add__(self: Self, item: Iterable | LinkedList) -> Self:
+        return super().__add__(item, DoublyLinkedList)
 
     def __mul__(self: Self, value: int) -> None:
         return super().__mul__(value, DoublyLinkedList)
@@ -655,7 +1182,6 @@ class DoublyLinkedList(LinkedList):
             return self.append(data)
         if position < 0 or position > len(self):
             raise IndexError("linked list index out of range")
-        self.size += 1
         node = DNode(data)
         if position == 0:
             if not self.head:
@@ -668,6 +1194,8 @@ class DoublyLinkedList(LinkedList):
             prev = self.get(position - 1)
             node.prev, node.next = prev, prev.next
             prev.next, node.next.prev = node, node
+        self.size += 1
+        self.invalidate_finger(position)
 
     def append(self: Self, data: object) -> None:
         self.size += 1
@@ -678,12 +1206,33 @@ class DoublyLinkedList(LinkedList):
             self.head = node
         self.tail = node
 
+    @staticmethod
+    def build(values: Iterable, size_hint: int = None) -> DoublyLinkedList:
+        linked_list = DoublyLinkedList()
+        chunk = size_hint if size_hint is not None and size_hint > 0 else BUILD_CHUNK
+        values = iter(values)
+        while batch := list(islice(values, chunk)):
+            with GC_PAUSE:
+                nodes = list(map(DNode, batch))
+                for prev, node in zip(nodes, islice(nodes, 1, None)):
+                    prev.next, node.prev = node, prev
+                if linked_list.tail is None:
+                    linked_list.head = nodes[0]
+                else:
+                    linked_list.tail.next, nodes[0].prev = nodes[0], linked_list.tail
+                linked_list.tail = nodes[-1]
+                linked_list.size += len(nodes)
+                chunk = BUILD_CHUNK
+        return linked_list
+
     def join(self: Self, linked_list: LinkedList) -> Self:
         linked_list = (
             DoublyLinkedList(linked_list)
             if not isinstance(linked_list, DoublyLinkedList)
             else linked_list
         )
+        if len(linked_list) <= 0:
+            return self
         if self.head is None:
             self.head = linked_list.head
         else:
@@ -699,6 +1248,8 @@ class DoublyLinkedList(LinkedList):
             if not isinstance(linked_list, DoublyLinkedList)
             else linked_list
         )
+        if len(linked_list) <= 0:
+            return self
         if position == len(self):
             return self.join(linked_list)
         if position == 0:
@@ -712,6 +1263,7 @@ class DoublyLinkedList(LinkedList):
             linked_list.head.prev = node
             node.next = linked_list.head
         self.size += linked_list.size
+        self.invalidate_finger(position)
         return self
 
     def pop(self: Self, position: int = None) -> Node:
@@ -722,23 +1274,25 @@ class DoublyLinkedList(LinkedList):
         position += len(self) if position < 0 else 0
         if position < 0 or position >= len(self):
             raise IndexError("linked list index out of range")
-        self.size -= 1
         if position == 0:
             node = self.head
             self.head = self.head.next
+            self.size -= 1
             if len(self) == 0:
-                self.tail = None
+                self.head = self.tail = None
             else:
                 self.head.prev = None
         else:
             prev = self.get(position - 1)
             node = prev.next
+            self.size -= 1
             if position == len(self):
                 self.tail = prev
                 prev.next = None
             else:
                 node.next.prev = prev
                 prev.next = node.next
+        self.invalidate_finger(position)
         return node
 
     def decouple(self, start: int = 0, stop: int = None) -> Self:
@@ -754,6 +1308,7 @@ class DoublyLinkedList(LinkedList):
             self.head = None
             self.tail = None
             self.size = 0
+            self.finger = None
             return self
         if start == 0:
             self.head = self.get(stop)
@@ -763,15 +1318,22 @@ class DoublyLinkedList(LinkedList):
         else:
             node = self.get(start - 1)
             node.next = self.get(stop - 1).next
-            node.next.prev = node
-            if node.next is None:
+            if stop == len(self):
                 self.tail = node
+            else:
+                node.next.prev = node
 
         self.size -= stop - start
+        self.invalidate_finger(start)
         return self
 
     def copy(self: Self) -> DoublyLinkedList:
-        return DoublyLinkedList((data for data in self))
+        return DoublyLinkedList(self.values())
+
+    def values(self: Self, reverse: bool = False) -> ValueIterator:
+        if reverse:
+            return ReverseValueIterator(self.tail, self.size)
+        return ValueIterator(self.head, self.size)
 
     def reverse(self: Self, start: int = 0, stop: int = None) -> None:
         if stop is None:
@@ -799,6 +1361,7 @@ class DoublyLinkedList(LinkedList):
                 else:
                     break
             i += 1
+        node = None if stop == len(self) else node
 
         if prev_starter is not None:
             prev_starter.next = node.prev if node is not None else last
@@ -811,6 +1374,134 @@ class DoublyLinkedList(LinkedList):
             node.prev = starter
 
         self.head.prev = None
+        self.invalidate_finger(start)
+
+    def sort(self: Self, key: Callable = None, reverse: bool = False) -> None:
+        LinkedList.sort(self, key, reverse)
+        prev, node = None, self.head
+        for _ in range(self.size):
+            node.prev, prev, node = prev, node, node.next
+        self.finger = None
+
+    def get(self: Self, index: int) -> DNode:
+        index += len(self) if index < 0 else 0
+        if index < 0 or index >= len(self):
+            raise IndexError("linked list index out of range")
+        if index <= len(self) - 1 - index:
+            node, distance = self.head, index
+        else:
+            node, distance = self.tail, index - len(self) + 1
+        if self.finger is not None and abs(index - self.finger_index) < abs(distance):
+            node, distance = self.finger, index - self.finger_index
+        if distance > 0:
+            for _ in range(distance):
+                node = node.next
+        else:
+            for _ in range(-distance):
+                node = node.prev
+        self.finger, self.finger_index = node, index
+        return node
+
+    def walk(self: Self, indices: range) -> Iterator[DNode]:
+        if len(indices) <= 0 or indices.step > 0:
+            yield from super().walk(indices)
+            return
+        node = self.get(indices[0])
+        yield node
+        for _ in range(len(indices) - 1):
+            for _ in range(-indices.step):
+                node = node.prev
+            yield node
+
+    def unlink(self: Self, prev: DNode, node: DNode) -> None:
+        if node is not self.tail:
+            node.next.prev = prev
+        super().unlink(prev, node)
+        self.finger = None
+
+    def splice(self: Self, prev: DNode, next: DNode, linked_list: LinkedList) -> None:
+        super().splice(prev, next, linked_list)
+        linked_list.head.prev = prev
+        if next is not None:
+            next.prev = linked_list.tail
+        self.finger = None
+
+    def invalidate_finger(self: Self, position: int = 0) -> None:
+        if self.finger is not None and self.finger_index >= position:
+            self.finger = None
+
+    def owns(self: Self, node: DNode) -> bool:
+        return any(member is node for member in self)
+
+    def check_node(self: Self, node: DNode, validate: bool) -> None:
+        if validate and not self.owns(node):
+            raise ValueError("node does not belong to this linked list")
+
+    def close(self: Self) -> None:
+        if self.head is not None:
+            self.head.prev = self.tail.next = None
+
+    def link_node(self: Self, node: DNode, prev: DNode, next: DNode) -> DNode:
+        node.prev, node.next = prev, next
+        if prev is None:
+            self.head = node
+        else:
+            prev.next = node
+        if next is None:
+            self.tail = node
+        else:
+            next.prev = node
+        self.size += 1
+        self.finger = None
+        self.close()
+        return node
+
+    def insert_after(
+        self: Self, node: DNode, data: object, validate: bool = False
+    ) -> DNode:
+        self.check_node(node, validate)
+        next = None if node is self.tail else node.next
+        return self.link_node(DNode(data), node, next)
+
+    def insert_before(
+        self: Self, node: DNode, data: object, validate: bool = False
+    ) -> DNode:
+        self.check_node(node, validate)
+        prev = None if node is self.head else node.prev
+        return self.link_node(DNode(data), prev, node)
+
+    def remove_node(self: Self, node: DNode, validate: bool = False) -> DNode:
+        self.check_node(node, validate)
+        if self.size == 1:
+            self.head = self.tail = None
+        else:
+            if node is self.head:
+                self.head = node.next
+            else:
+                node.prev.next = node.next
+            if node is self.tail:
+                self.tail = node.prev
+            else:
+                node.next.prev = node.prev
+        node.prev = node.next = None
+        self.size -= 1
+        self.finger = None
+        self.close()
+        return node
+
+    def move_to_front(self: Self, node: DNode, validate: bool = False) -> DNode:
+        self.check_node(node, validate)
+        if node is self.head:
+            return node
+        self.remove_node(node)
+        return self.link_node(node, None, self.head)
+
+    def move_to_back(self: Self, node: DNode, validate: bool = False) -> DNode:
+        self.check_node(node, validate)
+        if node is self.tail:
+            return node
+        self.remove_node(node)
+        return self.link_node(node, self.tail, None)
 
 
 class CircularDoublyLinkedList(DoublyLinkedList, CircularLinkedList):
@@ -828,8 +1519,8 @@ class CircularDoublyLinkedList(DoublyLinkedList, CircularLinkedList):
         self: Self, key: int | slice, value: object | Iterable | LinkedList
     ) -> None:
         if isinstance(key, int):
-            return DoublyLinkedList.__setitem__(self, key % len(self), value)
-        return DoublyLinkedList.__setitem__(self, key, value)
+            return LinkedList.__setitem__(self, key % len(self), value)
+        return LinkedList.__setitem__(self, key, value, CircularDoublyLinkedList)
 
     def __delitem__(self: Self, key: int | slice) -> None:
         if isinstance(key, int):
@@ -839,18 +1530,18 @@ class CircularDoublyLinkedList(DoublyLinkedList, CircularLinkedList):
         if self.head is not None:
             self.head.prev, self.tail.next = self.tail, self.head
 
-    def __iter__(self: Self) -> Self:
-        return CircularLinkedList.__iter__(self)
-
-    def __next__(self: Self) -> DNode:
-        return CircularLinkedList.__next__(self)
-
     def __str__(self: Self) -> str:
-        return f"CircularDoublyLinkedList{tuple([node.data for node in self])}"
+        return f"CircularDoublyLinkedList{self.to_tuple()}"
+
+    def __add__(self: Self, item: Iterable | LinkedList) -> Self:
+        return LinkedList.__add__(self, item, CircularDoublyLinkedList)
 
     def __mul__(self: Self, value: int) -> None:
         return LinkedList.__mul__(self, value, CircularDoublyLinkedList)
 
+    def get(self: Self, index: int) -> DNode:
+        return DoublyLinkedList.get(self, index % len(self))
+
     def insert(self: Self, data: object, position: int = None) -> None:
         if position is None:
             return self.append(data)
@@ -908,8 +1599,17 @@ class CircularDoublyLinkedList(DoublyLinkedList, CircularLinkedList):
         return self
 
     def copy(self: Self) -> CircularDoublyLinkedList:
-        return CircularDoublyLinkedList((data for data in self))
+        return CircularDoublyLinkedList(self.values())
 
     def reverse(self: Self, start: int = 0, stop: int = None) -> None:
         DoublyLinkedList.reverse(self, start, stop)
         self.tail.next, self.head.prev = self.head, self.tail
+
+    def sort(self: Self, key: Callable = None, reverse: bool = False) -> None:
+        DoublyLinkedList.sort(self, key, reverse)
+        if self.head is not None:
+            self.tail.next, self.head.prev = self.head, self.tail
+
+    def close(self: Self) -> None:
+        if self.head is not None:
+            self.head.prev, self.tail.next = self.tail, self.head
@@ -0,0 +1,284 @@
+from __future__ import annotations
+import os
+import pickle
+import struct
+import tempfile
+import weakref
+from array import array
+from mmap import mmap
+from typing import BinaryIO, Iterable, Self
+
+from array_linked_list import NIL, ArrayDoublyLinkedList, ArrayLinkedList
+from cache import MISSING, LRUCache
+
+MAGIC = 0x50414D4C4C
+VERSION = 3
+HEADER_FIELDS = 64
+HEADER_BYTES = HEADER_FIELDS * 8
+FREE_LISTS = 11
+OFFSET, LENGTH, NEXT = range(3)
+NO_PAYLOAD = -1
+MIN_EXTENT = 16
+FREE_LINK = struct.Struct("q")
+
+
+def extent_size(length: int) -> int:
+    return max(MIN_EXTENT, 1 << (length - 1).bit_length())
+
+
+def extent_class(size: int) -> int:
+    return (size // MIN_EXTENT).bit_length() - 1
+
+
+class HeaderField:
+    def __init__(self: Self, index: int) -> None:
+        self.index: int = index
+
+    def __get__(self: Self, linked_list: MappedStorage, owner: type = None) -> int:
+        if linked_list is None:
+            return self
+        return linked_list.header[self.index]
+
+    def __set__(self: Self, linked_list: MappedStorage, value: int) -> None:
+        linked_list.header[self.index] = value
+
+
+class RecordColumn:
+    __slots__ = ("linked_list", "field")
+
+    def __init__(self: Self, linked_list: MappedStorage, field: int) -> None:
+        self.linked_list: MappedStorage = linked_list
+        self.field: int = field
+
+    def __len__(self: Self) -> int:
+        return self.linked_list.reserved
+
+    def __getitem__(self: Self, slot: int) -> int:
+        linked_list = self.linked_list
+        return linked_list.records[slot * linked_list.width + self.field]
+
+    def __setitem__(self: Self, slot: int, value: int) -> None:
+        linked_list = self.linked_list
+        linked_list.records[slot * linked_list.width + self.field] = value
+
+
+class PayloadColumn:
+    __slots__ = ("linked_list",)
+
+    def __init__(self: Self, linked_list: MappedStorage) -> None:
+        self.linked_list: MappedStorage = linked_list
+
+    def __len__(self: Self) -> int:
+        return self.linked_list.reserved
+
+    def __getitem__(self: Self, slot: int) -> object:
+        return self.linked_list.read(slot)
+
+    def __setitem__(self: Self, slot: int, data: object) -> None:
+        self.linked_list.write(slot, data)
+
+
+def release(handles: list, paths: tuple[str, ...]) -> None:
+    map, *views, file, heap = handles
+    for view in reversed(views):
+        view.release()
+    map.close()
+    file.close()
+    heap.close()
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class MappedStorage:
+    size = HeaderField(2)
+    head_slot = HeaderField(3)
+    tail_slot = HeaderField(4)
+    free_slot = HeaderField(5)
+    used = HeaderField(6)
+    reserved = HeaderField(7)
+    heap_end = HeaderField(8)
+    record_width = HeaderField(9)
+    free_classes = HeaderField(10)
+
+    def __init__(
+        self: Self,
+        elements: Iterable = None,
+        capacity: int = 16,
+        path: str = None,
+        cache_size: int = 1024,
+    ) -> None:
+        temporary = path is None
+        if temporary:
+            descriptor, path = tempfile.mkstemp(suffix=".llmap")
+            os.close(descriptor)
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        if exists and not os.path.exists(path + ".heap"):
+            raise FileNotFoundError(f"{path} has no payload heap at {path}.heap")
+        mode = "r+b" if exists else "w+b"
+        self.path: str = path
+        self.file: BinaryIO = open(path, mode, buffering=0)
+        self.heap: BinaryIO = open(path + ".heap", mode)
+        self.cache: LRUCache = LRUCache(cache_size)
+        self.width: int = NEXT + len(self.links)
+        self.payloads: PayloadColumn = PayloadColumn(self)
+        for field, name in enumerate(self.links, NEXT):
+            setattr(self, name, RecordColumn(self, field))
+        if not exists:
+            self.file.truncate(HEADER_BYTES)
+        self.handles: list = []
+        self.remap()
+        paths = (path, path + ".heap") if temporary else ()
+        self.finalizer: weakref.finalize = weakref.finalize(
+            self, release, self.handles, paths
+        )
+        if exists:
+            if self.header[0] != MAGIC or self.header[1] != VERSION:
+                self.finalizer()
+                raise ValueError(f"{path} is not a mapped linked list file")
+            if self.record_width != self.width:
+                self.finalizer()
+                raise ValueError(f"{path} was not written by {type(self).__name__}")
+        else:
+            self.header[0], self.header[1] = MAGIC, VERSION
+            self.record_width = self.width
+            self.size, self.used, self.reserved, self.heap_end = 0, 0, 0, 0
+            self.free_classes = 0
+            self.header[FREE_LISTS:] = array("q", [NIL]) * (HEADER_FIELDS - FREE_LISTS)
+            self.head_slot = self.tail_slot = self.free_slot = NIL
+        self.reserve(capacity)
+        if elements:
+            self.join(elements)
+
+    def __enter__(self: Self) -> Self:
+        return self
+
+    def __exit__(self: Self, *exc_info) -> None:
+        self.close()
+
+    def remap(self: Self) -> None:
+        self.map: mmap = mmap(self.file.fileno(), 0)
+        self.view: memoryview = memoryview(self.map)
+        self.header: memoryview = self.view[:HEADER_BYTES].cast("q")
+        self.records: memoryview = self.view[HEADER_BYTES:].cast("q")
+        self.handles[:] = self.map, self.view, self.header, self.records
+        self.handles += self.file, self.heap
+
+    def unmap(self: Self) -> None:
+        self.records.release()
+        self.header.release()
+        self.view.release()
+        self.map.close()
+
+    def reserve(self: Self, capacity: int) -> None:
+        if capacity <= self.reserved:
+            return
+        self.unmap()
+        self.file.truncate(HEADER_BYTES + capacity * self.width * 8)
+        self.remap()
+        self.reserved = capacity
+
+    def read(self: Self, slot: int) -> object:
+        data = self.cache.get(slot, MISSING)
+        if data is not MISSING:
+            return data
+        base = slot * self.width
+        length = self.records[base + LENGTH]
+        if length == NO_PAYLOAD:
+            return None
+        self.heap.seek(self.records[base + OFFSET])
+        data = pickle.loads(self.heap.read(length))
+        self.cache.put(slot, data)
+        return data
+
+    def write(self: Self, slot: int, data: object) -> None:
+        base = slot * self.width
+        length = self.records[base + LENGTH]
+        if length > 0:
+            self.free(self.records[base + OFFSET], extent_size(length))
+        if data is None:
+            self.records[base + LENGTH] = NO_PAYLOAD
+            self.cache.pop(slot, None)
+            return
+        payload = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+        offset = self.claim(extent_size(len(payload)))
+        if self.heap.tell() != offset:
+            self.heap.seek(offset)
+        self.heap.write(payload)
+        self.records[base + OFFSET], self.records[base + LENGTH] = offset, len(payload)
+        self.cache.put(slot, data)
+
+    def claim(self: Self, size: int) -> int:
+        first = extent_class(size)
+        classes = self.free_classes >> first
+        if classes == 0:
+            offset = self.heap_end
+            self.heap_end = offset + size
+            return offset
+        index = first + (classes & -classes).bit_length() - 1
+        offset = self.header[FREE_LISTS + index]
+        self.heap.seek(offset)
+        (next,) = FREE_LINK.unpack(self.heap.read(FREE_LINK.size))
+        self.header[FREE_LISTS + index] = next
+        if next == NIL:
+            self.free_classes &= ~(1 << index)
+        larger = MIN_EXTENT << index
+        while larger > size:
+            larger //= 2
+            self.free(offset + larger, larger)
+        return offset
+
+    def free(self: Self, offset: int, size: int) -> None:
+        if offset + size == self.heap_end:
+            self.heap_end = offset
+            return
+        index = extent_class(size)
+        self.heap.seek(offset)
+        self.heap.write(FREE_LINK.pack(self.header[FREE_LISTS + index]))
+        self.header[FREE_LISTS + index] = offset
+        self.free_classes |= 1 << index
+
+    def live_extents(self: Self) -> list[tuple[int, int, int]]:
+        extents = []
+        for slot in range(self.used):
+            base = slot * self.width
+            length = self.records[base + LENGTH]
+            if length > 0:
+                extents.append((self.records[base + OFFSET], length, slot))
+        extents.sort()
+        return extents
+
+    def compact(self: Self) -> None:
+        end = 0
+        for offset, length, slot in self.live_extents():
+            if offset != end:
+                self.heap.seek(offset)
+                payload = self.heap.read(length)
+                self.heap.seek(end)
+                self.heap.write(payload)
+                self.records[slot * self.width + OFFSET] = end
+            end += extent_size(length)
+        self.free_classes = 0
+        self.header[FREE_LISTS:] = array("q", [NIL]) * (HEADER_FIELDS - FREE_LISTS)
+        self.heap_end = end
+        self.heap.truncate(end)
+
+    def flush(self: Self) -> None:
+        self.heap.flush()
+        self.map.flush()
+
+    def close(self: Self) -> None:
+        if not self.finalizer.alive:
+            return
+        self.flush()
+        self.finalizer()
+
+
+class MappedLinkedList(MappedStorage, ArrayLinkedList):
+    pass
+
+
+class MappedDoublyLinkedList(MappedStorage, ArrayDoublyLinkedList):
+    pass
@@ -0,0 +1,159 @@
+from __future__ import annotations
+import sys
+from typing import Callable, Iterable, Self
+
+import numpy as np
+
+from array_linked_list import NIL, ArrayDoublyLinkedList, ArrayLinkedList
+
+
+class NumpyStorage:
+    def __init__(
+        self: Self, elements: Iterable = None, dtype: object = None, capacity: int = 16
+    ) -> None:
+        if elements is not None and not isinstance(elements, np.ndarray):
+            elements = np.asarray(list(self.source_values(elements)), dtype)
+        if dtype is None:
+            dtype = np.float64 if elements is None else elements.dtype
+        self.dtype: np.dtype = np.dtype(dtype)
+        self.live: np.ndarray = np.zeros(0, bool)
+        if isinstance(elements, np.ndarray):
+            super().__init__(None, max(capacity, len(elements)))
+            self.load(elements)
+        else:
+            super().__init__(elements, capacity)
+
+    def __getitem__(self: Self, key: int | slice) -> Self | object:
+        if isinstance(key, slice):
+            return type(self)(self.to_numpy()[key], self.dtype)
+        return super().__getitem__(key)
+
+    def __delitem__(self: Self, key: int | slice) -> None:
+        if isinstance(key, slice) and key.step not in (None, 1):
+            self.load(np.delete(self.to_numpy(), np.arange(len(self))[key]))
+            return
+        super().__delitem__(key)
+
+    def __mul__(self: Self, value: int) -> Self:
+        return type(self)(np.tile(self.to_numpy(), max(value, 0)), self.dtype)
+
+    @classmethod
+    def from_numpy(cls: type, values: np.ndarray) -> Self:
+        return cls(np.asarray(values))
+
+    def reserve(self: Self, capacity: int) -> None:
+        extra = capacity - len(self.payloads)
+        if extra <= 0:
+            return
+        self.payloads = np.concatenate(
+            (np.asarray(self.payloads, self.dtype), np.zeros(extra, self.dtype))
+        )
+        self.live = np.concatenate((self.live, np.zeros(extra, bool)))
+        for name in self.links:
+            links = np.asarray(getattr(self, name), np.int64)
+            setattr(self, name, np.concatenate((links, np.full(extra, NIL))))
+
+    def allocate(self: Self, data: object) -> int:
+        slot = super().allocate(data)
+        self.live[slot] = True
+        return slot
+
+    def release(self: Self, slot: int) -> object:
+        data = self.payloads[slot].item()
+        self.live[slot] = False
+        self.next_slots[slot] = self.free_slot
+        self.free_slot = slot
+        return data
+
+    def load(self: Self, values: Iterable) -> None:
+        values = np.asarray(values, self.dtype)
+        size = len(values)
+        self.reserve(size)
+        self.payloads[:size] = values
+        self.live[:] = False
+        self.live[:size] = True
+        for name in self.links:
+            getattr(self, name)[:] = NIL
+        if size > 0:
+            self.next_slots[: size - 1] = np.arange(1, size)
+        self.used, self.free_slot, self.size = size, NIL, size
+        self.head_slot, self.tail_slot = (0, size - 1) if size > 0 else (NIL, NIL)
+
+    def order(self: Self) -> np.ndarray:
+        size, used = self.size, self.used
+        if size == 0:
+            return np.zeros(0, np.int64)
+        if (
+            used == size
+            and self.head_slot == 0
+            and np.array_equal(self.next_slots[: size - 1], np.arange(1, size))
+        ):
+            return np.arange(size)
+        live = self.live[:used]
+        successors = self.next_slots[:used].copy()
+        terminal = (successors == NIL) | ~live
+        successors[terminal] = np.flatnonzero(terminal)
+        ranks = np.where(terminal, 0, 1)
+        while True:
+            jumped = successors[successors]
+            if np.array_equal(jumped, successors):
+                break
+            ranks = ranks + ranks[successors]
+            successors = jumped
+        order = np.empty(size, np.int64)
+        order[size - 1 - ranks[live]] = np.flatnonzero(live)
+        return order
+
+    def compact(self: Self) -> None:
+        self.load(self.to_numpy())
+
+    def to_numpy(self: Self) -> np.ndarray:
+        return self.payloads[self.order()]
+
+    def to_list(self: Self) -> list:
+        return self.to_numpy().tolist()
+
+    def copy(self: Self) -> Self:
+        return type(self)(self.to_numpy(), self.dtype)
+
+    def sum(self: Self) -> object:
+        return self.payloads[self.live].sum()
+
+    def min(self: Self) -> object:
+        return self.payloads[self.live].min()
+
+    def max(self: Self) -> object:
+        return self.payloads[self.live].max()
+
+    def map(self: Self, function: Callable, inplace: bool = False) -> Self:
+        if not inplace:
+            return type(self)(np.asarray(function(self.to_numpy())))
+        self.payloads[self.live] = function(self.payloads[self.live])
+        return self
+
+    def delete_where(self: Self, mask: np.ndarray | Callable) -> int:
+        values = self.to_numpy()
+        mask = np.asarray(mask(values) if callable(mask) else mask, bool)
+        if mask.shape != values.shape:
+            raise ValueError(
+                f"mask of shape {mask.shape} does not match linked list of size {len(self)}"
+            )
+        removed = int(mask.sum())
+        if removed > 0:
+            self.load(values[~mask])
+        return removed
+
+    def sizeof(self: Self, deep: bool = False) -> int:
+        size = sys.getsizeof(self) + sys.getsizeof(vars(self))
+        size += sys.getsizeof(self.payloads) + sys.getsizeof(self.live)
+        return size + sum(sys.getsizeof(links) for links in self.link_arrays())
+
+
+class NumpyLinkedList(NumpyStorage, ArrayLinkedList):
+    pass
+
+
+class NumpyDoublyLinkedList(NumpyStorage, ArrayDoublyLinkedList):
+    def load(self: Self, values: Iterable) -> None:
+        super().load(values)
+        self.prev_slots[1 : self.size] = np.arange(self.size - 1)
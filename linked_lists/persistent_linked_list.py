@@ -0,0 +1,227 @@
+from __future__ import annotations
+from typing import Callable, Iterable, Self
+
+from hashed_linked_list import Frozen
+from linked_list import LinkedList, Node
+
+
+class PersistentLinkedList(Frozen, LinkedList):
+    def __getitem__(self: Self, key: int | slice) -> Self | object:
+        if isinstance(key, slice) and not self.slice_views:
+            indices = range(*key.indices(len(self)))
+            if indices.step == 1 and indices.stop == len(self) and len(indices) > 0:
+                return self.share(self.get(indices.start), self.tail, len(indices))
+        return super().__getitem__(key)
+
+    def __str__(self: Self) -> str:
+        return f"PersistentLinkedList{self.to_tuple()}"
+
+    @classmethod
+    def share(cls: type, head: Node, tail: Node, size: int) -> Self:
+        linked_list = cls()
+        if size > 0:
+            linked_list.head, linked_list.tail, linked_list.size = head, tail, size
+        return linked_list
+
+    def copy_prefix(self: Self, count: int) -> tuple[Node, Node, Node]:
+        head = prev = None
+        node = self.head
+        for _ in range(count):
+            copy = Node(node.data)
+            if prev is None:
+                head = copy
+            else:
+                prev.next = copy
+            prev, node = copy, node.next
+        return head, prev, node
+
+    def attach(self: Self, head: Node, last: Node, node: Node) -> Node:
+        if last is None:
+            return node
+        last.next = node
+        return head
+
+    def normalize(self: Self, position: int, size: int) -> int:
+        position += size if position < 0 else 0
+        if position < 0 or position >= size:
+            raise IndexError("linked list index out of range")
+        return position
+
+    def copy(self: Self) -> Self:
+        return self
+
+    def thaw(self: Self) -> CopyOnWriteLinkedList:
+        return CopyOnWriteLinkedList.share(self.head, self.tail, self.size)
+
+    def prepend(self: Self, data: object) -> Self:
+        node = Node(data, self.head)
+        return self.share(node, self.tail or node, self.size + 1)
+
+    def rest(self: Self) -> Self:
+        if self.size <= 0:
+            raise IndexError("rest of empty linked list")
+        return self.share(self.head.next, self.tail, self.size - 1)
+
+    def updated(self: Self, position: int, data: object) -> Self:
+        position = self.normalize(position, self.size)
+        head, last, node = self.copy_prefix(position)
+        copy = Node(data, node.next)
+        tail = copy if node is self.tail else self.tail
+        return self.share(self.attach(head, last, copy), tail, self.size)
+
+    def inserted(self: Self, data: object, position: int) -> Self:
+        position = self.normalize(position, self.size + 1)
+        head, last, node = self.copy_prefix(position)
+        copy = Node(data, node)
+        tail = copy if node is None else self.tail
+        return self.share(self.attach(head, last, copy), tail, self.size + 1)
+
+    def removed(self: Self, position: int = None) -> Self:
+        position = self.size - 1 if position is None else position
+        position = self.normalize(position, self.size)
+        head, last, node = self.copy_prefix(position)
+        tail = last if node is self.tail else self.tail
+        return self.share(self.attach(head, last, node.next), tail, self.size - 1)
+
+    def appended(self: Self, data: object) -> Self:
+        return self.inserted(data, self.size)
+
+
+class CopyOnWriteLinkedList(LinkedList):
+    def __init__(self: Self, elements: Iterable = None) -> None:
+        self.private: int = 0
+        super().__init__(elements)
+        self.private = self.size
+
+    def __getitem__(self: Self, key: int | slice) -> Self | object:
+        if isinstance(key, slice) and not self.slice_views:
+            indices = range(*key.indices(len(self)))
+            return type(self)(node.data for node in self.walk(indices))
+        return super().__getitem__(key)
+
+    def __setitem__(
+        self: Self, key: int | slice, value: object | Node | Iterable | LinkedList
+    ) -> None:
+        if isinstance(key, int):
+            self.privatize((key % len(self) if len(self) > 0 else key) + 1)
+        else:
+            self.privatize(self.size)
+        super().__setitem__(key, value)
+
+    def __delitem__(self: Self, key: int | slice) -> None:
+        if isinstance(key, int):
+            self.pop(key)
+            return
+        self.privatize(self.size)
+        super().__delitem__(key)
+        self.private = self.size
+
+    def __str__(self: Self) -> str:
+        return f"CopyOnWriteLinkedList{self.to_tuple()}"
+
+    @classmethod
+    def share(cls: type, head: Node, tail: Node, size: int) -> Self:
+        linked_list = cls()
+        if size > 0:
+            linked_list.head, linked_list.tail, linked_list.size = head, tail, size
+        return linked_list
+
+    def privatize(self: Self, count: int) -> None:
+        count = min(count, self.size)
+        if self.private >= count:
+            return
+        prev = None if self.private == 0 else self.get(self.private - 1)
+        node = self.head if prev is None else prev.next
+        for _ in range(count - self.private):
+            copy = Node(node.data, node.next)
+            if prev is None:
+                self.head = copy
+            else:
+                prev.next = copy
+            if node is self.tail:
+                self.tail = copy
+            prev, node = copy, node.next
+        self.private = count
+
+    def snapshot(self: Self) -> PersistentLinkedList:
+        self.private = 0
+        return PersistentLinkedList.share(self.head, self.tail, self.size)
+
+    def copy(self: Self) -> Self:
+        self.private = 0
+        return self.share(self.head, self.tail, self.size)
+
+    def insert(self: Self, data: object, position: int) -> None:
+        position += self.size if position < 0 else 0
+        if position == len(self):
+            return self.append(data)
+        self.privatize(position)
+        super().insert(data, position)
+        self.private += 1
+
+    def append(self: Self, data: object) -> None:
+        self.privatize(self.size)
+        super().append(data)
+        self.private = self.size
+
+    def extend(self: Self, iterable: Iterable, size_hint: int = None) -> None:
+        super().extend(iterable, size_hint)
+        self.private = self.size
+
+    def join(self: Self, linked_list: LinkedList) -> Self:
+        size = self.size
+        self.privatize(size)
+        super().join(linked_list)
+        self.private = size
+        if isinstance(linked_list, CopyOnWriteLinkedList):
+            linked_list.private = 0
+        return self
+
+    def couple(self: Self, linked_list: LinkedList, position: int) -> Self:
+        self.privatize(self.size)
+        super().couple(self.build(linked_list.values(), len(linked_list)), position)
+        self.private = self.size
+        return self
+
+    def pop(self: Self, position: int = None) -> Node:
+        if len(self) <= 0:
+            return super().pop(position)
+        if position is None:
+            position = len(self) - 1
+        position += len(self) if position < 0 else 0
+        self.privatize(position)
+        node = super().pop(position)
+        self.private = max(position, self.private - 1)
+        return node
+
+    def insert_many(self: Self, pairs: Iterable[tuple[object, int]]) -> None:
+        self.privatize(self.size)
+        super().insert_many(pairs)
+        self.private = self.size
+
+    def pop_many(self: Self, positions: Iterable[int]) -> list[Node]:
+        self.privatize(self.size)
+        nodes = super().pop_many(positions)
+        self.private = self.size
+        return nodes
+
+    def remove_if(self: Self, predicate: Callable[[object], bool]) -> int:
+        self.privatize(self.size)
+        try:
+            return super().remove_if(predicate)
+        finally:
+            self.private = self.size
+
+    def decouple(self: Self, start: int = 0, stop: int = None) -> Self:
+        self.privatize(self.size)
+        super().decouple(start, stop)
+        self.private = self.size
+        return self
+
+    def reverse(self: Self, start: int = 0, stop: int = None) -> None:
+        self.privatize(self.size)
+        super().reverse(start, stop)
+
+    def sort(self: Self, key: Callable = None, reverse: bool = False) -> None:
+        self.privatize(self.size)
+        super().sort(key, reverse)
@@ -0,0 +1,221 @@
+from __future__ import annotations
+import random
+import sys
+from typing import Callable, Iterable, Self
+
+from linked_list import LinkedList, Node
+
+FANOUT = 4
+MAX_LEVELS = 32
+
+
+class SkipNode:
+    __slots__ = ("node", "down", "next", "span")
+
+    def __init__(self: Self, node: Node, down: SkipNode = None, span: int = 0) -> None:
+        self.node: Node = node
+        self.down: SkipNode = down
+        self.next: SkipNode = None
+        self.span: int = span
+
+    def __str__(self: Self):
+        return str(f"SkipNode({None if self.node is None else self.node.data})")
+
+
+class SkipLinkedList(LinkedList):
+    def __init__(self: Self, elements: Iterable = None) -> None:
+        super().__init__()
+        self.levels: list[SkipNode] = []
+        if elements:
+            LinkedList.join(self, LinkedList(elements))
+        self.rebuild()
+
+    def __getitem__(self: Self, key: int | slice) -> Self | object:
+        return super().__getitem__(key, SkipLinkedList)
+
+    def __setitem__(
+        self: Self, key: int | slice, value: object | Node | Iterable | LinkedList
+    ) -> None:
+        super().__setitem__(key, value, SkipLinkedList)
+        if isinstance(key, slice):
+            self.rebuild()
+
+    def __delitem__(self: Self, key: int | slice) -> None:
+        if isinstance(key, int):
+            self.pop(key)
+            return
+        super().__delitem__(key)
+        self.rebuild()
+
+    def __str__(self: Self) -> str:
+        return f"SkipLinkedList{self.to_tuple()}"
+
+    def __add__(self: Self, item: Iterable | LinkedList) -> Self:
+        return super().__add__(item, SkipLinkedList)
+
+    def __mul__(self: Self, value: int) -> Self:
+        return super().__mul__(value, SkipLinkedList)
+
+    def __reduce__(self: Self) -> tuple:
+        return SkipLinkedList, (self.to_list(),)
+
+    def rebuild(self: Self) -> None:
+        items, node = [], self.head
+        for position in range(self.size):
+            if (position + 1) % FANOUT == 0:
+                items.append((position, node, None))
+            node = node.next
+        self.levels = []
+        while True:
+            header = SkipNode(None, self.levels[-1] if self.levels else None)
+            prev, prev_position = header, -1
+            towers = []
+            for position, node, down in items:
+                skip_node = SkipNode(node, down)
+                prev.next, prev.span = skip_node, position - prev_position
+                prev, prev_position = skip_node, position
+                towers.append((position, node, skip_node))
+            prev.span = self.size - prev_position
+            self.levels.append(header)
+            items = towers[FANOUT - 1 :: FANOUT]
+            if not items or len(self.levels) >= MAX_LEVELS:
+                break
+
+    def random_height(self: Self) -> int:
+        height = 0
+        while random.random() < 1 / FANOUT and height < MAX_LEVELS:
+            height += 1
+        return height
+
+    def path(self: Self, position: int) -> tuple[list[SkipNode], list[int]]:
+        update, positions = [None] * len(self.levels), [-1] * len(self.levels)
+        skip_node, current = self.levels[-1], -1
+        for level in range(len(self.levels) - 1, -1, -1):
+            while skip_node.next is not None and current + skip_node.span < position:
+                current += skip_node.span
+                skip_node = skip_node.next
+            update[level], positions[level] = skip_node, current
+            skip_node = skip_node.down
+        return update, positions
+
+    def locate(self: Self, skip_node: SkipNode, current: int, position: int) -> Node:
+        if current < 0:
+            node, current = self.head, 0
+        else:
+            node = skip_node.node
+        for _ in range(position - current):
+            node = node.next
+        return node
+
+    def get(self: Self, index: int) -> Node:
+        index += len(self) if index < 0 else 0
+        if 0 <= index < len(self):
+            update, positions = self.path(index + 1)
+            return self.locate(update[0], positions[0], index)
+        raise IndexError("linked list index out of range")
+
+    def insert(self: Self, data: object, position: int) -> None:
+        position += self.size if position < 0 else 0
+        if position < 0 or position > len(self):
+            raise IndexError("linked list index out of range")
+        height = self.random_height()
+        while len(self.levels) < min(height, MAX_LEVELS):
+            self.levels.append(SkipNode(None, self.levels[-1], self.size + 1))
+        update, positions = self.path(position)
+        node = Node(data)
+        if position == 0:
+            node.next = self.head
+            self.head = node
+        else:
+            prev = self.locate(update[0], positions[0], position - 1)
+            node.next = prev.next
+            prev.next = node
+        if position == len(self):
+            self.tail = node
+        self.size += 1
+        down = None
+        for level, skip_node in enumerate(update):
+            if level < height:
+                distance = position - positions[level]
+                down = SkipNode(node, down, skip_node.span - distance + 1)
+                down.next = skip_node.next
+                skip_node.next, skip_node.span = down, distance
+            else:
+                skip_node.span += 1
+
+    def append(self: Self, data: object) -> None:
+        self.insert(data, len(self))
+
+    def join(self: Self, linked_list: LinkedList) -> Self:
+        super().join(linked_list)
+        self.rebuild()
+        return self
+
+    def couple(self: Self, linked_list: LinkedList, position: int) -> Self:
+        super().couple(linked_list, position)
+        self.rebuild()
+        return self
+
+    def pop(self: Self, position: int = None) -> Node:
+        if position is None:
+            if len(self) <= 0:
+                raise TypeError("linked list is empty")
+            position = len(self) - 1
+        position += len(self) if position < 0 else 0
+        if position < 0 or position >= len(self):
+            raise IndexError("linked list index out of range")
+        update, positions = self.path(position)
+        if position == 0:
+            prev, node = None, self.head
+        else:
+            prev = self.locate(update[0], positions[0], position - 1)
+            node = prev.next
+        self.unlink(prev, node)
+        for skip_node in update:
+            if skip_node.next is not None and skip_node.next.node is node:
+                skip_node.span += skip_node.next.span - 1
+                skip_node.next = skip_node.next.next
+            else:
+                skip_node.span -= 1
+        while len(self.levels) > 1 and self.levels[-1].next is None:
+            self.levels.pop()
+        return node
+
+    def decouple(self: Self, start: int = 0, stop: int = None) -> Self:
+        super().decouple(start, stop)
+        self.rebuild()
+        return self
+
+    def insert_many(self: Self, pairs: Iterable[tuple[object, int]]) -> None:
+        super().insert_many(pairs)
+        self.rebuild()
+
+    def pop_many(self: Self, positions: Iterable[int]) -> list[Node]:
+        nodes = super().pop_many(positions)
+        self.rebuild()
+        return nodes
+
+    def remove_if(self: Self, predicate: Callable[[object], bool]) -> int:
+        try:
+            return super().remove_if(predicate)
+        finally:
+            self.rebuild()
+
+    def copy(self: Self) -> SkipLinkedList:
+        return SkipLinkedList(self.values())
+
+    def sizeof(self: Self, deep: bool = False) -> int:
+        size = super().sizeof(deep) + sys.getsizeof(self.levels)
+        for skip_node in self.levels:
+            while skip_node is not None:
+                size += sys.getsizeof(skip_node)
+                skip_node = skip_node.next
+        return size
+
+    def reverse(self: Self, start: int = 0, stop: int = None) -> None:
+        super().reverse(start, stop)
+        self.rebuild()
+
+    def sort(self: Self, key: Callable = None, reverse: bool = False) -> None:
+        super().sort(key, reverse)
+        self.rebuild()
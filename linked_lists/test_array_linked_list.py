@@ -0,0 +1,59 @@
+import pytest
+
+from array_linked_list import ArrayDoublyLinkedList, ArrayLinkedList
+from mapped_linked_list import MappedDoublyLinkedList, MappedLinkedList
+from numpy_linked_list import NumpyDoublyLinkedList, NumpyLinkedList
+
+ARRAY = [ArrayLinkedList, ArrayDoublyLinkedList]
+STORAGES = [*ARRAY, NumpyLinkedList, NumpyDoublyLinkedList]
+
+
+@pytest.mark.parametrize("type", STORAGES)
+def test_membership_compares_payloads(type: type) -> None:
+    linked_list = type([1, 2, 2, 3])
+    assert 2 in linked_list
+    assert 4 not in linked_list
+    assert linked_list.count(2) == 2
+    assert linked_list.count(4) == 0
+    assert list(linked_list.values()) == [1, 2, 2, 3]
+
+
+@pytest.mark.parametrize("type", ARRAY)
+def test_values_follow_list_order(type: type) -> None:
+    linked_list = type(range(5))
+    linked_list.insert(9, 0)
+    del linked_list[2]
+    assert list(linked_list.values()) == linked_list.to_list() == [9, 0, 2, 3, 4]
+
+
+def test_doubly_values_run_in_reverse() -> None:
+    linked_list = ArrayDoublyLinkedList(range(5))
+    linked_list.reverse(1, 4)
+    assert list(linked_list.values(reverse=True)) == [4, 1, 2, 3, 0]
+
+
+@pytest.mark.parametrize("type", ARRAY)
+def test_sort_is_stable_and_keeps_links(type: type) -> None:
+    pairs = [(3, "a"), (1, "b"), (3, "c"), (2, "d"), (1, "e")]
+    linked_list = type(pairs)
+    linked_list.sort(key=lambda pair: pair[0])
+    assert linked_list.to_list() == sorted(pairs, key=lambda pair: pair[0])
+    linked_list.sort(key=lambda pair: pair[0], reverse=True)
+    assert linked_list.to_list() == sorted(
+        pairs, key=lambda pair: pair[0], reverse=True
+    )
+    linked_list.append((0, "f"))
+    assert linked_list.to_list()[-1] == (0, "f")
+
+
+@pytest.mark.parametrize(
+    "type",
+    [NumpyLinkedList, NumpyDoublyLinkedList, MappedLinkedList, MappedDoublyLinkedList],
+)
+def test_sort_rewrites_storage_payloads(type: type) -> None:
+    linked_list = type([5, 3, 4, 1, 2])
+    linked_list.pop(1)
+    linked_list.insert(0, 2)
+    linked_list.sort()
+    assert linked_list.to_list() == [0, 1, 2, 4, 5]
+    assert 4 in linked_list
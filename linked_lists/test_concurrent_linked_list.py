@@ -0,0 +1,196 @@
+import random
+import sys
+import threading
+import time
+from typing import Callable, Iterator
+
+import pytest
+
+from concurrent_linked_list import ConcurrentDoublyLinkedList, ConcurrentLinkedList
+from linked_list import DNode, Node
+
+THREADS = 4
+OPERATIONS = 2_000
+TIMEOUT = 60
+
+
+@pytest.fixture(autouse=True)
+def interleave() -> Iterator[None]:
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def run_threads(targets: list[Callable[[], None]]) -> None:
+    errors = []
+
+    def guarded(target: Callable[[], None]) -> None:
+        try:
+            target()
+        except BaseException as error:
+            errors.append(error)
+
+    threads = [
+        threading.Thread(target=guarded, args=(target,), daemon=True)
+        for target in targets
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(TIMEOUT)
+        if thread.is_alive():
+            raise AssertionError("worker thread did not finish")
+    if errors:
+        raise errors[0]
+
+
+def check_structure(linked_list: ConcurrentLinkedList) -> None:
+    nodes, node = [], linked_list.head
+    while node is not None:
+        nodes.append(node)
+        node = node.next
+    assert len(nodes) == len(linked_list)
+    assert not nodes or nodes[-1] is linked_list.tail
+    if isinstance(linked_list, ConcurrentDoublyLinkedList):
+        for prev, node in zip([None] + nodes, nodes):
+            assert node.prev is prev
+
+
+@pytest.mark.parametrize("type", [ConcurrentLinkedList, ConcurrentDoublyLinkedList])
+def test_producers_and_consumers_lose_nothing(type: type) -> None:
+    linked_list = type()
+    produced = [[] for _ in range(THREADS)]
+    consumed = [[] for _ in range(THREADS)]
+    done = threading.Event()
+
+    def producer(thread: int) -> Callable[[], None]:
+        def produce() -> None:
+            rng = random.Random(thread)
+            for i in range(OPERATIONS):
+                value = (thread, i)
+                choice = rng.random()
+                if choice < 0.4:
+                    linked_list.append(value)
+                elif choice < 0.7:
+                    linked_list.insert(value, 0)
+                elif choice < 0.9:
+                    linked_list.extend([value])
+                else:
+                    with linked_list.exclusive():
+                        linked_list.insert(value, len(linked_list) // 2)
+                produced[thread].append(value)
+
+        return produce
+
+    def consumer(thread: int) -> Callable[[], None]:
+        def consume() -> None:
+            rng = random.Random(-thread)
+            while not done.is_set() or len(linked_list) > 0:
+                try:
+                    if rng.random() < 0.5 or type is ConcurrentLinkedList:
+                        node = linked_list.pop(0)
+                    else:
+                        node = linked_list.pop()
+                except (IndexError, TypeError):
+                    continue
+                consumed[thread].append(node.data)
+
+        return consume
+
+    def observe() -> None:
+        rng = random.Random(THREADS)
+        while not done.is_set():
+            seen = linked_list.to_list()
+            assert len(seen) <= THREADS * OPERATIONS
+            if rng.random() < 0.01:
+                linked_list.reverse()
+
+    def produce_all() -> None:
+        try:
+            run_threads([producer(thread) for thread in range(THREADS)])
+        finally:
+            done.set()
+
+    run_threads(
+        [produce_all, observe] + [consumer(thread) for thread in range(THREADS)]
+    )
+    expected = sorted(value for values in produced for value in values)
+    actual = sorted(value for values in consumed for value in values)
+    assert actual == expected
+    assert len(linked_list) == 0
+    assert linked_list.head is None and linked_list.tail is None
+
+
+@pytest.mark.parametrize("type", [ConcurrentLinkedList, ConcurrentDoublyLinkedList])
+def test_opposite_ends_keep_links_consistent(type: type) -> None:
+    linked_list = type(range(3))
+
+    def push() -> None:
+        for i in range(OPERATIONS):
+            linked_list.append(i)
+
+    def pull() -> None:
+        for _ in range(OPERATIONS):
+            while True:
+                try:
+                    linked_list.pop(0)
+                    break
+                except IndexError:
+                    pass
+
+    run_threads([push, pull])
+    assert linked_list.to_list() == list(range(OPERATIONS - 3, OPERATIONS))
+    check_structure(linked_list)
+
+
+def yielding(slot: object) -> property:
+    def get(node: Node) -> Node:
+        return slot.__get__(node)
+
+    def set(node: Node, next: Node) -> None:
+        time.sleep(0)
+        slot.__set__(node, next)
+
+    return property(get, set)
+
+
+class YieldingNode(Node):
+    __slots__ = ()
+    next = yielding(Node.next)
+
+
+class YieldingDNode(DNode):
+    __slots__ = ()
+    next = yielding(Node.next)
+
+
+class YieldingLinkedList(ConcurrentLinkedList):
+    node_type: type = YieldingNode
+
+
+class YieldingDoublyLinkedList(ConcurrentDoublyLinkedList):
+    node_type: type = YieldingDNode
+
+
+@pytest.mark.parametrize("type", [YieldingLinkedList, YieldingDoublyLinkedList])
+def test_short_list_ends_do_not_race(type: type) -> None:
+    linked_list = type()
+    popped = []
+
+    def push() -> None:
+        for i in range(OPERATIONS):
+            linked_list.append(i)
+            while len(linked_list) > 2:
+                time.sleep(0)
+
+    def pull() -> None:
+        while len(popped) < OPERATIONS:
+            try:
+                popped.append(linked_list.pop(0).data)
+            except IndexError:
+                time.sleep(0)
+
+    run_threads([push, pull])
+    assert popped == list(range(OPERATIONS))
+    check_structure(linked_list)
@@ -0,0 +1,64 @@
+import pickle
+
+import pytest
+
+from hashed_linked_list import (
+    FingerprintedCircularDoublyLinkedList,
+    FingerprintedCircularLinkedList,
+    FingerprintedDoublyLinkedList,
+    FingerprintedLinkedList,
+    FrozenCircularDoublyLinkedList,
+    FrozenCircularLinkedList,
+    FrozenDoublyLinkedList,
+    FrozenLinkedList,
+)
+
+FROZEN = [
+    FrozenLinkedList,
+    FrozenCircularLinkedList,
+    FrozenDoublyLinkedList,
+    FrozenCircularDoublyLinkedList,
+]
+
+
+@pytest.mark.parametrize("type", FROZEN)
+def test_frozen_nodes_reject_writes(type: type) -> None:
+    linked_list = type([1, 2])
+    table = {linked_list: 1}
+    for node in (linked_list[0], linked_list.get(-1), *linked_list):
+        with pytest.raises(TypeError, match="immutable"):
+            node.data = 9
+        with pytest.raises(TypeError, match="immutable"):
+            node.next = None
+    assert type([1, 2]) in table
+    assert linked_list.to_list() == [1, 2]
+
+
+@pytest.mark.parametrize("type", FROZEN)
+def test_frozen_links_and_name(type: type) -> None:
+    linked_list = type(range(4))
+    assert str(linked_list) == f"{type.__name__}(0, 1, 2, 3)"
+    assert linked_list[1:3] == [1, 2]
+    assert pickle.loads(pickle.dumps(linked_list)) == linked_list
+    if hasattr(linked_list, "__reversed__"):
+        assert [node.data for node in reversed(linked_list)] == [3, 2, 1, 0]
+    circular = "Circular" in type.__name__
+    assert (linked_list.tail.next is linked_list.head) is circular
+
+
+@pytest.mark.parametrize(
+    "type",
+    [
+        FingerprintedLinkedList,
+        FingerprintedCircularLinkedList,
+        FingerprintedDoublyLinkedList,
+        FingerprintedCircularDoublyLinkedList,
+    ],
+)
+def test_fingerprint_survives_add_and_mul(type: type) -> None:
+    added = type([1]) + [2]
+    multiplied = type([1, 2]) * 2
+    assert isinstance(added, type) and isinstance(multiplied, type)
+    assert added == [1, 2] and multiplied == [1, 2, 1, 2]
+    assert added.fingerprint == type([1, 2]).fingerprint
+    assert multiplied.fingerprint == multiplied.recompute_fingerprint()
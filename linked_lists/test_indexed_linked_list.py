@@ -0,0 +1,41 @@
+import pytest
+
+from indexed_linked_list import (
+    IndexedCircularDoublyLinkedList,
+    IndexedCircularLinkedList,
+    IndexedDoublyLinkedList,
+    IndexedLinkedList,
+)
+
+INDEXED = [
+    IndexedLinkedList,
+    IndexedCircularLinkedList,
+    IndexedDoublyLinkedList,
+    IndexedCircularDoublyLinkedList,
+]
+
+
+@pytest.mark.parametrize("type", INDEXED)
+def test_lookups_follow_list_order(type: type) -> None:
+    linked_list = type([1, [2], 1, 3])
+    linked_list.insert(1, 0)
+    linked_list.append(1)
+    linked_list.pop(2)
+    assert linked_list.to_list() == [1, 1, 1, 3, 1]
+    assert linked_list.find(1) is linked_list.head
+    assert linked_list.find_all(1) == [linked_list.get(i) for i in (0, 1, 2, 4)]
+    assert linked_list.index(1, return_all=True) == [0, 1, 2, 4]
+    assert linked_list.index((3, 1), start=2, nindices=2) == [2, 3]
+    assert linked_list.ranks is not None
+
+
+@pytest.mark.parametrize("type", INDEXED)
+def test_middle_edits_are_reranked(type: type) -> None:
+    linked_list = type(range(6))
+    linked_list.insert(0, 3)
+    linked_list.reverse(0, 4)
+    assert linked_list.ranks is None
+    assert linked_list.to_list() == [0, 2, 1, 0, 3, 4, 5]
+    assert linked_list.index(0, return_all=True) == [0, 3]
+    assert linked_list.find_all(0) == [linked_list.head, linked_list.get(3)]
+    assert linked_list.ranks is not None
@@ -0,0 +1,66 @@
+import pytest
+
+from instrumented_linked_list import (
+    InstrumentedCircularDoublyLinkedList,
+    InstrumentedCircularLinkedList,
+    InstrumentedDoublyLinkedList,
+    InstrumentedLinkedList,
+)
+
+INSTRUMENTED = [
+    InstrumentedLinkedList,
+    InstrumentedCircularLinkedList,
+    InstrumentedDoublyLinkedList,
+    InstrumentedCircularDoublyLinkedList,
+]
+
+
+def hops(linked_list, operation) -> int:
+    before = linked_list.hops
+    operation()
+    return linked_list.hops - before
+
+
+@pytest.mark.parametrize("type", INSTRUMENTED)
+def test_searches_count_nodes_visited(type: type) -> None:
+    linked_list = type(range(100))
+    assert hops(linked_list, lambda: 5 in linked_list) == 6
+    assert hops(linked_list, lambda: -1 in linked_list) == 100
+    assert hops(linked_list, lambda: linked_list.index(3)) == 5
+    assert hops(linked_list, lambda: linked_list.count(1)) == 100
+    assert hops(linked_list, linked_list.to_tuple) == 100
+    assert linked_list.calls["__contains__"][:2] == [2, 106]
+    assert linked_list.calls["index"][:2] == [1, 5]
+
+
+@pytest.mark.parametrize("type", INSTRUMENTED)
+def test_comparisons_are_traced(type: type) -> None:
+    linked_list = type(range(100))
+    other = type(range(100))
+    assert hops(linked_list, lambda: linked_list == other) == 100
+    assert hops(linked_list, lambda: linked_list == [*range(10), *[-1] * 90]) == 11
+    assert hops(linked_list, lambda: linked_list < other) == 100
+    assert hops(linked_list, lambda: linked_list == linked_list.view()) == 199
+    assert linked_list.calls["__eq__"][:2] == [3, 310]
+    assert linked_list.calls["__lt__"][:2] == [1, 100]
+
+
+@pytest.mark.parametrize("type", INSTRUMENTED)
+def test_walks_count_steps(type: type) -> None:
+    linked_list = type(range(100))
+    assert hops(linked_list, lambda: linked_list.get(7)) == 7
+    assert hops(linked_list, lambda: linked_list[2:9:3]) == 8
+    assert hops(linked_list, lambda: linked_list.reverse(0, 10)) == 10
+    assert hops(linked_list, lambda: linked_list.pop_many([3, 10])) == 11
+    assert hops(linked_list, lambda: linked_list.remove_if(bool)) == 98
+
+
+def test_singly_reverse_walk_counts_once() -> None:
+    linked_list = InstrumentedLinkedList(range(100))
+    assert hops(linked_list, lambda: linked_list[9:2:-3]) == 9
+
+
+def test_doubly_reverse_walk_follows_prev_links() -> None:
+    linked_list = InstrumentedDoublyLinkedList(range(100))
+    assert hops(linked_list, lambda: linked_list[90:83:-3]) == 15
+    assert hops(linked_list, lambda: list(reversed(linked_list))) == 100
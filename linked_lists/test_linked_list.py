@@ -0,0 +1,47 @@
+import pytest
+
+from linked_list import CircularDoublyLinkedList, DoublyLinkedList, LinkedList
+
+
+def check_ring(linked_list: CircularDoublyLinkedList) -> None:
+    nodes = list(linked_list)
+    for prev, node in zip(nodes[-1:] + nodes[:-1], nodes):
+        assert node.prev is prev
+        assert prev.next is node
+
+
+@pytest.mark.parametrize("start", [0, 1, 3])
+def test_circular_reverse_to_end_keeps_prev_links(start: int) -> None:
+    linked_list = CircularDoublyLinkedList(range(6))
+    linked_list.reverse(start)
+    expected = [*range(start), *range(5, start - 1, -1)]
+    assert linked_list.to_list() == expected
+    assert [node.data for node in reversed(linked_list)] == expected[::-1]
+    check_ring(linked_list)
+
+
+@pytest.mark.parametrize("start, stop", [(0, 6), (2, 6), (1, 4)])
+def test_reverse_keeps_prev_links(start: int, stop: int) -> None:
+    linked_list = DoublyLinkedList(range(6))
+    linked_list.reverse(start, stop)
+    expected = list(range(6))
+    expected[start:stop] = expected[start:stop][::-1]
+    assert linked_list.to_list() == expected
+    assert [node.data for node in reversed(linked_list)] == expected[::-1]
+    assert linked_list.head.prev is None and linked_list.tail.next is None
+
+
+def test_equality_unwraps_view_nodes() -> None:
+    linked_list = LinkedList(range(5))
+    assert linked_list == linked_list.view()
+    assert linked_list.view() == linked_list
+    assert linked_list[1:3] == linked_list.view(1, 3)
+    assert linked_list > linked_list.view(0, 3)
+
+
+@pytest.mark.parametrize("other", ["ab", b"ab", {"a": 0, "b": 0}, iter("ab")])
+def test_equality_rejects_non_sequences(other: object) -> None:
+    linked_list = LinkedList("ab")
+    assert linked_list != other
+    with pytest.raises(TypeError):
+        linked_list < other
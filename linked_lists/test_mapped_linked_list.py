@@ -0,0 +1,95 @@
+import os
+
+import pytest
+
+from mapped_linked_list import MappedDoublyLinkedList, MappedLinkedList, MappedStorage
+
+
+@pytest.mark.parametrize("type", [MappedLinkedList, MappedDoublyLinkedList])
+def test_churn_reuses_heap_extents(type: type) -> None:
+    with type(range(99)) as linked_list:
+        heap = linked_list.path + ".heap"
+
+        def churn(rounds: int) -> None:
+            for i in range(rounds):
+                linked_list.append(("value", i))
+                linked_list.pop(0)
+                linked_list[len(linked_list) // 2] = ("other", i)
+
+        churn(200)
+        linked_list.flush()
+        heap_end, heap_size = linked_list.heap_end, os.path.getsize(heap)
+        churn(1_000)
+        linked_list.flush()
+        assert linked_list.heap_end == heap_end
+        assert os.path.getsize(heap) < 2 * heap_size
+        assert linked_list.to_list()[-1] == ("value", 999)
+
+
+def test_reopen_reuses_freed_extents(tmp_path: os.PathLike) -> None:
+    path = str(tmp_path / "list")
+    with MappedLinkedList(range(100), path=path) as linked_list:
+        del linked_list[10:90]
+        heap_end = linked_list.heap_end
+    with MappedLinkedList(path=path) as linked_list:
+        assert linked_list.heap_end == heap_end
+        linked_list.extend(range(80))
+        assert linked_list.heap_end == heap_end
+        assert linked_list.to_list() == [*range(10), *range(90, 100), *range(80)]
+
+
+class CountingView:
+    def __init__(self, view: memoryview) -> None:
+        self.view = view
+        self.reads = 0
+
+    def __getitem__(self, index: int) -> int:
+        self.reads += 1
+        return self.view[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        self.view[index] = value
+
+
+def test_reopen_does_not_scan_records(
+    tmp_path: os.PathLike, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = str(tmp_path / "list")
+    with MappedLinkedList(range(1_000), path=path) as linked_list:
+        del linked_list[100:900]
+    remap, views = MappedStorage.remap, []
+
+    def counting(linked_list: MappedStorage) -> None:
+        remap(linked_list)
+        linked_list.records = CountingView(linked_list.records)
+        views.append(linked_list.records)
+
+    monkeypatch.setattr(MappedStorage, "remap", counting)
+    with MappedLinkedList(path=path) as linked_list:
+        assert sum(view.reads for view in views) == 0
+        linked_list.extend(range(50))
+        assert linked_list.to_list() == [*range(100), *range(900, 1_000), *range(50)]
+
+
+def test_compact_keeps_values_and_shrinks_heap(tmp_path: os.PathLike) -> None:
+    path = str(tmp_path / "list")
+    with MappedDoublyLinkedList(
+        [str(i) * (i % 7) for i in range(200)], path=path
+    ) as linked_list:
+        del linked_list[::2]
+        expected = linked_list.to_list()
+        heap_end = linked_list.heap_end
+        linked_list.compact()
+        assert linked_list.heap_end < heap_end
+        assert os.path.getsize(path + ".heap") == linked_list.heap_end
+    with MappedDoublyLinkedList(path=path, cache_size=1) as linked_list:
+        assert linked_list.to_list() == expected
+        assert [node.data for node in reversed(linked_list)] == expected[::-1]
+
+
+def test_missing_heap_is_reported(tmp_path: os.PathLike) -> None:
+    path = str(tmp_path / "list")
+    MappedLinkedList([1, 2, 3], path=path).close()
+    os.remove(path + ".heap")
+    with pytest.raises(FileNotFoundError, match="no payload heap"):
+        MappedLinkedList(path=path)
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from linked_list import LinkedList
+from numpy_linked_list import NumpyDoublyLinkedList, NumpyLinkedList
+
+
+@pytest.mark.parametrize("type", [NumpyLinkedList, NumpyDoublyLinkedList])
+@pytest.mark.parametrize(
+    "elements, expected, dtype",
+    [
+        ([1, 2, 3], [1, 2, 3], np.int64),
+        ([1.5, 2], [1.5, 2.0], np.float64),
+        ([True, False], [True, False], np.bool_),
+        (range(3), [0, 1, 2], np.int64),
+        (LinkedList([4, 5]), [4, 5], np.int64),
+    ],
+)
+def test_dtype_is_inferred_from_elements(
+    type: type, elements: object, expected: list, dtype: type
+) -> None:
+    linked_list = type(elements)
+    assert linked_list.dtype == dtype
+    values = linked_list.to_list()
+    assert values == expected
+    assert [value.__class__ for value in values] == [
+        value.__class__ for value in expected
+    ]
+
+
+@pytest.mark.parametrize("elements", [None, []])
+def test_empty_lists_default_to_float(elements: object) -> None:
+    assert NumpyLinkedList(elements).dtype == np.float64
+
+
+def test_explicit_dtype_wins() -> None:
+    linked_list = NumpyLinkedList([1, 2, 3], np.float32)
+    assert linked_list.dtype == np.float32
+    assert linked_list.to_list() == [1.0, 2.0, 3.0]
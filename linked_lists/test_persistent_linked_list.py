@@ -0,0 +1,44 @@
+from persistent_linked_list import CopyOnWriteLinkedList, PersistentLinkedList
+
+
+def test_join_does_not_write_through_to_snapshot() -> None:
+    source = CopyOnWriteLinkedList([1, 2, 3])
+    snapshot = source.snapshot()
+    target = CopyOnWriteLinkedList([0])
+    target.join(source)
+    target[1] = 99
+    target.append(4)
+    assert snapshot == [1, 2, 3]
+    assert source == [1, 2, 3]
+    assert target == [0, 99, 2, 3, 4]
+
+
+def test_join_does_not_write_through_from_source() -> None:
+    source = CopyOnWriteLinkedList([1, 2, 3])
+    target = CopyOnWriteLinkedList([0])
+    target.join(source)
+    source[0] = 99
+    assert target == [0, 1, 2, 3]
+    assert source == [99, 2, 3]
+
+
+def test_slice_assignment_does_not_write_through_to_snapshot() -> None:
+    source = CopyOnWriteLinkedList([1, 2, 3])
+    snapshot = source.snapshot()
+    target = CopyOnWriteLinkedList([0, 5])
+    target[1:1] = source
+    target[1] = 99
+    assert snapshot == [1, 2, 3]
+    assert snapshot.tail.next is None
+    assert snapshot.appended(4) == [1, 2, 3, 4]
+    assert target == [0, 99, 2, 3, 5]
+
+
+def test_couple_leaves_persistent_source_intact() -> None:
+    source = PersistentLinkedList([1, 2, 3])
+    target = CopyOnWriteLinkedList([0, 5])
+    target.couple(source, 1)
+    target[3] = 99
+    assert source == [1, 2, 3]
+    assert source.tail.next is None
+    assert target == [0, 1, 2, 99, 5]
@@ -0,0 +1,475 @@
+from __future__ import annotations
+import sys
+from itertools import islice
+from typing import Iterable, Iterator, Self
+
+from linked_list import DNode, LinkedList, Node
+
+BLOCK_CAPACITY = 64
+
+
+class Block:
+    __slots__ = ("data", "next")
+
+    def __init__(self: Self, data: list, next: Block = None) -> None:
+        self.data: list = data
+        self.next: Block = next
+
+    def __str__(self: Self):
+        return str(f"Block({self.data})")
+
+
+class DBlock(Block):
+    __slots__ = ("prev",)
+
+    def __init__(self: Self, data: list, prev: DBlock = None, next: DBlock = None):
+        super().__init__(data, next)
+        self.prev: DBlock = prev
+
+    def __str__(self: Self):
+        return str(f"DBlock({self.data})")
+
+
+class UnrolledNode:
+    __slots__ = ("block", "offset")
+
+    def __init__(self: Self, block: Block, offset: int) -> None:
+        self.block: Block = block
+        self.offset: int = offset
+
+    @property
+    def data(self: Self) -> object:
+        return self.block.data[self.offset]
+
+    @data.setter
+    def data(self: Self, value: object) -> None:
+        self.block.data[self.offset] = value
+
+    def __str__(self: Self):
+        return str(f"UnrolledNode({self.data})")
+
+    def __lt__(self: Self, other: UnrolledNode | Node) -> bool:
+        return self.data < other.data
+
+    def __gt__(self: Self, other: UnrolledNode | Node) -> bool:
+        return self.data > other.data
+
+    def __eq__(self: Self, other: UnrolledNode | Node) -> bool:
+        return self.data == other.data
+
+    def __le__(self: Self, other: UnrolledNode | Node) -> bool:
+        return self.data <= other.data
+
+    def __ge__(self: Self, other: UnrolledNode | Node) -> bool:
+        return self.data >= other.data
+
+    def __ne__(self: Self, other: UnrolledNode | Node) -> bool:
+        return self.data != other.data
+
+
+class UnrolledLinkedList:
+    block_type = Block
+    node_type = Node
+
+    def __init__(
+        self: Self, elements: Iterable = None, capacity: int = BLOCK_CAPACITY
+    ) -> None:
+        if capacity < 2:
+            raise ValueError("block capacity must be at least 2")
+        self.size: int = 0
+        self.head: Block = None
+        self.tail: Block = None
+        self.capacity: int = capacity
+        if elements:
+            self.extend(elements)
+
+    def __len__(self: Self) -> int:
+        return self.size
+
+    def __contains__(self: Self, data: object) -> bool:
+        block = self.head
+        while block is not None:
+            if data in block.data:
+                return True
+            block = block.next
+        return False
+
+    def __getitem__(self: Self, key: int | slice) -> Self | UnrolledNode:
+        if isinstance(key, slice):
+            indices = range(*key.indices(len(self)))
+            if indices.step > 0:
+                values = islice(
+                    self.values(), indices.start, indices.stop, indices.step
+                )
+                return type(self)(values, self.capacity)
+            ascending = indices[::-1]
+            values = list(
+                islice(self.values(), ascending.start, ascending.stop, ascending.step)
+            )
+            return type(self)(reversed(values), self.capacity)
+
+        elif isinstance(key, int):
+            return self.get(key)
+
+        else:
+            raise TypeError("invalid argument type")
+
+    def __setitem__(self: Self, key: int | slice, value: object | Iterable) -> None:
+        if isinstance(key, slice):
+            if not isinstance(value, Iterable):
+                raise TypeError(
+                    "invalid argument type, slice assignment only accepts iterables"
+                )
+            indices = range(*key.indices(len(self)))
+            if indices.step == 1:
+                if len(indices) > 0:
+                    self.decouple(indices.start, indices.stop)
+                self.couple(value, indices.start)
+                return
+            values = self.to_list()
+            values[key] = list(self.source_values(value))
+            self.fill(values)
+
+        elif isinstance(key, int):
+            self.get(key).data = (
+                value.data if isinstance(value, (Node, UnrolledNode)) else value
+            )
+
+        else:
+            raise TypeError("invalid argument type")
+
+    def __delitem__(self: Self, key: int | slice) -> None:
+        if isinstance(key, slice):
+            indices = range(*key.indices(len(self)))
+            if len(indices) <= 0:
+                return
+            if indices.step == 1:
+                self.decouple(indices.start, indices.stop)
+                return
+            values = self.to_list()
+            del values[key]
+            self.fill(values)
+
+        elif isinstance(key, int):
+            self.pop(key)
+
+        else:
+            raise TypeError("invalid argument type")
+
+    def __iter__(self: Self) -> Iterator[UnrolledNode]:
+        block = self.head
+        while block is not None:
+            for offset in range(len(block.data)):
+                yield UnrolledNode(block, offset)
+            block = block.next
+
+    def __str__(self: Self) -> str:
+        return f"{type(self).__name__}{self.to_tuple()}"
+
+    def __add__(self: Self, item: Iterable) -> Self:
+        return self.copy().join(item)
+
+    def __mul__(self: Self, value: int) -> Self:
+        return type(self)(self.to_list() * value, self.capacity)
+
+    def __lt__(self: Self, other: Iterable) -> bool:
+        return self.to_list() < list(self.source_values(other))
+
+    def __gt__(self: Self, other: Iterable) -> bool:
+        return self.to_list() > list(self.source_values(other))
+
+    def __eq__(self: Self, other: Iterable) -> bool:
+        return self.to_list() == list(self.source_values(other))
+
+    def __le__(self: Self, other: Iterable) -> bool:
+        return not self.__gt__(other)
+
+    def __ge__(self: Self, other: Iterable) -> bool:
+        return not self.__lt__(other)
+
+    def __ne__(self: Self, other: Iterable) -> bool:
+        return not self.__eq__(other)
+
+    def source_values(self: Self, iterable: Iterable) -> Iterable:
+        if iterable is self:
+            return self.to_list()
+        if isinstance(iterable, (LinkedList, UnrolledLinkedList)):
+            return iterable.values()
+        return iterable
+
+    def link(self: Self, prev: Block | None, next: Block | None) -> None:
+        if prev is None:
+            self.head = next
+        else:
+            prev.next = next
+        if next is None:
+            self.tail = prev
+
+    def locate(self: Self, position: int) -> tuple[Block, Block, int]:
+        prev, block = None, self.head
+        while position >= len(block.data):
+            position -= len(block.data)
+            prev, block = block, block.next
+        return prev, block, position
+
+    def split_at(self: Self, position: int) -> tuple[Block, Block]:
+        if position == len(self):
+            return self.tail, None
+        prev, block, offset = self.locate(position)
+        if offset == 0:
+            return prev, block
+        right = self.block_type(block.data[offset:])
+        del block.data[offset:]
+        self.link(right, block.next)
+        self.link(block, right)
+        return block, right
+
+    def merge_next(self: Self, block: Block) -> None:
+        next = block.next
+        if next is not None and len(block.data) + len(next.data) <= self.capacity:
+            block.data.extend(next.data)
+            self.link(block, next.next)
+
+    def chain_blocks(self: Self, values: Iterable) -> tuple[Block, Block, int]:
+        first = last = None
+        count = 0
+        values = iter(values)
+        while chunk := list(islice(values, self.capacity)):
+            block = self.block_type(chunk)
+            if last is None:
+                first = block
+            else:
+                self.link(last, block)
+            last = block
+            count += len(chunk)
+        return first, last, count
+
+    def fill(self: Self, values: Iterable) -> None:
+        self.head, self.tail, self.size = self.chain_blocks(values)
+
+    def get(self: Self, index: int) -> UnrolledNode:
+        index += len(self) if index < 0 else 0
+        if 0 <= index < len(self):
+            _, block, offset = self.locate(index)
+            return UnrolledNode(block, offset)
+        raise IndexError("linked list index out of range")
+
+    def insert(self: Self, data: object, position: int = None) -> None:
+        if position is None:
+            return self.append(data)
+        position += self.size if position < 0 else 0
+        if position == len(self):
+            return self.append(data)
+        if position < 0 or position > len(self):
+            raise IndexError("linked list index out of range")
+        _, block, offset = self.locate(position)
+        block.data.insert(offset, data)
+        self.size += 1
+        if len(block.data) > self.capacity:
+            half = len(block.data) // 2
+            right = self.block_type(block.data[half:])
+            del block.data[half:]
+            self.link(right, block.next)
+            self.link(block, right)
+
+    def append(self: Self, data: object) -> None:
+        if self.tail is None or len(self.tail.data) >= self.capacity:
+            block = self.block_type([data])
+            self.link(self.tail, block)
+            self.link(block, None)
+        else:
+            self.tail.data.append(data)
+        self.size += 1
+
+    def extend(self: Self, iterable: Iterable) -> None:
+        self.join(iterable)
+
+    def join(self: Self, linked_list: Iterable) -> Self:
+        return self.couple(linked_list, len(self))
+
+    def couple(self: Self, linked_list: Iterable, position: int) -> Self:
+        position += len(self) if position < 0 else 0
+        if position < 0 or position > len(self):
+            raise IndexError("linked list index out of range")
+        first, last, count = self.chain_blocks(self.source_values(linked_list))
+        if count == 0:
+            return self
+        left, right = self.split_at(position)
+        self.link(left, first)
+        self.link(last, right)
+        self.size += count
+        self.merge_next(last)
+        if left is not None:
+            self.merge_next(left)
+        return self
+
+    def pop(self: Self, position: int = None) -> Node:
+        if position is None:
+            if len(self) <= 0:
+                raise TypeError("linked list is empty")
+            position = len(self) - 1
+        position += len(self) if position < 0 else 0
+        if position < 0 or position >= len(self):
+            raise IndexError("linked list index out of range")
+        prev, block, offset = self.locate(position)
+        data = block.data.pop(offset)
+        self.size -= 1
+        if not block.data:
+            self.link(prev, block.next)
+        elif len(block.data) < self.capacity // 2:
+            self.merge_next(block)
+            if prev is not None:
+                self.merge_next(prev)
+        return self.node_type(data)
+
+    def decouple(self: Self, start: int = 0, stop: int = None) -> Self:
+        if stop is None:
+            stop = len(self)
+        start += len(self) if start < 0 else 0
+        stop += len(self) if stop < 0 else 0
+        if start < 0 or stop < 0 or start >= len(self) or stop > len(self):
+            raise IndexError("index out of range")
+        if start > stop:
+            start, stop = stop, start
+        if stop - start == len(self):
+            self.head = None
+            self.tail = None
+            self.size = 0
+            return self
+        left, _ = self.split_at(start)
+        _, right = self.split_at(stop)
+        self.link(left, right)
+        self.size -= stop - start
+        if left is not None:
+            self.merge_next(left)
+        return self
+
+    def index(
+        self: Self,
+        data: object | tuple,
+        start=0,
+        stop=None,
+        step=1,
+        skip=0,
+        nindices=None,
+        return_all=False,
+    ):
+        return LinkedList.index(
+            self, data, start, stop, step, skip, nindices, return_all
+        )
+
+    def count(self: Self, data: object) -> int:
+        count = 0
+        block = self.head
+        while block is not None:
+            count += block.data.count(data)
+            block = block.next
+        return count
+
+    def copy(self: Self) -> Self:
+        return type(self)(self.values(), self.capacity)
+
+    def values(self: Self) -> Iterator:
+        block = self.head
+        while block is not None:
+            yield from block.data
+            block = block.next
+
+    def to_list(self: Self) -> list:
+        values = []
+        block = self.head
+        while block is not None:
+            values.extend(block.data)
+            block = block.next
+        return values
+
+    def to_tuple(self: Self) -> tuple:
+        return tuple(self.to_list())
+
+    def to_set(self: Self) -> set:
+        values = set()
+        block = self.head
+        while block is not None:
+            values.update(block.data)
+            block = block.next
+        return values
+
+    def sizeof(self: Self, deep: bool = False) -> int:
+        size = sys.getsizeof(self) + sys.getsizeof(vars(self))
+        seen = set()
+        block = self.head
+        while block is not None:
+            size += sys.getsizeof(block) + sys.getsizeof(block.data)
+            if deep:
+                for data in block.data:
+                    if id(data) not in seen:
+                        seen.add(id(data))
+                        size += sys.getsizeof(data)
+            block = block.next
+        return size
+
+    def node_sizeof(self: Self, deep: bool = False) -> float:
+        if len(self) <= 0:
+            return 0.0
+        overhead = sys.getsizeof(self) + sys.getsizeof(vars(self))
+        return (self.sizeof(deep) - overhead) / len(self)
+
+    def reverse(self: Self, start: int = 0, stop: int = None) -> None:
+        if stop is None:
+            stop = len(self)
+        start += len(self) if start < 0 else 0
+        stop += len(self) if stop < 0 else 0
+        if start < 0 or start > len(self) or stop < 0 or stop > len(self):
+            raise IndexError("linked list index out of range")
+        if stop - start < 2:
+            return
+        left, block = self.split_at(start)
+        _, right = self.split_at(stop)
+        blocks = []
+        while block is not right:
+            block.data.reverse()
+            blocks.append(block)
+            block = block.next
+        prev = left
+        for block in reversed(blocks):
+            self.link(prev, block)
+            prev = block
+        self.link(prev, right)
+        self.merge_next(blocks[0])
+        if left is not None:
+            self.merge_next(left)
+
+
+class UnrolledDoublyLinkedList(UnrolledLinkedList):
+    block_type = DBlock
+    node_type = DNode
+
+    def __reversed__(self: Self) -> Iterator[UnrolledNode]:
+        block = self.tail
+        while block is not None:
+            for offset in range(len(block.data) - 1, -1, -1):
+                yield UnrolledNode(block, offset)
+            block = block.prev
+
+    def link(self: Self, prev: DBlock | None, next: DBlock | None) -> None:
+        super().link(prev, next)
+        if next is not None:
+            next.prev = prev
+
+    def locate(self: Self, position: int) -> tuple[DBlock, DBlock, int]:
+        if position <= len(self) // 2:
+            return super().locate(position)
+        block, remaining = self.tail, len(self) - position
+        while remaining > len(block.data):
+            remaining -= len(block.data)
+            block = block.prev
+        return block.prev, block, len(block.data) - remaining
+
+    def values(self: Self, reverse: bool = False) -> Iterator:
+        if not reverse:
+            yield from super().values()
+            return
+        block = self.tail
+        while block is not None:
+            yield from reversed(block.data)
+            block = block.prev